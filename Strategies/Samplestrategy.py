@@ -5,23 +5,68 @@ from Strategies.utils.decorators import informative
 from core.backtesting.reporting.core.context import ContextSpec
 from core.backtesting.reporting.core.metrics import ExpectancyMetric, MaxDrawdownMetric
 from core.strategy.BaseStrategy import BaseStrategy
+from core.strategy.signals import (
+    DIRECTION_CODES,
+    init_entry_columns,
+    set_entry_signal,
+    set_levels,
+)
 from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
 
 
 class Samplestrategy(BaseStrategy):
 
+    PARAMS = {
+        "PIVOT_RANGE": 15,
+        "SL_LOOKBACK": 15,
+        "RR_TP1": 1.0,
+        "RR_TP2": 2.0,
+    }
+
+    FEATURE_PARAMS = ("PIVOT_RANGE",)
+    CACHE_FEATURES = True
+
+    MARKET_STRUCTURE = [
+        "pivots",
+        "price_action",
+        "follow_through",
+        "structural_vol",
+        "trend_regime",
+    ]
+
     def __init__(
             self,
             df,
             symbol,
             startup_candle_count,
             provider,
+            params=None,
     ):
         super().__init__(
             df=df,
             symbol=symbol,
             startup_candle_count=startup_candle_count,
             provider=provider,
+            params=params,
+        )
+
+    def _market_structure(self, df, *, key, lazy=False):
+        # live: one bar per candle on the incremental engine
+        if self.live:
+            stream = self.live_stream(
+                key,
+                lambda: MarketStructureEngine.stream(
+                    features=self.MARKET_STRUCTURE,
+                    pivot_range=self.params["PIVOT_RANGE"],
+                ),
+            )
+            return stream.apply(df)
+
+        return MarketStructureEngine.apply(
+            df,
+            features=self.MARKET_STRUCTURE,
+            pivot_range=self.params["PIVOT_RANGE"],
+            lazy=lazy,
         )
 
     @informative("M30")
@@ -32,16 +77,7 @@ class Samplestrategy(BaseStrategy):
         df["atr"] = ta.ATR(df, 14)
 
         # --- market structure HTF
-        df = MarketStructureEngine.apply(
-            df,
-            features=[
-                "pivots",
-                "price_action",
-                "follow_through",
-                "structural_vol",
-                "trend_regime",
-            ],
-        )
+        df = self._market_structure(df, key="M30")
 
         # --- bias flags (czytelne na GitHubie)
         df["bias_long"] = df["trend_regime"] == "trend_up"
@@ -57,19 +93,8 @@ class Samplestrategy(BaseStrategy):
         df["atr"] = ta.ATR(df, 14)
 
         # --- market structure
-        df = MarketStructureEngine.apply(
-            df,
-            features=[
-                "pivots",
-                "price_action",
-                "follow_through",
-                "structural_vol",
-                "trend_regime",
-            ],
-        )
-
-        df['low_15'] = df['low'].rolling(15).min()
-        df['high_15'] = df['high'].rolling(15).max()
+        # lazy unless the feature store keeps the whole frame anyway
+        df = self._market_structure(df, key="base", lazy=not self.caches_features)
 
         self.df = df
 
@@ -145,53 +170,22 @@ class Samplestrategy(BaseStrategy):
         # SIGNALS (PRIORITY)
         # =====================
 
-        # =====================
-        # SIGNALS (PRIORITY)
-        # =====================
-
-        df["signal_entry"] = None
+        init_entry_columns(df)
 
         # --- CONTINUATION FIRST ---
-        df.loc[trigger_continuation_long, "signal_entry"] = pd.Series(
-            [{"direction": "long", "tag": "bos_continuation_long"}]
-            * trigger_continuation_long.sum(),
-            index=df.index[trigger_continuation_long],
-        )
-
-        df.loc[trigger_continuation_short, "signal_entry"] = pd.Series(
-            [{"direction": "short", "tag": "bos_continuation_short"}]
-            * trigger_continuation_short.sum(),
-            index=df.index[trigger_continuation_short],
-        )
+        set_entry_signal(df, trigger_continuation_long,
+                         direction="long", tag="bos_continuation_long")
+        set_entry_signal(df, trigger_continuation_short,
+                         direction="short", tag="bos_continuation_short")
 
-        free = df["signal_entry"].isna()
+        free = df["entry_dir"] == 0
 
-        df.loc[trigger_mr_long & free, "signal_entry"] = pd.Series(
-            [{"direction": "long", "tag": "mean_reversion_long"}]
-            * (trigger_mr_long & free).sum(),
-            index=df.index[trigger_mr_long & free],
-        )
-
-        df.loc[trigger_mr_short & free, "signal_entry"] = pd.Series(
-            [{"direction": "short", "tag": "mean_reversion_short"}]
-            * (trigger_mr_short & free).sum(),
-            index=df.index[trigger_mr_short & free],
-        )
-
-
-        df["levels"] = None
-
-
-        df.loc[df['signal_entry'].notna(), "levels"] = df.loc[df['signal_entry'].notna()].apply(
-            lambda row: self.calculate_levels(
-                row["signal_entry"],
-                row["close"],
-                row["low_15"],
-                row['high_15']
-            ),
-            axis=1
-        )
+        set_entry_signal(df, trigger_mr_long & free,
+                         direction="long", tag="mean_reversion_long")
+        set_entry_signal(df, trigger_mr_short & free,
+                         direction="short", tag="mean_reversion_short")
 
+        self.calculate_levels(df)
 
         self.df = df
 
@@ -224,25 +218,25 @@ class Samplestrategy(BaseStrategy):
         self.df["signal_exit"] = None
         self.df["custom_stop_loss"] = None
 
-    def calculate_levels(self, signals, close, sl_long, sl_short):
+    def calculate_levels(self, df):
 
-        if not isinstance(signals, dict):
-            return None
+        close = df["close"]
+        lookback = self.params["SL_LOOKBACK"]
 
-        direction = signals.get("direction")
-        tag = signals.get("tag")
+        sl_long = df["low"].rolling(lookback).min()
+        sl_short = df["high"].rolling(lookback).max()
 
-        if direction == "long":
-            sl = sl_long
-            tp1 = close + (close - sl_long) * 1
-            tp2 = close + (close - sl_long) * 2
-        else:
-            sl = sl_short
-            tp1 = close - (sl_short - close) * 1
-            tp2 = close - (sl_short - close) * 2
+        for direction, sl in (("long", sl_long), ("short", sl_short)):
+            mask = df["entry_dir"] == DIRECTION_CODES[direction]
+            risk = close - sl
 
-        return {
-            "SL": {"level": sl, "tag": "auto"},
-            "TP1": {"level": tp1, "tag": "RR_1:2"},
-            "TP2": {"level": tp2, "tag": "RR_1:4"},
-        }
\ No newline at end of file
+            set_levels(
+                df,
+                mask,
+                sl=sl,
+                tp1=close + risk * self.params["RR_TP1"],
+                tp2=close + risk * self.params["RR_TP2"],
+                sl_tag="auto",
+                tp1_tag="RR_1:2",
+                tp2_tag="RR_1:4",
+            )
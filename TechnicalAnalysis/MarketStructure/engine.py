@@ -2,13 +2,19 @@ import pandas as pd
 
 from TechnicalAnalysis.MarketStructure.fibo import FiboBatched
 from TechnicalAnalysis.MarketStructure.follow_through import PriceActionFollowThroughBatched
-from TechnicalAnalysis.MarketStructure.pivots import PivotDetectorBatched
-from TechnicalAnalysis.MarketStructure.price_action import PriceActionStateEngineBatched
+from TechnicalAnalysis.MarketStructure.graph import FeatureGraph, Node, NodeCache
+from TechnicalAnalysis.MarketStructure.lazy import LazyFeatureFrame, _PendingFeatures
+from TechnicalAnalysis.MarketStructure.pivots import PivotDetectorBatched, PivotDetectorNumba
+from TechnicalAnalysis.MarketStructure.price_action import PriceActionStateEngineBatched, PriceActionStateEngineNumba
 
 from TechnicalAnalysis.MarketStructure.price_action_liquidity import PriceActionLiquidityResponseBatched
 from TechnicalAnalysis.MarketStructure.relations import PivotRelationsBatched
-from TechnicalAnalysis.MarketStructure.structural_volatility import PriceActionStructuralVolatilityBatched
-from TechnicalAnalysis.MarketStructure.trend_regime import PriceActionTrendRegimeBatched
+from TechnicalAnalysis.MarketStructure.structural_volatility import (
+    PriceActionStructuralVolatilityBatched,
+    PriceActionStructuralVolatilityNumba,
+)
+from TechnicalAnalysis.MarketStructure.trend_regime import PriceActionTrendRegimeBatched, PriceActionTrendRegimeNumba
+from TechnicalAnalysis.MarketStructure.utils.ensure_indicator import ensure_indicator
 
 
 class _Modules:
@@ -26,6 +32,23 @@ class _Modules:
     trend_regime = PriceActionTrendRegimeBatched
 
 
+class _NumbaModules(_Modules):
+    """
+    Same outputs, single-pass numba kernels for the stateful stages.
+    """
+
+    pivot_detector = PivotDetectorNumba
+    price_action = PriceActionStateEngineNumba
+    structural_vol = PriceActionStructuralVolatilityNumba
+    trend_regime = PriceActionTrendRegimeNumba
+
+
+MODULES = {
+    "pandas": _Modules,
+    "numba": _NumbaModules,
+}
+
+
 class MarketStructureEngine:
     """
     Deterministic, dependency-aware market structure engine.
@@ -45,6 +68,9 @@ class MarketStructureEngine:
         "trend_regime": ["pivots", "price_action", "structural_vol", "follow_through"],
     }
 
+    # shared memo of node outputs (see graph.NodeCache)
+    node_cache = NodeCache()
+
     # =============================================================
     # PUBLIC ENTRYPOINT
     # =============================================================
@@ -56,145 +82,225 @@ class MarketStructureEngine:
         features: list[str],
         pivot_range: int = 15,
         return_context: bool = False,
+        cache: bool = True,
+        max_workers: int = 4,
+        backend: str = "pandas",
+        lazy: bool = False,
     ):
+        """
+        Runs the requested features as a dependency graph (see
+        _build_graph). Independent module calls run concurrently on
+        max_workers threads; with cache=True the output of each call
+        is memoised by a content hash of its inputs and parameters,
+        so repeated runs over the same bars reuse it.
+
+        backend: "pandas" or "numba" (see MODULES), identical output.
+
+        lazy=True returns a LazyFeatureFrame: the feature columns are
+        computed on first access, with only the nodes they need.
+        """
         cls._validate_features(features)
         cls._validate_dependencies(features)
+        if backend not in MODULES:
+            raise ValueError(f"Unknown backend: {backend!r} (expected one of {sorted(MODULES)})")
 
-        out: dict[str, pd.Series] = {}
-        context: dict[str, dict] = {}
+        if "structural_vol" in features:
+            # once here instead of inside each concurrent node
+            ensure_indicator(df, indicator="atr")
 
-        M = _Modules
-
-        # =========================================================
-        # 1️⃣ PIVOTS
-        # =========================================================
-        if "pivots" in features:
-            pivots = M.pivot_detector(pivot_range).apply(df)
-            context["pivots"] = pivots
-        else:
-            pivots = None
-
-        # =========================================================
-        # 2️⃣ RELATIONS
-        # =========================================================
-        if "relations" in features:
-            rel = M.relations().apply(
-                pivots=pivots,
-                atr=df["atr"],
-            )
-            out.update(rel)
+        if lazy:
+            if return_context:
+                raise ValueError("return_context is not available with lazy=True")
 
-        # =========================================================
-        # 3️⃣ FIBO
-        # =========================================================
-        if "fibo" in features:
-            fibo = M.fibo(
+            frame = LazyFeatureFrame(df.copy())
+            # the engine inputs by reference: no second copy of the bars
+            frame._features = _PendingFeatures(
+                cls,
+                df,
+                features=features,
                 pivot_range=pivot_range,
-                mode="swing",
-                prefix="fibo_swing",
-            ).apply(pivots=pivots)
-
-            fibo.update(
-                M.fibo(
-                    pivot_range=pivot_range,
-                    mode="range",
-                    prefix="fibo_range",
-                ).apply(pivots=pivots)
+                modules=MODULES[backend],
+                cache=cache,
+                max_workers=max_workers,
             )
-            context["fibo"] = fibo
-
-        # =========================================================
-        # 4️⃣ PRICE ACTION
-        # =========================================================
-        if "price_action" in features:
-            pa = M.price_action().apply(
-                pivots=pivots,
-                close=df["close"],
+            return frame
+
+        nodes = cls._build_graph(
+            df,
+            features=features,
+            pivot_range=pivot_range,
+            modules=MODULES[backend],
+        )
+        results = FeatureGraph(
+            nodes,
+            cache=cls.node_cache if cache else None,
+            max_workers=max_workers,
+        ).run(df)
+
+        out: dict[str, pd.Series] = {}
+        context: dict[str, dict] = {}
+
+        for node in nodes:
+            result = results[node.name]
+            if node.output:
+                out.update(result)
+
+            if node.feature == "follow_through":
+                context.setdefault("follow_through", {})[node.name.split(":")[1]] = result
+            elif node.feature in ("pivots", "fibo", "price_action", "structural_vol"):
+                context.setdefault(node.feature, {}).update(result)
+
+        df_out = df.copy()
+        for k, v in out.items():
+            df_out[k] = v
+
+        return (df_out, context) if return_context else df_out
+
+    # =============================================================
+    # GRAPH
+    # =============================================================
+    @classmethod
+    def _build_graph(
+        cls,
+        df: pd.DataFrame,
+        *,
+        features: list[str],
+        pivot_range: int,
+        modules: type[_Modules] = _Modules,
+    ) -> list[Node]:
+        """
+        One node per module call, in the legacy stage order (which
+        is also the output column order):
+
+        pivots -> relations, fibo:{swing,range}, price_action
+        price_action -> follow_through:{bos,mss}, structural_vol:{src}:{side}
+        follow_through:{src} -> liquidity:{src}:{side}
+        all of the above -> trend_regime
+        """
+        M = modules
+        nodes: list[Node] = []
+        enabled = set(features)
+
+        def deps(feature: str, *, skip: tuple[str, ...] = ()) -> tuple[str, ...]:
+            # every node already built for the features it depends on
+            return tuple(
+                n.name for n in nodes
+                if n.feature in cls.FEATURE_DEPENDENCIES[feature] and n.name not in skip
             )
-            context["price_action"] = pa
-            out.update(pa)
-        else:
-            pa = None
-
-        # =========================================================
-        # 5️⃣ FOLLOW THROUGH
-        # =========================================================
-        if "follow_through" in features:
-            ft = {}
-            for src in ("bos", "mss"):
-                ft[src] = M.follow_through(
-                    event_source=src,
-                ).apply(
-                    events=pa,
-                    levels=pa,
-                    high=df["high"],
-                    low=df["low"],
-                    atr=df["atr"],
-                )
-                out.update(ft[src])
 
-            context["follow_through"] = ft
-        else:
-            ft = None
+        if "pivots" in enabled:
+            m = M.pivot_detector(pivot_range)
+            nodes.append(Node(
+                "pivots", "pivots", m,
+                run=lambda r, m=m: m.apply(df),
+                columns=("open", "high", "low", "close"),
+                output=False,
+            ))
+
+        if "relations" in enabled:
+            m = M.relations()
+            nodes.append(Node(
+                "relations", "relations", m,
+                run=lambda r, m=m: m.apply(pivots=r["pivots"], atr=df["atr"]),
+                deps=deps("relations"),
+                columns=("atr",),
+            ))
+
+        if "fibo" in enabled:
+            for mode in ("swing", "range"):
+                m = M.fibo(pivot_range=pivot_range, mode=mode, prefix=f"fibo_{mode}")
+                nodes.append(Node(
+                    f"fibo:{mode}", "fibo", m,
+                    run=lambda r, m=m: m.apply(pivots=r["pivots"]),
+                    deps=deps("fibo"),
+                    output=False,
+                ))
+
+        if "price_action" in enabled:
+            m = M.price_action()
+            nodes.append(Node(
+                "price_action", "price_action", m,
+                run=lambda r, m=m: m.apply(pivots=r["pivots"], close=df["close"]),
+                deps=deps("price_action"),
+                columns=("close",),
+            ))
+
+        if "follow_through" in enabled:
+            for src in ("bos", "mss"):
+                m = M.follow_through(event_source=src)
+                nodes.append(Node(
+                    f"follow_through:{src}", "follow_through", m,
+                    run=lambda r, m=m: m.apply(
+                        events=r["price_action"],
+                        levels=r["price_action"],
+                        high=df["high"],
+                        low=df["low"],
+                        atr=df["atr"],
+                    ),
+                    deps=deps("follow_through"),
+                    columns=("high", "low", "atr"),
+                ))
 
-        # =========================================================
-        # 6️⃣ LIQUIDITY RESPONSE
-        # =========================================================
-        if "liquidity" in features:
+        if "liquidity" in enabled:
             for src in ("bos", "mss"):
                 for side in ("bull", "bear"):
-                    out.update(
-                        M.liquidity(
-                            event_source=src,
-                            direction=side,
-                        ).apply(
-                            events=pa,
-                            levels=pa,
-                            follow_through=ft[src],
+                    m = M.liquidity(event_source=src, direction=side)
+                    nodes.append(Node(
+                        f"liquidity:{src}:{side}", "liquidity", m,
+                        run=lambda r, m=m, src=src: m.apply(
+                            events=r["price_action"],
+                            levels=r["price_action"],
+                            follow_through=r[f"follow_through:{src}"],
                             df=df,
-                        )
-                    )
+                        ),
+                        # only the follow-through of its own event source
+                        deps=deps("liquidity", skip=tuple(
+                            f"follow_through:{o}" for o in ("bos", "mss") if o != src
+                        )),
+                        columns=("high", "low", "close", "atr"),
+                    ))
 
-        # =========================================================
-        # 7️⃣ STRUCTURAL VOLATILITY
-        # =========================================================
-        if "structural_vol" in features:
-            sv = {}
+        if "structural_vol" in enabled:
             for src in ("bos", "mss"):
                 for side in ("bull", "bear"):
-                    part = M.structural_vol(
-                        event_source=src,
-                        direction=side,
-                    ).apply(
-                        events=pa,
-                        df=df,
-                    )
-                    sv.update(part)
-                    out.update(part)
-
-            context["structural_vol"] = sv
-
-        else:
-            sv = None
-
-        # =========================================================
-        # 8️⃣ TREND REGIME
-        # =========================================================
-        if "trend_regime" in features:
-            trend = M.trend_regime().apply(
-                pivots={"pivot": pivots["pivot"]},
-                events=pa,
-                struct_vol=sv,
-                follow_through=ft,
-                df=df,
-            )
-            out.update(trend)
+                    m = M.structural_vol(event_source=src, direction=side)
+                    nodes.append(Node(
+                        f"structural_vol:{src}:{side}", "structural_vol", m,
+                        run=lambda r, m=m: m.apply(events=r["price_action"], df=df),
+                        deps=deps("structural_vol"),
+                        columns=("high", "low", "atr"),
+                    ))
 
-        df_out = df.copy()
-        for k, v in out.items():
-            df_out[k] = v
+        if "trend_regime" in enabled:
+            sv_nodes = [n.name for n in nodes if n.feature == "structural_vol"]
+            ft_nodes = [n.name for n in nodes if n.feature == "follow_through"]
+            m = M.trend_regime()
 
-        return (df_out, context) if return_context else df_out
+            def run_trend(r, m=m):
+                return m.apply(
+                    pivots={"pivot": r["pivots"]["pivot"]},
+                    events=r["price_action"],
+                    struct_vol={k: v for name in sv_nodes for k, v in r[name].items()},
+                    follow_through={name.split(":")[1]: r[name] for name in ft_nodes},
+                    df=df,
+                )
+
+            nodes.append(Node(
+                "trend_regime", "trend_regime", m,
+                run=run_trend,
+                deps=deps("trend_regime"),
+            ))
+
+        return nodes
+
+    @classmethod
+    def stream(cls, *, features: list[str], pivot_range: int = 15, **kwargs):
+        """
+        Incremental engine for live use (see MarketStructureStream).
+        """
+        from TechnicalAnalysis.MarketStructure.stream import MarketStructureStream
+
+        return MarketStructureStream(features=features, pivot_range=pivot_range, **kwargs)
 
     # =============================================================
     # VALIDATION
@@ -1,7 +1,10 @@
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
 from TechnicalAnalysis.MarketStructure.utils.ensure_indicator import ensure_indicator
+from TechnicalAnalysis.MarketStructure.utils.safe_div import safe_div
 
 
 class PriceActionFollowThroughBatched:
@@ -103,3 +106,77 @@ class PriceActionFollowThroughBatched:
             f"{prefix}_bear_ft_valid": bear_ft_valid,
             f"{prefix}_bear_ft_weak": bear_ft_weak,
         }
+
+
+class PriceActionFollowThroughIncremental:
+    """
+    Streaming PriceActionFollowThroughBatched (one bar per update()).
+    State: the last lookahead highs / lows and lookahead + 1 events,
+    levels and ATR values.
+    """
+
+    def __init__(
+        self,
+        *,
+        event_source: str = "bos",  # "bos" | "mss"
+        atr_mult: float = 1.0,
+        lookahead: int = 5,
+    ):
+        if event_source not in ("bos", "mss"):
+            raise ValueError("event_source must be 'bos' or 'mss'")
+
+        self.event_source = event_source
+        self.atr_mult = atr_mult
+        self.lookahead = lookahead
+
+        N = lookahead
+        self.highs = deque(maxlen=N)
+        self.lows = deque(maxlen=N)
+        self.past = deque(maxlen=N + 1)   # (bull_event, bear_event, bull_level, bear_level, atr)
+
+    def update(
+        self,
+        *,
+        events: dict[str, object],
+        high: float,
+        low: float,
+        atr: float,
+    ) -> dict[str, object]:
+        p = self.event_source
+        N = self.lookahead
+
+        self.highs.append(high)
+        self.lows.append(low)
+        self.past.append((
+            events[f"{p}_bull_event"],
+            events[f"{p}_bear_event"],
+            events[f"{p}_bull_level"],
+            events[f"{p}_bear_level"],
+            atr,
+        ))
+
+        high_N = max(self.highs) if len(self.highs) == N else np.nan
+        low_N = min(self.lows) if len(self.lows) == N else np.nan
+
+        bull_eval = bear_eval = False
+        ft_bull_atr = ft_bear_atr = np.nan
+
+        if len(self.past) == N + 1:
+            bull_eval, bear_eval, bull_level, bear_level, atr_eval = self.past[0]
+            if bull_eval:
+                ft_bull_atr = safe_div(high_N - bull_level, atr_eval)
+            if bear_eval:
+                ft_bear_atr = safe_div(bear_level - low_N, atr_eval)
+
+        bull_ft_valid = ft_bull_atr >= self.atr_mult
+        bear_ft_valid = ft_bear_atr >= self.atr_mult
+
+        return {
+            f"{p}_bull_ft_atr": ft_bull_atr,
+            f"{p}_bull_ft_valid": bool(bull_ft_valid),
+            f"{p}_bull_ft_weak": bool(bull_eval and not bull_ft_valid),
+
+            f"{p}_bear_ft_atr": ft_bear_atr,
+            f"{p}_bear_ft_valid": bool(bear_ft_valid),
+            f"{p}_bear_ft_weak": bool(bear_eval and not bear_ft_valid),
+        }
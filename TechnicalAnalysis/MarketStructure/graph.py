@@ -0,0 +1,219 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Node:
+    """
+    One module call of the engine.
+
+    run(results) gets the results of deps by node name and returns
+    the module output. module is only used for the cache key (its
+    class and attributes); columns are the df columns it reads.
+    """
+
+    name: str
+    feature: str
+    module: object
+    run: Callable[[dict[str, dict]], dict]
+    deps: tuple[str, ...] = ()
+    columns: tuple[str, ...] = ()
+    output: bool = True
+
+
+# ==================================================
+# Content hashing
+# ==================================================
+
+def _digest_array(values) -> bytes:
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        arr = pd.util.hash_array(arr)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(arr.dtype).encode())
+    h.update(np.ascontiguousarray(arr).view(np.uint8))
+    return h.digest()
+
+
+def _digest_index(index: pd.Index) -> bytes:
+    if isinstance(index, pd.RangeIndex):
+        return repr((index.start, index.stop, index.step)).encode()
+    return _digest_array(index.to_numpy())
+
+
+def _params(module) -> bytes:
+    cls = type(module)
+    attrs = sorted(vars(module).items())
+    return f"{cls.__module__}.{cls.__qualname__}{attrs!r}".encode()
+
+
+# ==================================================
+# Memo
+# ==================================================
+
+class NodeCache:
+    """
+    LRU of node outputs keyed by the content hash of the node inputs
+    (df columns read, upstream keys, module class and parameters).
+    Bounded by the size of the cached series.
+    """
+
+    def __init__(self, *, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[dict, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(result: dict) -> int:
+        return sum(
+            int(v.memory_usage(index=False, deep=False))
+            for v in result.values()
+            if isinstance(v, pd.Series)
+        )
+
+    def get(self, key: bytes) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, key: bytes, result: dict) -> None:
+        size = self._size(result)
+        with self._lock:
+            if key in self._entries or size > self.max_bytes:
+                return
+            self._entries[key] = (dict(result), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# ==================================================
+# Executor
+# ==================================================
+
+@dataclass
+class FeatureGraph:
+    """
+    Runs nodes in dependency order: every node whose deps are done is
+    submitted at once, so independent branches (the bos/mss x bull/bear
+    fan-outs) run concurrently. With a cache, a node whose key was
+    seen before is not run.
+    """
+
+    nodes: list[Node]
+    cache: NodeCache | None = None
+    max_workers: int = 4
+    keys: dict[str, bytes] = field(default_factory=dict)
+
+    def _keys(self, df: pd.DataFrame) -> None:
+        index = _digest_index(df.index)
+        columns: dict[str, bytes] = {}
+
+        for node in self.nodes:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(node.name.encode())
+            h.update(_params(node.module))
+            h.update(index)
+            for col in node.columns:
+                if col not in columns:
+                    columns[col] = _digest_array(df[col].to_numpy())
+                h.update(col.encode())
+                h.update(columns[col])
+            for dep in node.deps:
+                h.update(self.keys[dep])
+            self.keys[node.name] = h.digest()
+
+    def _run_node(self, node: Node, results: dict[str, dict]) -> dict:
+        if self.cache is not None:
+            hit = self.cache.get(self.keys[node.name])
+            if hit is not None:
+                return hit
+
+        result = node.run(results)
+        if self.cache is not None:
+            self.cache.put(self.keys[node.name], result)
+        return result
+
+    def closure(self, targets) -> list[Node]:
+        """
+        targets and everything they depend on, in node order.
+        """
+        by_name = {node.name: node for node in self.nodes}
+        needed: set[str] = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(by_name[name].deps)
+        return [node for node in self.nodes if node.name in needed]
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        *,
+        targets=None,
+        results: dict[str, dict] | None = None,
+    ) -> dict[str, dict]:
+        """
+        {node name: output} for every node, or only for targets and
+        their dependency closure. results: outputs already computed
+        (reused, not run again). nodes must be listed after their deps.
+        """
+        if self.cache is not None:
+            self._keys(df)
+
+        results = dict(results or {})
+        todo = self.nodes if targets is None else self.closure(targets)
+        todo = [node for node in todo if node.name not in results]
+
+        if self.max_workers <= 1:
+            for node in todo:
+                results[node.name] = self._run_node(node, results)
+            return results
+
+        pending = list(todo)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for node in [n for n in pending if all(d in results for d in n.deps)]:
+                    pending.remove(node)
+                    running[pool.submit(self._run_node, node, dict(results))] = node
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future).name] = future.result()
+
+        return results
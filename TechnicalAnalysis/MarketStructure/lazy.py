@@ -0,0 +1,154 @@
+import pandas as pd
+
+from TechnicalAnalysis.MarketStructure.graph import FeatureGraph
+
+
+class _PendingFeatures:
+    """
+    What a LazyFeatureFrame can still compute: the engine inputs,
+    {column: node} of every output column and the node outputs
+    computed so far (shared by all copies of the frame).
+
+    Nodes are rebuilt per compute() call, so the object pickles
+    (computed outputs are dropped and recomputed on demand).
+    """
+
+    # (features, pivot_range, modules) -> {column: node name}
+    _schemas: dict[tuple, dict[str, str]] = {}
+
+    def __init__(self, engine, df: pd.DataFrame, *, features, pivot_range, modules, cache, max_workers):
+        self.engine = engine
+        self.df = df
+        self.features = list(features)
+        self.pivot_range = pivot_range
+        self.modules = modules
+        self.cache = cache
+        self.max_workers = max_workers
+        self.results: dict[str, dict] = {}
+        self.columns = self._schema()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["results"] = {}
+        return state
+
+    def _nodes(self, df: pd.DataFrame):
+        return self.engine._build_graph(
+            df,
+            features=self.features,
+            pivot_range=self.pivot_range,
+            modules=self.modules,
+        )
+
+    def _schema(self) -> dict[str, str]:
+        # column names do not depend on the data: probe a 1-bar frame
+        key = (tuple(sorted(self.features)), self.pivot_range, self.modules)
+        if key not in self._schemas:
+            probe = self.df.iloc[:1]
+            nodes = self._nodes(probe)
+            results = FeatureGraph(nodes, max_workers=1).run(probe)
+            self._schemas[key] = {
+                col: node.name
+                for node in nodes if node.output
+                for col in results[node.name]
+            }
+        return self._schemas[key]
+
+    def compute(self, columns: list[str]) -> dict[str, pd.Series]:
+        """
+        Series of columns, running only the nodes they come from and
+        the dependency closure of those nodes.
+        """
+        needed = {self.columns[col] for col in columns}
+        if needed - set(self.results):
+            graph = FeatureGraph(
+                self._nodes(self.df),
+                cache=self.engine.node_cache if self.cache else None,
+                max_workers=self.max_workers,
+            )
+            self.results = graph.run(self.df, targets=needed, results=self.results)
+
+        return {col: self.results[self.columns[col]][col] for col in columns}
+
+
+class LazyFeatureFrame(pd.DataFrame):
+    """
+    DataFrame whose MarketStructure columns are computed on first
+    access (df[col], df[[...]], df.get(col), df.col), together with
+    the features they depend on; the rest are never computed.
+
+    Pending columns count for `col in df` but are not in df.columns
+    until accessed. Copies and row selections keep them pending
+    (values are aligned on the index of the input frame). Use
+    materialize() before handing the frame to code that iterates
+    over all columns (merges, exports).
+    """
+
+    _metadata = ["_features"]
+    _features: _PendingFeatures | None = None
+
+    @property
+    def _constructor(self):
+        return LazyFeatureFrame
+
+    # -------------------------------------------------
+    # Pending columns
+    # -------------------------------------------------
+
+    def _pending(self, keys) -> list[str]:
+        features = self._features
+        if features is None:
+            return []
+        if isinstance(keys, str):
+            keys = [keys]
+        elif not isinstance(keys, (list, tuple, pd.Index)):
+            return []
+
+        columns = set(self.columns)
+        return [
+            k for k in keys
+            if isinstance(k, str) and k in features.columns and k not in columns
+        ]
+
+    def _insert_pending(self, names: list[str]) -> None:
+        for name, values in self._features.compute(names).items():
+            if not values.index.equals(self.index):
+                values = values.reindex(self.index)
+            super().__setitem__(name, values)
+
+    @property
+    def pending_columns(self) -> list[str]:
+        return self._pending(list(self._features.columns)) if self._features else []
+
+    def materialize(self) -> pd.DataFrame:
+        """
+        Plain DataFrame with every pending column computed.
+        """
+        pending = self.pending_columns
+        if pending:
+            self._insert_pending(pending)
+        return pd.DataFrame(self)
+
+    # -------------------------------------------------
+    # Access
+    # -------------------------------------------------
+
+    def __getitem__(self, key):
+        pending = self._pending(key)
+        if pending:
+            self._insert_pending(pending)
+        return super().__getitem__(key)
+
+    def __getattr__(self, name: str):
+        if not name.startswith("_") and self._pending(name):
+            self._insert_pending([name])
+        return super().__getattr__(name)
+
+    def __contains__(self, key) -> bool:
+        return super().__contains__(key) or bool(self._pending(key))
+
+    def get(self, key, default=None):
+        pending = self._pending(key)
+        if pending:
+            self._insert_pending(pending)
+        return super().get(key, default)
@@ -1,5 +1,8 @@
+from collections import deque
+
 import numpy as np
 import pandas as pd
+from numba import njit
 
 
 class PivotDetectorBatched:
@@ -152,3 +155,243 @@ class PivotDetectorBatched:
             "LH_idx_shift": LH_idx_shift,
             "HL_idx_shift": HL_idx_shift,
         }
+
+
+class PivotDetectorIncremental:
+    """
+    Streaming PivotDetectorBatched: one bar per update(), same values
+    as the batch output row of that bar (bars counted from the first
+    update, as the batch positional index).
+
+    State: the last 2 * pivot_range + 1 highs / lows, the candle
+    bodies of the pivot_body window and the running structure levels.
+    """
+
+    LEVELS = {3: "HH", 4: "LL", 5: "LH", 6: "HL"}
+
+    def __init__(self, pivot_range: int = 15):
+        self.pivot_range = pivot_range
+        pr = pivot_range
+
+        self.t = -1
+        self.highs = deque(maxlen=2 * pr + 1)
+        self.lows = deque(maxlen=2 * pr + 1)
+        self.body_highs = deque(maxlen=pr + pr // 2)
+        self.body_lows = deque(maxlen=pr + pr // 2)
+
+        # pivotprice of the last local high / low (ffill + shift)
+        self.prev_high = np.nan
+        self.prev_low = np.nan
+
+        self.level = {code: np.nan for code in self.LEVELS}
+        self.level_idx = {code: np.nan for code in self.LEVELS}
+
+    def update(self, *, open: float, high: float, low: float, close: float) -> dict[str, float]:
+        pr = self.pivot_range
+        self.t += 1
+
+        self.highs.append(high)
+        self.lows.append(low)
+        self.body_highs.append(max(open, close))
+        self.body_lows.append(min(open, close))
+
+        # =====================================================
+        # 1️⃣ LOCAL EXTREMA
+        # =====================================================
+        local_high = local_low = False
+        if self.t >= 2 * pr:
+            highs = list(self.highs)
+            lows = list(self.lows)
+            local_high = max(highs[:pr]) <= highs[pr] and max(highs[pr + 1:]) <= highs[pr]
+            local_low = min(lows[:pr]) >= lows[pr] and min(lows[pr + 1:]) >= lows[pr]
+
+        # =====================================================
+        # 2️⃣ BASE VALUES
+        # =====================================================
+        pivot = pivotprice = pivot_body = np.nan
+
+        if local_high:
+            pivot = 1
+            pivotprice = self.highs[pr]
+            pivot_body = max(list(self.body_highs)[:pr])
+        if local_low:
+            pivot = 2
+            pivotprice = self.lows[pr]
+            pivot_body = min(list(self.body_lows)[:pr])
+
+        # =====================================================
+        # 3️⃣ STRUCTURAL CLASSIFICATION
+        # =====================================================
+        if local_high and pivotprice > self.prev_high:
+            pivot = 3
+        if local_low and pivotprice < self.prev_low:
+            pivot = 4
+        if local_high and pivotprice < self.prev_high:
+            pivot = 5
+        if local_low and pivotprice > self.prev_low:
+            pivot = 6
+
+        if local_high:
+            self.prev_high = pivotprice
+        if local_low:
+            self.prev_low = pivotprice
+
+        # =====================================================
+        # 4️⃣ LEVELS / INDEXES (+ previous bar values)
+        # =====================================================
+        out = {"pivot": pivot if pivot >= 3 else np.nan, "pivotprice": pivotprice, "pivot_body": pivot_body}
+        shifted = {}
+
+        for code, name in self.LEVELS.items():
+            shifted[f"{name}_shift"] = self.level[code]
+            shifted[f"{name}_idx_shift"] = self.level_idx[code]
+            if pivot == code:
+                self.level[code] = pivotprice
+                self.level_idx[code] = float(self.t)
+
+        for code, name in self.LEVELS.items():
+            out[name] = self.level[code]
+        for code, name in self.LEVELS.items():
+            out[f"{name}_idx"] = self.level_idx[code]
+        for name in self.LEVELS.values():
+            out[f"{name}_shift"] = shifted[f"{name}_shift"]
+        for name in self.LEVELS.values():
+            out[f"{name}_idx_shift"] = shifted[f"{name}_idx_shift"]
+
+        return out
+
+
+# ==================================================
+# Numba kernel
+#
+# Not parallel=True: numba's default threading layer is not
+# fork-safe and the backtest / sweep process pools fork.
+# ==================================================
+
+PIVOT_COLUMNS = (
+    "pivot", "pivotprice", "pivot_body",
+    "HH", "LL", "LH", "HL",
+    "HH_idx", "LL_idx", "LH_idx", "HL_idx",
+    "HH_shift", "LL_shift", "LH_shift", "HL_shift",
+    "HH_idx_shift", "LL_idx_shift", "LH_idx_shift", "HL_idx_shift",
+)
+
+
+@njit(cache=True, error_model="numpy")
+def _window_max(x, start, stop):
+    # rolling().max() semantics: NaN if the window holds a NaN
+    m = x[start]
+    for i in range(start, stop):
+        if np.isnan(x[i]):
+            return np.nan
+        if x[i] > m:
+            m = x[i]
+    return m
+
+
+@njit(cache=True, error_model="numpy")
+def _window_min(x, start, stop):
+    m = x[start]
+    for i in range(start, stop):
+        if np.isnan(x[i]):
+            return np.nan
+        if x[i] < m:
+            m = x[i]
+    return m
+
+
+@njit(cache=True, error_model="numpy")
+def _pivots_numba(open_, high, low, close, pr, out):
+    """
+    Single pass of PivotDetectorBatched. out: (len(PIVOT_COLUMNS), n)
+    float64, NaN-filled; rows in PIVOT_COLUMNS order.
+    """
+    n = len(high)
+    half = pr // 2
+
+    # python max(open, close) / min(open, close), as Series.combine
+    body_high = np.empty(n)
+    body_low = np.empty(n)
+    for t in range(n):
+        body_high[t] = close[t] if close[t] > open_[t] else open_[t]
+        body_low[t] = close[t] if close[t] < open_[t] else open_[t]
+
+    prev_high = np.nan
+    prev_low = np.nan
+    level = np.full(4, np.nan)
+    level_idx = np.full(4, np.nan)
+
+    for t in range(n):
+        local_high = False
+        local_low = False
+
+        if t >= 2 * pr:
+            c = t - pr
+            local_high = (
+                _window_max(high, c - pr, c) <= high[c]
+                and _window_max(high, c + 1, t + 1) <= high[c]
+            )
+            local_low = (
+                _window_min(low, c - pr, c) >= low[c]
+                and _window_min(low, c + 1, t + 1) >= low[c]
+            )
+
+        pivot = np.nan
+        pivotprice = np.nan
+
+        if local_high:
+            pivot = 1.0
+            pivotprice = high[t - pr]
+            out[2, t] = _window_max(body_high, t - half - pr + 1, t - half + 1)
+        if local_low:
+            pivot = 2.0
+            pivotprice = low[t - pr]
+            out[2, t] = _window_min(body_low, t - half - pr + 1, t - half + 1)
+
+        if local_high and pivotprice > prev_high:
+            pivot = 3.0
+        if local_low and pivotprice < prev_low:
+            pivot = 4.0
+        if local_high and pivotprice < prev_high:
+            pivot = 5.0
+        if local_low and pivotprice > prev_low:
+            pivot = 6.0
+
+        if local_high:
+            prev_high = pivotprice
+        if local_low:
+            prev_low = pivotprice
+
+        out[1, t] = pivotprice
+        if pivot >= 3:
+            out[0, t] = pivot
+
+        for k in range(4):
+            out[11 + k, t] = level[k]
+            out[15 + k, t] = level_idx[k]
+            if pivot == 3 + k:
+                level[k] = pivotprice
+                level_idx[k] = t
+            out[3 + k, t] = level[k]
+            out[7 + k, t] = level_idx[k]
+
+
+class PivotDetectorNumba(PivotDetectorBatched):
+    """
+    PivotDetectorBatched in one numba pass (same output).
+    """
+
+    def apply(self, df: pd.DataFrame) -> dict[str, pd.Series]:
+        idx = df.index
+        out = np.full((len(PIVOT_COLUMNS), len(idx)), np.nan)
+
+        _pivots_numba(
+            df["open"].to_numpy(dtype=np.float64),
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["close"].to_numpy(dtype=np.float64),
+            self.pivot_range,
+            out,
+        )
+
+        return {name: pd.Series(out[i], index=idx) for i, name in enumerate(PIVOT_COLUMNS)}
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from numba import njit
 
 
 class PriceActionStateEngineBatched:
@@ -64,3 +65,118 @@ class PriceActionStateEngineBatched:
         emit("bos_bear", bos_bear_event, LL)
 
         return out
+
+
+class PriceActionStateEngineIncremental:
+    """
+    Streaming PriceActionStateEngineBatched (one bar per update()).
+    State: previous close, last level / event index per structure.
+    """
+
+    # name -> pivot level it breaks, direction
+    EVENTS = (
+        ("mss_bull", "LH", 1),
+        ("mss_bear", "HL", -1),
+        ("bos_bull", "HH", 1),
+        ("bos_bear", "LL", -1),
+    )
+
+    def __init__(self):
+        self.t = -1
+        self.prev_close = np.nan
+        self.level = {name: np.nan for name, _, _ in self.EVENTS}
+        self.event_idx = {name: np.nan for name, _, _ in self.EVENTS}
+
+    def update(self, *, pivots: dict[str, float], close: float) -> dict[str, object]:
+        self.t += 1
+        out: dict[str, object] = {}
+
+        for name, key, sign in self.EVENTS:
+            level = pivots[key]
+            if sign > 0:
+                event = close > level and self.prev_close <= level
+            else:
+                event = close < level and self.prev_close >= level
+
+            if event:
+                self.level[name] = level
+                self.event_idx[name] = float(self.t)
+
+            out[f"{name}_event"] = bool(event)
+            out[f"{name}_level"] = self.level[name]
+            out[f"{name}_event_idx"] = self.event_idx[name]
+
+        self.prev_close = close
+        return out
+
+
+# ==================================================
+# Numba kernel (not parallel: pools fork after it runs)
+# ==================================================
+
+# name, pivot level it breaks, direction (PriceActionStateEngineIncremental.EVENTS)
+_EVENTS = PriceActionStateEngineIncremental.EVENTS
+
+
+@njit(cache=True, error_model="numpy")
+def _price_action_numba(close, levels, signs, events, level_out, idx_out):
+    """
+    levels: (k, n) pivot level per structure, signs: (k,) +1 / -1.
+    Writes events (bool), ffilled level and event index, (k, n) each.
+    """
+    k, n = levels.shape
+    for j in range(k):
+        last_level = np.nan
+        last_idx = np.nan
+        prev_close = np.nan
+        for t in range(n):
+            level = levels[j, t]
+            if signs[j] > 0:
+                event = close[t] > level and prev_close <= level
+            else:
+                event = close[t] < level and prev_close >= level
+
+            if event:
+                last_level = level
+                last_idx = t
+
+            events[j, t] = event
+            level_out[j, t] = last_level
+            idx_out[j, t] = last_idx
+            prev_close = close[t]
+
+
+class PriceActionStateEngineNumba(PriceActionStateEngineBatched):
+    """
+    PriceActionStateEngineBatched in one numba pass (same output).
+    """
+
+    def apply(
+        self,
+        *,
+        pivots: dict[str, pd.Series],
+        close: pd.Series,
+    ) -> dict[str, pd.Series]:
+
+        idx = close.index
+        n, k = len(idx), len(_EVENTS)
+
+        events = np.zeros((k, n), dtype=np.bool_)
+        level = np.empty((k, n))
+        event_idx = np.empty((k, n))
+
+        _price_action_numba(
+            close.to_numpy(dtype=np.float64),
+            np.stack([pivots[key].to_numpy(dtype=np.float64) for _, key, _ in _EVENTS]),
+            np.array([sign for _, _, sign in _EVENTS], dtype=np.int64),
+            events,
+            level,
+            event_idx,
+        )
+
+        out: dict[str, pd.Series] = {}
+        for j, (name, _, _) in enumerate(_EVENTS):
+            out[f"{name}_event"] = pd.Series(events[j], index=idx)
+            out[f"{name}_level"] = pd.Series(level[j], index=idx)
+            out[f"{name}_event_idx"] = pd.Series(event_idx[j], index=idx)
+        return out
@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.follow_through import PriceActionFollowThroughIncremental
+from TechnicalAnalysis.MarketStructure.pivots import PivotDetectorIncremental
+from TechnicalAnalysis.MarketStructure.price_action import PriceActionStateEngineIncremental
+from TechnicalAnalysis.MarketStructure.structural_volatility import PriceActionStructuralVolatilityIncremental
+from TechnicalAnalysis.MarketStructure.trend_regime import PriceActionTrendRegimeIncremental
+from TechnicalAnalysis.MarketStructure.utils.incremental_atr import IncrementalATR
+
+
+class _RingColumn:
+    """
+    Last `capacity` values of one output column, preallocated and
+    mirrored (value i stored at i and i + size), so the newest n values
+    are always one contiguous slice. Starts small and doubles up to
+    capacity; the dtype is fixed by the first value.
+    """
+
+    def __init__(self, first, capacity: int):
+        dtype = np.asarray(first).dtype
+        self.dtype = dtype if dtype.kind in "biuf" else np.dtype(object)
+        self.capacity = capacity
+        self.size = min(capacity, 1024)
+        self.buffer = np.empty(2 * self.size, dtype=self.dtype)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    def append(self, value) -> None:
+        if self.count == self.size < self.capacity:
+            self._grow()
+        i = self.count % self.size
+        self.buffer[i] = self.buffer[i + self.size] = value
+        self.count += 1
+
+    def _grow(self) -> None:
+        # only before the first wrap: values are still in order
+        size = min(2 * self.size, self.capacity)
+        buffer = np.empty(2 * size, dtype=self.dtype)
+        buffer[:self.count] = buffer[size:size + self.count] = self.buffer[:self.count]
+        self.buffer, self.size = buffer, size
+
+    def tail(self, n: int) -> np.ndarray:
+        end = (self.count - 1) % self.size + self.size + 1
+        return self.buffer[end - n:end]
+
+
+class _StreamModules:
+    """
+    Incremental counterparts of engine._Modules.
+    """
+
+    pivot_detector = PivotDetectorIncremental
+    price_action = PriceActionStateEngineIncremental
+    follow_through = PriceActionFollowThroughIncremental
+    structural_vol = PriceActionStructuralVolatilityIncremental
+    trend_regime = PriceActionTrendRegimeIncremental
+
+
+class MarketStructureStream:
+    """
+    Stateful MarketStructureEngine: each update() consumes ONE bar in
+    O(pivot_range) time and returns the columns MarketStructureEngine.apply
+    adds for that bar, with identical values when fed the same bars
+    from the same first bar (indexes count from it, as the batch
+    positional index).
+
+    Supported features: pivots, price_action, follow_through,
+    structural_vol, trend_regime.
+
+    ATR: read from bar["atr"], or computed incrementally (TA-Lib
+    semantics) when atr_period is set.
+    """
+
+    SUPPORTED = ("pivots", "price_action", "follow_through", "structural_vol", "trend_regime")
+
+    def __init__(
+        self,
+        *,
+        features: list[str],
+        pivot_range: int = 15,
+        atr_period: int | None = None,
+        history: int = 100_000,
+    ):
+        MarketStructureEngine._validate_features(features)
+        MarketStructureEngine._validate_dependencies(features)
+
+        unsupported = set(features) - set(self.SUPPORTED)
+        if unsupported:
+            raise ValueError(f"Features not available incrementally: {sorted(unsupported)}")
+
+        M = _StreamModules
+        self.features = set(features)
+
+        self.pivots = M.pivot_detector(pivot_range) if "pivots" in self.features else None
+        self.price_action = M.price_action() if "price_action" in self.features else None
+        self.follow_through = (
+            {src: M.follow_through(event_source=src) for src in ("bos", "mss")}
+            if "follow_through" in self.features else None
+        )
+        self.structural_vol = (
+            [
+                M.structural_vol(event_source=src, direction=side)
+                for src in ("bos", "mss")
+                for side in ("bull", "bear")
+            ]
+            if "structural_vol" in self.features else None
+        )
+        self.trend_regime = M.trend_regime() if "trend_regime" in self.features else None
+        self.atr = IncrementalATR(atr_period) if atr_period else None
+
+        self.history = history
+        self._columns: dict[str, _RingColumn] = {}
+        self._last_time = None
+
+    # =============================================================
+    # ONE BAR
+    # =============================================================
+    def update(self, bar) -> dict[str, object]:
+        """
+        bar: mapping with open, high, low, close (and atr unless
+        atr_period is set).
+        """
+        o, h, l, c = bar["open"], bar["high"], bar["low"], bar["close"]
+        atr = self.atr.update(high=h, low=l, close=c) if self.atr else bar["atr"]
+
+        out: dict[str, object] = {}
+        if self.atr:
+            out["atr"] = atr
+
+        pivots = self.pivots.update(open=o, high=h, low=l, close=c) if self.pivots else None
+
+        pa = None
+        if self.price_action:
+            pa = self.price_action.update(pivots=pivots, close=c)
+            out.update(pa)
+
+        ft = None
+        if self.follow_through:
+            ft = {}
+            for src, module in self.follow_through.items():
+                ft[src] = module.update(events=pa, high=h, low=l, atr=atr)
+                out.update(ft[src])
+
+        sv = None
+        if self.structural_vol:
+            sv = {}
+            for module in self.structural_vol:
+                sv.update(module.update(events=pa, high=h, low=l, atr=atr))
+            out.update(sv)
+
+        if self.trend_regime:
+            # same wiring as the batch engine (follow-through per source)
+            out.update(self.trend_regime.update(
+                pivots={"pivot": pivots["pivot"]},
+                events=pa,
+                struct_vol=sv,
+                follow_through=ft,
+            ))
+
+        for name, value in out.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = _RingColumn(value, self.history)
+            column.append(value)
+
+        return out
+
+    # =============================================================
+    # GROWING FRAME (drop-in for MarketStructureEngine.apply)
+    # =============================================================
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Consumes only the rows of df after the last bar seen (by
+        "time") and returns df with the feature columns.
+
+        df must end at the newest bar and be no longer than history:
+        live frames that grow or slide forward by whole bars. Only the
+        new bars are computed and written; the returned columns are
+        copied from the newest len(df) ring slots.
+        """
+        times = df["time"]
+        new = df if self._last_time is None else df[times > self._last_time]
+
+        for bar in new.to_dict("records"):
+            self.update(bar)
+        if len(new):
+            self._last_time = times.iat[-1]
+
+        n = len(df)
+        if n and (not self._columns or n > len(next(iter(self._columns.values())))):
+            raise ValueError("df reaches further back than the stream history")
+
+        features = pd.DataFrame(
+            {
+                name: pd.Series(
+                    column.tail(n),
+                    index=df.index,
+                    dtype=object if name.endswith("_struct_vol") else None,
+                )
+                for name, column in self._columns.items()
+            },
+            index=df.index,
+            copy=True,  # never hand out views of the ring buffers
+        )
+        # one concat instead of a column insert per feature
+        base = df.drop(columns=features.columns.intersection(df.columns))
+        return pd.concat([base, features], axis=1)
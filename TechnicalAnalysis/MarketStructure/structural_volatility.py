@@ -2,8 +2,10 @@ from typing import Literal
 
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from TechnicalAnalysis.MarketStructure.utils.ensure_indicator import ensure_indicator
+from TechnicalAnalysis.MarketStructure.utils.safe_div import safe_div
 
 
 class PriceActionStructuralVolatilityBatched:
@@ -91,3 +93,155 @@ class PriceActionStructuralVolatilityBatched:
             f"{prefix}_struct_vol_score": struct_range_atr,
             f"{prefix}_struct_vol": struct_vol,
         }
+
+
+class PriceActionStructuralVolatilityIncremental:
+    """
+    Streaming PriceActionStructuralVolatilityBatched (one bar per
+    update(); bar index = position since the first update).
+    State: last event index and the high / low range since it.
+    """
+
+    def __init__(
+        self,
+        *,
+        event_source: Literal["bos", "mss"],
+        direction: Literal["bull", "bear"],
+        window: int = 10,
+        low_thr: float = 0.6,
+        high_thr: float = 1.3,
+    ):
+        self.event_source = event_source
+        self.direction = direction
+        self.window = window
+        self.low_thr = low_thr
+        self.high_thr = high_thr
+
+        self.t = -1
+        self.event_idx = np.nan
+        self.high_since = np.nan
+        self.low_since = np.nan
+
+    def update(
+        self,
+        *,
+        events: dict[str, object],
+        high: float,
+        low: float,
+        atr: float,
+    ) -> dict[str, object]:
+        p = self.event_source
+        d = self.direction
+        self.t += 1
+
+        if events[f"{p}_{d}_event"]:
+            self.event_idx = self.t
+            self.high_since = high
+            self.low_since = low
+        elif self.event_idx == self.event_idx:
+            if high > self.high_since:
+                self.high_since = high
+            if low < self.low_since:
+                self.low_since = low
+
+        struct_range_atr = safe_div(self.high_since - self.low_since, atr)
+        if not self.t - self.event_idx <= self.window:
+            struct_range_atr = np.nan
+
+        struct_vol = "normal"
+        if struct_range_atr < self.low_thr:
+            struct_vol = "low"
+        if struct_range_atr > self.high_thr:
+            struct_vol = "high"
+
+        prefix = f"{p}_{d}"
+
+        return {
+            f"{prefix}_struct_range_atr": struct_range_atr,
+            f"{prefix}_struct_vol_score": struct_range_atr,
+            f"{prefix}_struct_vol": struct_vol,
+        }
+
+
+# ==================================================
+# Numba kernel (not parallel: pools fork after it runs)
+# ==================================================
+
+STRUCT_VOL_LABELS = np.array(["normal", "low", "high"], dtype=object)
+
+
+@njit(cache=True, error_model="numpy")
+def _structural_vol_numba(event, labels, high, low, atr, window, low_thr, high_thr, range_atr, vol):
+    """
+    labels: df index as float64 (bars since event = label difference,
+    as in the batch version). Writes range_atr (float64, NaN-filled)
+    and vol codes into STRUCT_VOL_LABELS.
+    """
+    event_label = np.nan
+    high_since = np.nan
+    low_since = np.nan
+
+    for t in range(len(event)):
+        if event[t]:
+            event_label = labels[t]
+            high_since = np.nan
+            low_since = np.nan
+
+        # groupby().cummax() / cummin(): NaN rows skipped, NaN out
+        if not np.isnan(high[t]) and (np.isnan(high_since) or high[t] > high_since):
+            high_since = high[t]
+        if not np.isnan(low[t]) and (np.isnan(low_since) or low[t] < low_since):
+            low_since = low[t]
+
+        if labels[t] - event_label <= window and not np.isnan(high[t]) and not np.isnan(low[t]):
+            range_atr[t] = (high_since - low_since) / atr[t]
+
+        if range_atr[t] < low_thr:
+            vol[t] = 1
+        if range_atr[t] > high_thr:
+            vol[t] = 2
+
+
+class PriceActionStructuralVolatilityNumba(PriceActionStructuralVolatilityBatched):
+    """
+    PriceActionStructuralVolatilityBatched in one numba pass (same
+    output; requires a numeric index, as the batch version).
+    """
+
+    def apply(
+        self,
+        *,
+        events: dict[str, pd.Series],
+        df: pd.DataFrame,
+    ) -> dict[str, pd.Series]:
+
+        idx = df.index
+        p = self.event_source
+        d = self.direction
+
+        ensure_indicator(df, indicator="atr", period=self.atr_period)
+
+        range_atr = np.full(len(idx), np.nan)
+        vol = np.zeros(len(idx), dtype=np.int8)
+
+        _structural_vol_numba(
+            events[f"{p}_{d}_event"].to_numpy(dtype=np.bool_),
+            idx.to_numpy(dtype=np.float64),
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["atr"].to_numpy(dtype=np.float64),
+            self.window,
+            self.low_thr,
+            self.high_thr,
+            range_atr,
+            vol,
+        )
+
+        prefix = f"{p}_{d}"
+        struct_range_atr = pd.Series(range_atr, index=idx)
+
+        return {
+            f"{prefix}_struct_range_atr": struct_range_atr,
+            f"{prefix}_struct_vol_score": struct_range_atr,
+            f"{prefix}_struct_vol": pd.Series(STRUCT_VOL_LABELS[vol], index=idx, dtype=object),
+        }
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.graph import NodeCache
+from TechnicalAnalysis.MarketStructure.tests.test_stream import _ohlc
+
+FEATURES = [
+    "pivots", "relations", "fibo", "price_action", "follow_through",
+    "liquidity", "structural_vol", "trend_regime",
+]
+
+
+def test_graph_matches_serial_run_and_memoises_nodes(monkeypatch):
+    monkeypatch.setattr(MarketStructureEngine, "node_cache", NodeCache())
+    cache = MarketStructureEngine.node_cache
+    df = _ohlc(2_000)
+
+    serial = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5, cache=False, max_workers=1)
+    first = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5)
+    pd.testing.assert_frame_equal(first, serial)
+
+    misses = cache.stats()["misses"]
+    again = MarketStructureEngine.apply(df.copy(), features=FEATURES, pivot_range=5)
+    pd.testing.assert_frame_equal(again, serial)
+    assert cache.stats()["misses"] == misses          # equal content -> every node reused
+
+    # new params or data recompute only what depends on them
+    MarketStructureEngine.apply(df, features=FEATURES, pivot_range=7)
+    assert cache.stats()["misses"] == 2 * misses
+
+    changed = df.copy()
+    changed.loc[len(df) - 1, "atr"] *= 2               # only atr readers change
+    before = cache.stats()["misses"]
+    MarketStructureEngine.apply(changed, features=FEATURES, pivot_range=5)
+    assert 0 < cache.stats()["misses"] - before < misses
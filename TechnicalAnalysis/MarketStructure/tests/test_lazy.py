@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pickle
+
+import pandas as pd
+
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.tests.test_stream import _ohlc
+
+FEATURES = [
+    "pivots", "relations", "fibo", "price_action", "follow_through",
+    "liquidity", "structural_vol", "trend_regime",
+]
+
+
+def test_columns_are_computed_on_access_with_their_dependencies():
+    df = _ohlc(2_000)
+    eager = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5, cache=False)
+    lazy = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5, cache=False, lazy=True)
+
+    assert list(lazy.columns) == list(df.columns)
+    assert "bos_bull_event" in lazy and lazy._features.results == {}
+    assert lazy._features.df is df                  # held by reference, not copied
+
+    pd.testing.assert_series_equal(lazy["bos_bull_event"], eager["bos_bull_event"])
+    assert set(lazy._features.results) == {"pivots", "price_action"}
+
+    # copies and row selections share what was computed
+    view = lazy.copy()[lazy["close"] > lazy["close"].median()]
+    pd.testing.assert_series_equal(view["bos_bull_ft_valid"], eager.loc[view.index, "bos_bull_ft_valid"])
+    assert set(lazy._features.results) == {"pivots", "price_action", "follow_through:bos"}
+
+    restored = pickle.loads(pickle.dumps(lazy))
+    pd.testing.assert_series_equal(restored["trend_regime"], eager["trend_regime"])
+
+    full = lazy.materialize()
+    assert type(full) is pd.DataFrame
+    pd.testing.assert_frame_equal(full[eager.columns], eager)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.tests.test_stream import _ohlc
+
+FEATURES = ["pivots", "price_action", "follow_through", "structural_vol", "trend_regime"]
+
+
+def _edgy_ohlc() -> pd.DataFrame:
+    df = _ohlc(4_000, seed=3)
+    # flat stretch (ties in the pivot windows), gaps and a shifted index
+    df.loc[500:540, ["open", "high", "low", "close"]] = 1.2
+    df.loc[[900, 1_700], "high"] = np.nan
+    df.loc[[1_200], "low"] = np.nan
+    df.loc[[2_500], "open"] = np.nan
+    df.loc[[3_000, 3_001], "atr"] = 0.0
+    df.index += 1_000
+    return df
+
+
+@pytest.mark.parametrize("pivot_range", [3, 15])
+def test_numba_backend_matches_pandas(pivot_range):
+    df = _edgy_ohlc()
+    kwargs = dict(features=FEATURES, pivot_range=pivot_range, return_context=True, cache=False)
+
+    pandas_out, pandas_ctx = MarketStructureEngine.apply(df, backend="pandas", **kwargs)
+    numba_out, numba_ctx = MarketStructureEngine.apply(df, backend="numba", **kwargs)
+
+    pd.testing.assert_frame_equal(numba_out, pandas_out)
+    for name, series in pandas_ctx["pivots"].items():
+        pd.testing.assert_series_equal(numba_ctx["pivots"][name], series)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import talib.abstract as ta
+
+from core.live_trading.strategy_adapter import LiveStrategyAdapter
+from core.strategy.BaseStrategy import BaseStrategy
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.utils.incremental_atr import IncrementalATR
+
+FEATURES = ["pivots", "price_action", "follow_through", "structural_vol", "trend_regime"]
+
+
+def _ohlc(n: int = 3_000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = np.r_[close[0], close[:-1]]
+    wick = np.abs(rng.normal(0, 5e-4, (2, n)))
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="5min", tz="UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) + wick[0],
+        "low": np.minimum(open_, close) - wick[1],
+        "close": close,
+    })
+    df["atr"] = ta.ATR(df, 14)
+    return df
+
+
+def test_incremental_atr_matches_talib():
+    df = _ohlc(500)
+    atr = IncrementalATR(14)
+    out = [atr.update(high=h, low=l, close=c) for h, l, c in zip(df["high"], df["low"], df["close"])]
+    np.testing.assert_allclose(out, df["atr"], rtol=1e-12, equal_nan=True)
+
+
+def test_stream_matches_batch_engine():
+    df = _ohlc()
+    batch = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5)
+
+    stream = MarketStructureEngine.stream(features=FEATURES, pivot_range=5)
+    # live-style: the frame grows by a few bars at a time
+    for end in range(1, len(df) + 1, 37):
+        stream.apply(df.iloc[:end])
+    live = stream.apply(df)
+
+    assert list(live.columns) == list(batch.columns)
+    pd.testing.assert_frame_equal(live, batch, check_dtype=False)
+
+
+def test_stream_sliding_window_past_history():
+    df = _ohlc()
+    batch = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5)
+
+    # ring buffers wrap several times
+    stream = MarketStructureEngine.stream(features=FEATURES, pivot_range=5, history=700)
+    window = 500
+    frames = []
+    for end in range(window, len(df) + 1, 53):
+        frames.append(stream.apply(df.iloc[end - window:end]))
+    live = stream.apply(df.iloc[-window:])
+
+    pd.testing.assert_frame_equal(live, batch.iloc[-window:], check_dtype=False)
+    # earlier results are copies, not views of the ring buffers
+    end = window + 53 * (len(frames) - 1)
+    pd.testing.assert_frame_equal(frames[-1], batch.iloc[end - window:end], check_dtype=False)
+
+
+class _LiveStructure(BaseStrategy):
+    def populate_indicators(self):
+        stream = self.live_stream(
+            "base",
+            lambda: MarketStructureEngine.stream(features=FEATURES, pivot_range=5),
+        )
+        self.df = stream.apply(self.df)
+
+
+def test_live_adapter_keeps_stream_across_candles():
+    df = _ohlc(600)
+    strategy = _LiveStructure(df.iloc[:500], "EURUSD", startup_candle_count=0)
+    LiveStrategyAdapter(strategy=strategy)
+    strategy.run_features()
+    stream = strategy._streams["base"]
+
+    # next candles: only the new bars go through the stream
+    strategy.df = df
+    out = strategy.run_features()
+
+    assert strategy._streams["base"] is stream
+    batch = MarketStructureEngine.apply(df, features=FEATURES, pivot_range=5)
+    pd.testing.assert_frame_equal(out, batch, check_dtype=False)
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from numba import njit
 
 
 class PriceActionTrendRegimeBatched:
@@ -121,3 +123,172 @@ class PriceActionTrendRegimeBatched:
             "trend_bias": trend_bias,
             "trend_strength": trend_strength,
         }
+
+
+class PriceActionTrendRegimeIncremental:
+    """
+    Streaming PriceActionTrendRegimeBatched: the batch biases carry
+    no state between bars, so each update() resolves one bar from
+    that bar's inputs alone (missing inputs default to False, as in
+    the batch version).
+    """
+
+    def __init__(self, vol_required: bool = True):
+        self.vol_required = vol_required
+
+    def update(
+        self,
+        *,
+        pivots: dict[str, float],
+        events: dict[str, object],
+        struct_vol: dict[str, object],
+        follow_through: dict[str, object],
+    ) -> dict[str, object]:
+
+        pivot_state = pivots["pivot"]
+
+        struct_bias = 0
+        if pivot_state == 3 or pivot_state == 6:
+            struct_bias = 1
+        if pivot_state == 4 or pivot_state == 5:
+            struct_bias = -1
+
+        event_bias = 0
+        if events.get("bos_bull_event", False) or events.get("mss_bull_event", False):
+            event_bias = 1
+        if events.get("bos_bear_event", False) or events.get("mss_bear_event", False):
+            event_bias = -1
+
+        ft_bias = 0
+        if follow_through.get("bos_bull_ft_valid", False) or follow_through.get("mss_bull_ft_valid", False):
+            ft_bias = 1
+        if follow_through.get("bos_bear_ft_valid", False) or follow_through.get("mss_bear_ft_valid", False):
+            ft_bias = -1
+
+        if self.vol_required:
+            high_vol = any(
+                struct_vol.get(f"{src}_{side}_struct_vol", False) == "high"
+                for src in ("bos", "mss")
+                for side in ("bull", "bear")
+            )
+        else:
+            high_vol = True
+
+        trend_bias = struct_bias + event_bias + ft_bias
+
+        regime = "range"
+        if trend_bias >= 1 and high_vol:
+            regime = "trend_up"
+        if trend_bias <= -1 and high_vol:
+            regime = "trend_down"
+        if abs(trend_bias) >= 1 and not high_vol:
+            regime = "transition"
+
+        return {
+            "trend_regime": regime,
+            "trend_bias": trend_bias,
+            "trend_strength": min(max(abs(trend_bias) / 3.0, 0.0), 1.0),
+        }
+
+
+# ==================================================
+# Numba kernel (not parallel: pools fork after it runs)
+# ==================================================
+
+TREND_REGIME_LABELS = np.array(["range", "trend_up", "trend_down", "transition"])
+
+
+@njit(cache=True, error_model="numpy")
+def _trend_regime_numba(pivot, bull_events, bear_events, bull_ft, bear_ft, high_vol, bias, regime):
+    """
+    Writes trend_bias (int64) and regime codes into TREND_REGIME_LABELS.
+    """
+    for t in range(len(pivot)):
+        p = pivot[t]
+
+        struct_bias = 0
+        if p == 3 or p == 6:
+            struct_bias = 1
+        if p == 4 or p == 5:
+            struct_bias = -1
+
+        event_bias = 0
+        if bull_events[t]:
+            event_bias = 1
+        if bear_events[t]:
+            event_bias = -1
+
+        ft_bias = 0
+        if bull_ft[t]:
+            ft_bias = 1
+        if bear_ft[t]:
+            ft_bias = -1
+
+        b = struct_bias + event_bias + ft_bias
+        bias[t] = b
+
+        code = 0
+        if b >= 1 and high_vol[t]:
+            code = 1
+        if b <= -1 and high_vol[t]:
+            code = 2
+        if abs(b) >= 1 and not high_vol[t]:
+            code = 3
+        regime[t] = code
+
+
+class PriceActionTrendRegimeNumba(PriceActionTrendRegimeBatched):
+    """
+    PriceActionTrendRegimeBatched in one numba pass (same output).
+    """
+
+    def apply(
+        self,
+        *,
+        pivots: dict[str, pd.Series],
+        events: dict[str, pd.Series],
+        struct_vol: dict[str, pd.Series],
+        follow_through: dict[str, pd.Series],
+        df: pd.DataFrame,
+    ) -> dict[str, pd.Series]:
+
+        idx = df.index
+        n = len(idx)
+
+        def flag(source, key):
+            # missing inputs count as False, as in the batch version
+            s = source.get(key)
+            return np.zeros(n, dtype=np.bool_) if s is None else s.to_numpy(dtype=np.bool_, na_value=False)
+
+        def any_flag(source, keys):
+            return np.logical_or.reduce([flag(source, k) for k in keys])
+
+        if self.vol_required:
+            high_vol = np.zeros(n, dtype=np.bool_)
+            for key in ("bos_bull_struct_vol", "bos_bear_struct_vol", "mss_bull_struct_vol", "mss_bear_struct_vol"):
+                if key in struct_vol:
+                    high_vol |= (struct_vol[key] == "high").to_numpy(dtype=np.bool_, na_value=False)
+        else:
+            high_vol = np.ones(n, dtype=np.bool_)
+
+        bias = np.empty(n, dtype=np.int64)
+        regime = np.empty(n, dtype=np.int8)
+
+        _trend_regime_numba(
+            pivots["pivot"].to_numpy(dtype=np.float64),
+            any_flag(events, ("bos_bull_event", "mss_bull_event")),
+            any_flag(events, ("bos_bear_event", "mss_bear_event")),
+            any_flag(follow_through, ("bos_bull_ft_valid", "mss_bull_ft_valid")),
+            any_flag(follow_through, ("bos_bear_ft_valid", "mss_bear_ft_valid")),
+            high_vol,
+            bias,
+            regime,
+        )
+
+        trend_bias = pd.Series(bias, index=idx)
+
+        return {
+            "trend_regime": pd.Series(TREND_REGIME_LABELS[regime], index=idx),
+            "trend_bias": trend_bias,
+            "trend_strength": (trend_bias.abs() / 3.0).clip(0, 1),
+        }
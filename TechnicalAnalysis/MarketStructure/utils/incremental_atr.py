@@ -0,0 +1,38 @@
+import numpy as np
+
+
+class IncrementalATR:
+    """
+    Streaming TA-Lib ATR (Wilder): same values as talib ATR over the
+    same bars. First value at bar `period` (SMA of the true ranges of
+    bars 1..period), NaN before.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.t = -1
+        self.prev_close = np.nan
+        self.tr_sum = 0.0
+        self.value = np.nan
+
+    def update(self, *, high: float, low: float, close: float) -> float:
+        self.t += 1
+        prev_close, self.prev_close = self.prev_close, close
+        if self.t == 0:
+            return np.nan
+
+        tr = high - low
+        if abs(prev_close - high) > tr:
+            tr = abs(prev_close - high)
+        if abs(low - prev_close) > tr:
+            tr = abs(low - prev_close)
+
+        n = self.period
+        if self.t < n:
+            self.tr_sum += tr
+            return np.nan
+        if self.t == n:
+            self.value = (self.tr_sum + tr) / n
+        else:
+            self.value = (self.value * (n - 1) + tr) / n
+        return self.value
@@ -0,0 +1,12 @@
+import numpy as np
+
+
+def safe_div(a: float, b: float) -> float:
+    """
+    Scalar a / b with float64 Series semantics (x / 0 -> ±inf / nan
+    instead of ZeroDivisionError), for the incremental modules.
+    """
+    if b == 0:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(np.float64(a) / np.float64(b))
+    return a / b
@@ -8,14 +8,22 @@ logging.basicConfig(level=logging.INFO)
 # ==================================================
 
 MARKET_DATA_PATH = "market_data"
-BACKTEST_DATA_BACKEND = "dukascopy"   # "dukascopy" | "csv"
+MARKET_DATA_CACHE = "csv"             # "csv" | "parquet" (month partitions)
+MARKET_DATA_MMAP = False              # serve OHLCV from memory-mapped .npy files
+MARKET_DATA_RESAMPLE = False          # build informative timeframes from the cached base one
+MARKET_DATA_VALIDATION = "flag"       # "flag" | "repair" | None (checked once, on cache write)
+                                      # "repair" drops bars (incl. outside the FX session calendar)
+MARKET_DATA_FRAME_CACHE_MB = 0        # in-process LRU of loaded frames (0 = off, e.g. 512)
+FEATURE_STORE = False                 # persist strategy feature stages (<MARKET_DATA_PATH>/features)
+DATA_LOAD_WORKERS = 8                 # concurrent symbol x timeframe loads
+BACKTEST_DATA_BACKEND = "dukascopy"   # "dukascopy" (dukascopy-node) | "dukascopy-bi5" (native) | "csv"
 
 TIMERANGE = {
     "start": "2025-12-01",
     "end":   "2025-12-31",
 }
 
-BACKTEST_MODE = "single"  # "single" | "split"
+BACKTEST_MODE = "single"  # "single" | "split" | "sweep" | "walk_forward"
 
 BACKTEST_WINDOWS = {
     "OPT":   ("2025-12-01", "2025-12-15"),
@@ -23,6 +31,16 @@ BACKTEST_WINDOWS = {
     "FINAL": ("2025-12-24", "2025-12-31"),
 }
 
+# Windows for BACKTEST_MODE = "walk_forward" (generated from TIMERANGE)
+WALK_FORWARD = {
+    "train": "10D",
+    "test": "5D",
+    "step": None,           # None = test length
+    "anchored": False,      # True = train always starts at TIMERANGE start
+    "objective": "expectancy",
+    "min_trades": 5,
+}
+
 # ==================================================
 # STRATEGY
 # ==================================================
@@ -36,6 +54,16 @@ SYMBOLS = [
 
 TIMEFRAME = "M5"
 
+# Parameter grid for BACKTEST_MODE = "sweep"
+# (strategy PARAMS + MAX_RISK_PER_TRADE)
+SWEEP_GRID = {
+    "PIVOT_RANGE": [10, 15, 20],
+    "SL_LOOKBACK": [10, 15, 20],
+    "RR_TP1": [1.0, 1.5],
+    "RR_TP2": [2.0, 3.0],
+    "MAX_RISK_PER_TRADE": [0.005],
+}
+
 # ==================================================
 # EXECUTION (SIMULATED)
 # ==================================================
@@ -44,8 +72,26 @@ INITIAL_BALANCE = 10_000
 SLIPPAGE = 0.1 # PIPS
 MAX_RISK_PER_TRADE = 0.005
 
+BACKTEST_WORKERS = None  # None = os.cpu_count(), 1 = serial
+
+# "symbol"    = symbols simulated independently, fixed account size
+# "portfolio" = one shared balance / clock over all symbols
+BACKTEST_ENGINE = "symbol"
+
+PORTFOLIO = {
+    "COMPOUNDING": True,             # size off realised balance
+    "MAX_OPEN_POSITIONS": 3,         # None = unlimited
+    "MAX_TOTAL_RISK": 0.02,          # open SL risk / balance, None = unlimited
+    "ONE_POSITION_PER_SYMBOL": True, # as PositionManager live
+}
+
+# Lower-timeframe re-play of ambiguous bars (SL/TP touched on one bar)
+INTRABAR_TIMEFRAME = None  # None = bar-level only, e.g. "M1"
+
 SAVE_TRADES_CSV = False
 
+MONTE_CARLO_PATHS = 10_000  # report: resampled trade paths per method
+
 SERVER_TIMEZONE = "UTC"
 
 PLOT_ONLY = False
\ No newline at end of file
@@ -1,37 +1,46 @@
 import traceback
+from collections import defaultdict
 from typing import  Optional
+import numpy as np
 import pandas as pd
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import os
 
-from config.backtest import INITIAL_BALANCE, SLIPPAGE
+from config.backtest import INITIAL_BALANCE, SLIPPAGE, MAX_RISK_PER_TRADE
+from core.backtesting.batch_simulator import (
+    BatchTradeSimulator,
+    extract_entries_from_columns,
+    extract_entries_from_dicts,
+)
+from core.backtesting.hit_index import PriceHitIndex
+from core.backtesting.shared_arrays import SharedArrays, attach_shared_arrays
 from core.backtesting.simulate_exit_numba import simulate_exit_numba
+from core.domain.instruments import get_instrument
 from core.domain.risk import position_sizer_fast
 from core.domain.exit_processor import ExitProcessor
 from core.domain.trade_factory import TradeFactory
-
-INSTRUMENT_META = {
-    "EURUSD": {
-        "point": 0.0001,
-        "pip_value": 10.0,
-    },
-    "XAUUSD": {
-        "point": 0.01,
-        "pip_value": 1.0,
-    },
-    "USTECH100": {
-        "point": 0.01,
-        "pip_value": 1.0,
-        "contract_size": 1,
-    }
-
-}
-
+from core.strategy.signals import has_columnar_entries
 
 class Backtester:
 
-    def __init__(self, slippage: float = 0.0):
+    def __init__(
+            self,
+            slippage: float = 0.0,
+            max_workers: Optional[int] = None,
+            *,
+            max_risk: float = MAX_RISK_PER_TRADE,
+            verbose: bool = True,
+            intrabar=None,
+    ):
+        """
+        intrabar: optional IntrabarResolver; ambiguous bars are
+        re-played on lower-timeframe data (serial path only).
+        """
         self.slippage = slippage
+        self.max_workers = max_workers
+        self.max_risk = max_risk
+        self.verbose = verbose
+        self.intrabar = intrabar
 
     def run_backtest(
             self,
@@ -52,7 +61,83 @@ class Backtester:
             if all_trades else pd.DataFrame()
         )
 
+    def _prepare_symbol(self, df, symbol):
+        """
+        Extracts everything the batch engine needs for one symbol.
+
+        Returns (simulator, entries, arrays) where arrays holds
+        high / low / close / time (naive datetime64) NumPy arrays.
+        """
+        instrument = get_instrument(symbol)
+        point_size = instrument.point
+        pip_value = instrument.pip_value
+
+        if has_columnar_entries(df):
+            entries = extract_entries_from_columns(df)
+        else:
+            entries = extract_entries_from_dicts(
+                df["signal_entry"].values,
+                df["levels"].values,
+            )
+
+        simulator = BatchTradeSimulator(
+            point_size=point_size,
+            pip_value=pip_value,
+            slippage_abs=SLIPPAGE * point_size,
+            max_risk=self.max_risk,
+            account_size=INITIAL_BALANCE,
+        )
+
+        arrays = {
+            "high": df["high"].to_numpy(dtype=np.float64),
+            "low": df["low"].to_numpy(dtype=np.float64),
+            "close": df["close"].to_numpy(dtype=np.float64),
+            "time": df["time"].dt.tz_localize(None).values,
+        }
+
+        return simulator, entries, arrays
+
+    def _refiner(self, symbol, simulator, entries, arrays):
+        """
+        Candidate-exit hook for BatchTradeSimulator (None = bar-level only).
+        """
+        if self.intrabar is None:
+            return None
+
+        def refine(cand):
+            self.intrabar.refine(
+                symbol=symbol,
+                entries=entries,
+                cand=cand,
+                arrays=arrays,
+                slippage_abs=simulator.slippage_abs,
+            )
+
+        return refine
+
     def _backtest_single_symbol(self, df, symbol):
+        simulator, entries, arrays = self._prepare_symbol(df, symbol)
+
+        trades = simulator.run(
+            symbol=symbol,
+            entries=entries,
+            high_arr=arrays["high"],
+            low_arr=arrays["low"],
+            close_arr=arrays["close"],
+            time_arr=arrays["time"],
+            refine=self._refiner(symbol, simulator, entries, arrays),
+        )
+
+        if self.verbose:
+            print(f"✅ Finished backtest for {symbol}, {len(trades)} trades.")
+
+        return trades
+
+    def _backtest_single_symbol_loop(self, df, symbol):
+        """
+        Reference per-entry implementation.
+        Kept for parity checks against BatchTradeSimulator.
+        """
         trades = []
 
         df = df.copy()
@@ -66,9 +151,9 @@ class Backtester:
         signal_arr = df["signal_entry"].values
         levels_arr = df["levels"].values
 
-        meta = INSTRUMENT_META[symbol]
-        point_size = meta["point"]
-        pip_value = meta["pip_value"]
+        instrument = get_instrument(symbol)
+        point_size = instrument.point
+        pip_value = instrument.pip_value
 
         n = len(df)
 
@@ -110,7 +195,7 @@ class Backtester:
                 position_size = position_sizer_fast(
                     entry_price,
                     sl,
-                    max_risk=0.005,
+                    max_risk=self.max_risk,
                     account_size=INITIAL_BALANCE,
                     point_size=point_size,
                     pip_value=pip_value,
@@ -177,30 +262,124 @@ class Backtester:
 
         return pd.DataFrame(trades)
 
-    def run(self) -> pd.DataFrame:
+    # ==================================================
+    # Parallel (symbol × direction) backtest
+    # ==================================================
+
+    def run(
+            self,
+            df: pd.DataFrame,
+            symbol: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Process-parallel equivalent of run_backtest.
+
+        - price arrays (hit-index trees, close, time) are placed in
+          shared memory ONCE per symbol; workers attach zero-copy
+        - work is partitioned by (symbol, direction): last_exit_by_tag
+          state is independent per direction
+        - results are merged in submission order, so output is
+          identical to run_backtest
+        """
+        if symbol:
+            return self._backtest_single_symbol(df, symbol)
 
-        if self.symbol is not None:
-            return self._backtest_single_symbol(self.df, self.symbol)
+        if self.max_workers == 1 or self.intrabar is not None:
+            return self.run_backtest(df)
+
+        prepared = []
+        shared = []
+        jobs = []
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers or os.cpu_count()
+            ) as executor:
+
+                for sym, group_df in df.groupby('symbol'):
+                    simulator, entries, arrays = self._prepare_symbol(group_df, sym)
+                    prepared.append((sym, simulator, entries, arrays))
+
+                    if len(entries) == 0:
+                        continue
+
+                    hit_index = PriceHitIndex(arrays["high"], arrays["low"])
+                    block = SharedArrays({
+                        "high_tree": hit_index.high_tree,
+                        "neg_low_tree": hit_index.neg_low_tree,
+                        "close": arrays["close"],
+                        "time": arrays["time"].view(np.int64),
+                    })
+                    shared.append(block)
+
+                    for dir_flag in (1, -1):
+                        part_idx = np.flatnonzero(entries.direction == dir_flag)
+                        if len(part_idx) == 0:
+                            continue
+
+                        future = executor.submit(
+                            _simulate_partition,
+                            block.spec,
+                            simulator,
+                            entries.take(part_idx),
+                        )
+                        jobs.append((sym, part_idx, future))
+
+                raw_by_symbol = defaultdict(list)
+                for sym, part_idx, future in jobs:
+                    try:
+                        raw = future.result()
+                    except Exception as e:
+                        print(f"❌ Błąd w backteście {sym}: {e}")
+                        traceback.print_exc()
+                        raise
+
+                    raw["src"] = part_idx[raw["src"]]
+                    raw_by_symbol[sym].append(raw)
+
+        finally:
+            for block in shared:
+                block.close()
 
         all_trades = []
-        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-            futures = []
-            for sym, group_df in self.df.groupby('symbol'):
-                futures.append(
-                    executor.submit(
-                        self._backtest_single_symbol,
-                        group_df.copy(), sym
-                    )
+        for sym, simulator, entries, arrays in prepared:
+            parts = raw_by_symbol.get(sym, [])
+            if parts:
+                raw = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+                trades = simulator.to_frame(
+                    symbol=sym,
+                    entries=entries,
+                    raw=raw,
+                    time_arr=arrays["time"],
                 )
+            else:
+                trades = pd.DataFrame()
 
-            for future in as_completed(futures):
-                try:
-                    trades = future.result()
-                    all_trades.append(trades)
-                except Exception as e:
-                    print(f"❌ Błąd w backteście: {e}")
-                    traceback.print_exc()
+            if self.verbose:
+                print(f"✅ Finished backtest for {sym}, {len(trades)} trades.")
+            all_trades.append(trades)
 
         return (
             pd.concat(all_trades).sort_values(by='exit_time')
-            if all_trades else pd.DataFrame())
+            if all_trades else pd.DataFrame()
+        )
+
+
+def _simulate_partition(spec, simulator, entries):
+    """
+    Worker: simulate one (symbol, direction) partition against
+    shared-memory price arrays. Must be top-level for multiprocessing.
+    """
+    with attach_shared_arrays(spec) as arrays:
+        return simulator.simulate(
+            entries=entries,
+            high_arr=None,
+            low_arr=None,
+            close_arr=arrays["close"],
+            time_arr=arrays["time"],
+            hit_index=PriceHitIndex.from_trees(
+                arrays["high_tree"],
+                arrays["neg_low_tree"],
+                n=len(arrays["close"]),
+            ),
+        )
@@ -0,0 +1,756 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from core.backtesting.hit_index import PriceHitIndex, simulate_exit_indexed_numba
+from core.domain.execution import (
+    EXIT_SL,
+    EXIT_TP1_BE,
+    EXIT_TP2,
+    EXIT_EOD,
+    map_exit_code_to_reason,
+)
+
+
+TRADE_COLUMNS = [
+    "symbol",
+    "direction",
+    "entry_time",
+    "exit_time",
+    "entry_price",
+    "exit_price",
+    "position_size",
+    "pnl_usd",
+    "returns",
+    "entry_tag",
+    "exit_tag",
+    "exit_level_tag",
+    "tp1_price",
+    "tp1_time",
+    "tp1_pnl",
+    "tp1_exit_reason",
+    "duration",
+]
+
+
+# ==========================================================
+# Entry arrays (INPUT contract)
+# ==========================================================
+
+@dataclass(frozen=True)
+class EntryArrays:
+    """
+    Pre-extracted entry signals for one symbol.
+
+    All arrays have one element per candidate entry and are
+    sorted by `pos` (bar position in the symbol's price arrays).
+
+    direction : int8     1 = long, -1 = short
+    tag_id    : int64    index into `tags`
+    *_tag     : object   strategy level tags (SL / TP1 / TP2)
+    """
+
+    pos: np.ndarray
+    direction: np.ndarray
+    sl: np.ndarray
+    tp1: np.ndarray
+    tp2: np.ndarray
+    tag_id: np.ndarray
+    tags: tuple[str, ...]
+    sl_tag: np.ndarray
+    tp1_tag: np.ndarray
+    tp2_tag: np.ndarray
+
+    def __len__(self):
+        return len(self.pos)
+
+    def take(self, idx: np.ndarray) -> "EntryArrays":
+        """
+        Subset of entries (tags table is shared).
+        """
+        return EntryArrays(
+            pos=self.pos[idx],
+            direction=self.direction[idx],
+            sl=self.sl[idx],
+            tp1=self.tp1[idx],
+            tp2=self.tp2[idx],
+            tag_id=self.tag_id[idx],
+            tags=self.tags,
+            sl_tag=self.sl_tag[idx],
+            tp1_tag=self.tp1_tag[idx],
+            tp2_tag=self.tp2_tag[idx],
+        )
+
+
+def extract_entries_from_dicts(
+    signal_arr: np.ndarray,
+    levels_arr: np.ndarray,
+) -> EntryArrays:
+    """
+    Build EntryArrays from the dict-based strategy contract
+    (`signal_entry` / `levels` object columns).
+
+    Only candles carrying a signal are visited.
+    """
+    pos, direction, tag_id = [], [], []
+    sl, tp1, tp2 = [], [], []
+    sl_tag, tp1_tag, tp2_tag = [], [], []
+    tags: dict[str, int] = {}
+
+    for i, sig in enumerate(signal_arr):
+        if not isinstance(sig, dict):
+            continue
+
+        d = sig.get("direction")
+        if d == "long":
+            dir_flag = 1
+        elif d == "short":
+            dir_flag = -1
+        else:
+            continue
+
+        levels = levels_arr[i]
+        if not isinstance(levels, dict):
+            continue
+
+        sl_lvl = levels.get("SL") or levels.get(0)
+        tp1_lvl = levels.get("TP1") or levels.get(1)
+        tp2_lvl = levels.get("TP2") or levels.get(2)
+
+        pos.append(i)
+        direction.append(dir_flag)
+        tag_id.append(tags.setdefault(sig["tag"], len(tags)))
+
+        sl.append(sl_lvl["level"])
+        tp1.append(tp1_lvl["level"])
+        tp2.append(tp2_lvl["level"])
+
+        sl_tag.append(sl_lvl["tag"])
+        tp1_tag.append(tp1_lvl["tag"])
+        tp2_tag.append(tp2_lvl["tag"])
+
+    return EntryArrays(
+        pos=np.asarray(pos, dtype=np.int64),
+        direction=np.asarray(direction, dtype=np.int8),
+        sl=np.asarray(sl, dtype=np.float64),
+        tp1=np.asarray(tp1, dtype=np.float64),
+        tp2=np.asarray(tp2, dtype=np.float64),
+        tag_id=np.asarray(tag_id, dtype=np.int64),
+        tags=tuple(tags),
+        sl_tag=np.asarray(sl_tag, dtype=object),
+        tp1_tag=np.asarray(tp1_tag, dtype=object),
+        tp2_tag=np.asarray(tp2_tag, dtype=object),
+    )
+
+
+def extract_entries_from_columns(df: pd.DataFrame) -> EntryArrays:
+    """
+    Build EntryArrays from the typed columnar contract
+    (entry_dir / entry_tag_id / sl / tp1 / tp2 / *_tag_id).
+
+    Fully vectorised. Entries without SL are dropped;
+    missing TP levels (NaN) are simply never hit.
+    """
+    entry_dir = df["entry_dir"].to_numpy()
+    sl = df["sl"].to_numpy(dtype=np.float64)
+
+    mask = ((entry_dir == 1) | (entry_dir == -1)) & ~np.isnan(sl)
+    pos = np.flatnonzero(mask).astype(np.int64)
+
+    tag_cat = df["entry_tag_id"].astype("category")
+    tags = tuple(tag_cat.cat.categories)
+    tag_id = tag_cat.cat.codes.to_numpy()[pos].astype(np.int64)
+
+    missing_tag = tag_id < 0
+    if missing_tag.any():
+        tag_id[missing_tag] = len(tags)
+        tags = tags + ("",)
+
+    def _level_tags(col: str) -> np.ndarray:
+        labels = df[col].astype(object).to_numpy()[pos]
+        return np.where(pd.isna(labels), None, labels).astype(object)
+
+    return EntryArrays(
+        pos=pos,
+        direction=entry_dir[pos].astype(np.int8),
+        sl=sl[pos],
+        tp1=df["tp1"].to_numpy(dtype=np.float64)[pos],
+        tp2=df["tp2"].to_numpy(dtype=np.float64)[pos],
+        tag_id=tag_id,
+        tags=tags,
+        sl_tag=_level_tags("sl_tag_id"),
+        tp1_tag=_level_tags("tp1_tag_id"),
+        tp2_tag=_level_tags("tp2_tag_id"),
+    )
+
+
+# ==========================================================
+# Numba kernel
+# ==========================================================
+
+@njit
+def simulate_trades_batch_numba(
+    entry_pos,
+    entry_dir,
+    entry_sl,
+    entry_tp1,
+    entry_tp2,
+    entry_tag_id,
+    n_tags,
+    high_tree,
+    neg_low_tree,
+    close_arr,
+    time_arr,           # int64 (ns since epoch)
+    slippage_abs,
+):
+    """
+    Simulates every entry of one symbol in a single compiled call.
+    Exits are resolved through PriceHitIndex trees (O(log n) per level).
+
+    Semantics 1:1 with the per-entry loop:
+    - longs first, then shorts (entry order within direction)
+    - an entry is skipped while the previous trade with the same
+      tag and direction is still open (last_exit > entry_time)
+
+    Returns:
+        src:        index into entry arrays (int64)
+        entry_price, exit_price, tp1_price: float64
+        exit_time, tp1_time: int64
+        exit_code: int64
+        tp1_exec:  bool
+    """
+    m = len(entry_pos)
+
+    src = np.empty(m, dtype=np.int64)
+    entry_price_out = np.empty(m, dtype=np.float64)
+    exit_price_out = np.empty(m, dtype=np.float64)
+    exit_time_out = np.empty(m, dtype=np.int64)
+    exit_code_out = np.empty(m, dtype=np.int64)
+    tp1_exec_out = np.empty(m, dtype=np.bool_)
+    tp1_price_out = np.empty(m, dtype=np.float64)
+    tp1_time_out = np.empty(m, dtype=np.int64)
+
+    k = 0
+
+    for dir_flag in (1, -1):
+        last_exit = np.zeros(n_tags, dtype=np.int64)
+        has_exit = np.zeros(n_tags, dtype=np.bool_)
+
+        for j in range(m):
+            if entry_dir[j] != dir_flag:
+                continue
+
+            pos = entry_pos[j]
+            tag = entry_tag_id[j]
+
+            if has_exit[tag] and last_exit[tag] > time_arr[pos]:
+                continue
+
+            entry_price = close_arr[pos]
+            if dir_flag == 1:
+                entry_price += slippage_abs
+            else:
+                entry_price -= slippage_abs
+
+            (
+                exit_price,
+                exit_time,
+                exit_code,
+                tp1_exec,
+                tp1_price,
+                tp1_time,
+            ) = simulate_exit_indexed_numba(
+                dir_flag,
+                pos,
+                entry_price,
+                entry_sl[j],
+                entry_tp1[j],
+                entry_tp2[j],
+                high_tree,
+                neg_low_tree,
+                close_arr,
+                time_arr,
+                slippage_abs,
+            )
+
+            src[k] = j
+            entry_price_out[k] = entry_price
+            exit_price_out[k] = exit_price
+            exit_time_out[k] = exit_time
+            exit_code_out[k] = exit_code
+            tp1_exec_out[k] = tp1_exec
+            tp1_price_out[k] = tp1_price
+            tp1_time_out[k] = tp1_time
+            k += 1
+
+            last_exit[tag] = exit_time
+            has_exit[tag] = True
+
+    return (
+        src[:k],
+        entry_price_out[:k],
+        exit_price_out[:k],
+        exit_time_out[:k],
+        exit_code_out[:k],
+        tp1_exec_out[:k],
+        tp1_price_out[:k],
+        tp1_time_out[:k],
+    )
+
+
+@njit
+def simulate_candidates_numba(
+    entry_pos,
+    entry_dir,
+    entry_sl,
+    entry_tp1,
+    entry_tp2,
+    high_tree,
+    neg_low_tree,
+    close_arr,
+    time_arr,           # int64 (ns since epoch)
+    slippage_abs,
+):
+    """
+    Exit of EVERY candidate entry, ignoring portfolio state.
+
+    Exits depend only on the price path, never on size or on other
+    positions, so they can be resolved up-front and the portfolio
+    kernel only has to decide which candidates are taken.
+    """
+    m = len(entry_pos)
+
+    entry_price_out = np.empty(m, dtype=np.float64)
+    exit_price_out = np.empty(m, dtype=np.float64)
+    exit_time_out = np.empty(m, dtype=np.int64)
+    exit_code_out = np.empty(m, dtype=np.int64)
+    tp1_exec_out = np.empty(m, dtype=np.bool_)
+    tp1_price_out = np.empty(m, dtype=np.float64)
+    tp1_time_out = np.empty(m, dtype=np.int64)
+
+    for j in range(m):
+        dir_flag = entry_dir[j]
+        pos = entry_pos[j]
+
+        entry_price = close_arr[pos]
+        if dir_flag == 1:
+            entry_price += slippage_abs
+        else:
+            entry_price -= slippage_abs
+
+        (
+            exit_price,
+            exit_time,
+            exit_code,
+            tp1_exec,
+            tp1_price,
+            tp1_time,
+        ) = simulate_exit_indexed_numba(
+            dir_flag,
+            pos,
+            entry_price,
+            entry_sl[j],
+            entry_tp1[j],
+            entry_tp2[j],
+            high_tree,
+            neg_low_tree,
+            close_arr,
+            time_arr,
+            slippage_abs,
+        )
+
+        entry_price_out[j] = entry_price
+        exit_price_out[j] = exit_price
+        exit_time_out[j] = exit_time
+        exit_code_out[j] = exit_code
+        tp1_exec_out[j] = tp1_exec
+        tp1_price_out[j] = tp1_price
+        tp1_time_out[j] = tp1_time
+
+    return (
+        entry_price_out,
+        exit_price_out,
+        exit_time_out,
+        exit_code_out,
+        tp1_exec_out,
+        tp1_price_out,
+        tp1_time_out,
+    )
+
+
+@njit
+def admit_candidates_numba(
+    entry_dir,
+    entry_tag_id,
+    n_tags,
+    entry_time,         # int64, per candidate
+    exit_time,          # int64, per candidate
+):
+    """
+    Same admission rule as simulate_trades_batch_numba, applied to
+    pre-resolved candidate exits: longs first, then shorts; an entry
+    is skipped while the previous trade with the same tag and
+    direction is still open.
+
+    Returns indices of admitted candidates.
+    """
+    m = len(entry_dir)
+    src = np.empty(m, dtype=np.int64)
+    k = 0
+
+    for dir_flag in (1, -1):
+        last_exit = np.zeros(n_tags, dtype=np.int64)
+        has_exit = np.zeros(n_tags, dtype=np.bool_)
+
+        for j in range(m):
+            if entry_dir[j] != dir_flag:
+                continue
+
+            tag = entry_tag_id[j]
+            if has_exit[tag] and last_exit[tag] > entry_time[j]:
+                continue
+
+            src[k] = j
+            k += 1
+            last_exit[tag] = exit_time[j]
+            has_exit[tag] = True
+
+    return src[:k]
+
+
+# ==========================================================
+# Batch simulator (columnar OUTPUT)
+# ==========================================================
+
+_EXIT_REASONS = {
+    code: map_exit_code_to_reason(
+        exit_code=code,
+        tp1_executed=False,
+        exit_price=0.0,
+        entry_price=0.0,
+    ).value
+    for code in (EXIT_SL, EXIT_TP1_BE, EXIT_TP2, EXIT_EOD)
+}
+
+
+class BatchTradeSimulator:
+    """
+    Columnar replacement for the per-entry
+    simulate_exit_numba → ExitProcessor → TradeFactory chain.
+
+    Exit simulation runs in one numba call; sizing, PnL and
+    exit tags are vectorised with the exact same float operation
+    order as Trade / ExitProcessor, so results are bit-identical.
+    """
+
+    def __init__(
+        self,
+        *,
+        point_size: float,
+        pip_value: float,
+        slippage_abs: float,
+        max_risk: float,
+        account_size: float,
+    ):
+        self.point_size = point_size
+        self.pip_value = pip_value
+        self.slippage_abs = slippage_abs
+        self.max_risk = max_risk
+        self.account_size = account_size
+
+    def simulate(
+        self,
+        *,
+        entries: EntryArrays,
+        high_arr: np.ndarray | None,
+        low_arr: np.ndarray | None,
+        close_arr: np.ndarray,
+        time_arr: np.ndarray,
+        hit_index: PriceHitIndex | None = None,
+        refine: Callable[[dict[str, np.ndarray]], None] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Returns raw kernel output keyed by name (one row per trade).
+
+        hit_index may be passed in to reuse one index per symbol
+        across several simulate() calls.
+
+        refine (optional) receives the exits of ALL candidates and may
+        rewrite them in place (e.g. intra-bar resolution) BEFORE the
+        same-tag admission rule is applied.
+        """
+        time_ns = np.ascontiguousarray(time_arr).view(np.int64)
+
+        if hit_index is None:
+            hit_index = PriceHitIndex(high_arr, low_arr)
+
+        if refine is not None:
+            cand = self.simulate_candidates(
+                entries=entries,
+                close_arr=close_arr,
+                time_arr=time_arr,
+                hit_index=hit_index,
+            )
+            refine(cand)
+
+            src = admit_candidates_numba(
+                entries.direction,
+                entries.tag_id,
+                max(len(entries.tags), 1),
+                time_ns[entries.pos],
+                cand["exit_time"],
+            )
+            return {k: v[src] for k, v in cand.items()}
+
+        (
+            src,
+            entry_price,
+            exit_price,
+            exit_time,
+            exit_code,
+            tp1_exec,
+            tp1_price,
+            tp1_time,
+        ) = simulate_trades_batch_numba(
+            entries.pos,
+            entries.direction,
+            entries.sl,
+            entries.tp1,
+            entries.tp2,
+            entries.tag_id,
+            max(len(entries.tags), 1),
+            hit_index.high_tree,
+            hit_index.neg_low_tree,
+            np.ascontiguousarray(close_arr, dtype=np.float64),
+            time_ns,
+            self.slippage_abs,
+        )
+
+        return {
+            "src": src,
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "exit_time": exit_time,
+            "exit_code": exit_code,
+            "tp1_exec": tp1_exec,
+            "tp1_price": tp1_price,
+            "tp1_time": tp1_time,
+        }
+
+    def simulate_candidates(
+        self,
+        *,
+        entries: EntryArrays,
+        close_arr: np.ndarray,
+        time_arr: np.ndarray,
+        hit_index: PriceHitIndex,
+    ) -> dict[str, np.ndarray]:
+        """
+        Exits of EVERY candidate entry (no admission rule).
+        Same keys as simulate(); src = candidate index.
+        """
+        (
+            entry_price,
+            exit_price,
+            exit_time,
+            exit_code,
+            tp1_exec,
+            tp1_price,
+            tp1_time,
+        ) = simulate_candidates_numba(
+            entries.pos,
+            entries.direction,
+            entries.sl,
+            entries.tp1,
+            entries.tp2,
+            hit_index.high_tree,
+            hit_index.neg_low_tree,
+            np.ascontiguousarray(close_arr, dtype=np.float64),
+            np.ascontiguousarray(time_arr).view(np.int64),
+            self.slippage_abs,
+        )
+
+        return {
+            "src": np.arange(len(entries), dtype=np.int64),
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "exit_time": exit_time,
+            "exit_code": exit_code,
+            "tp1_exec": tp1_exec,
+            "tp1_price": tp1_price,
+            "tp1_time": tp1_time,
+        }
+
+    def run(
+        self,
+        *,
+        symbol: str,
+        entries: EntryArrays,
+        high_arr: np.ndarray,
+        low_arr: np.ndarray,
+        close_arr: np.ndarray,
+        time_arr: np.ndarray,
+        hit_index: PriceHitIndex | None = None,
+        refine: Callable[[dict[str, np.ndarray]], None] | None = None,
+    ) -> pd.DataFrame:
+
+        if len(entries) == 0:
+            return pd.DataFrame()
+
+        raw = self.simulate(
+            entries=entries,
+            high_arr=high_arr,
+            low_arr=low_arr,
+            close_arr=close_arr,
+            time_arr=time_arr,
+            hit_index=hit_index,
+            refine=refine,
+        )
+
+        return self.to_frame(
+            symbol=symbol,
+            entries=entries,
+            raw=raw,
+            time_arr=time_arr,
+        )
+
+    # ==================================================
+    # Columnar trade building
+    # ==================================================
+
+    def to_frame(
+        self,
+        *,
+        symbol: str,
+        entries: EntryArrays,
+        raw: dict[str, np.ndarray],
+        time_arr: np.ndarray,
+        position_size: np.ndarray | None = None,
+    ) -> pd.DataFrame:
+        """
+        position_size overrides fixed-account sizing
+        (e.g. portfolio engine sizing off running balance).
+        """
+
+        src = raw["src"]
+        n = len(src)
+        if n == 0:
+            return pd.DataFrame()
+
+        point_size = self.point_size
+        pip_value = self.pip_value
+
+        is_long = entries.direction[src] == 1
+        sl = entries.sl[src]
+        tp1 = entries.tp1[src]
+
+        entry_price = raw["entry_price"]
+        exit_price = raw["exit_price"]
+        exit_code = raw["exit_code"]
+        tp1_exec = raw["tp1_exec"]
+
+        # --------------------------------------------------
+        # POSITION SIZE (position_sizer_fast)
+        # --------------------------------------------------
+        if position_size is None:
+            risk_amount = self.max_risk * self.account_size
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pip_distance = np.abs(entry_price - sl) / point_size
+                lot = risk_amount / (pip_distance * pip_value)
+            position_size = np.where(entry_price == sl, 0.0, np.round(lot, 3))
+
+        # --------------------------------------------------
+        # TP1 PNL (ExitProcessor)
+        # --------------------------------------------------
+        tp1_gain = np.where(is_long, tp1 - entry_price, entry_price - tp1)
+        tp1_pnl = np.where(
+            tp1_exec,
+            tp1_gain / point_size * pip_value * position_size * 0.5,
+            0.0,
+        )
+
+        # --------------------------------------------------
+        # TOTAL PNL (Trade._compute_pnl)
+        # --------------------------------------------------
+        exit_diff = np.where(
+            is_long,
+            exit_price - entry_price,
+            entry_price - exit_price,
+        )
+        pips1 = tp1_gain / point_size
+        pips2 = exit_diff / point_size
+
+        pnl_usd = np.where(
+            tp1_exec,
+            pips1 * pip_value * position_size * 0.5
+            + pips2 * pip_value * position_size * 0.5,
+            pips2 * pip_value * position_size,
+        )
+
+        # --------------------------------------------------
+        # RETURNS (R multiple)
+        # --------------------------------------------------
+        risk_usd = np.abs(entry_price - sl) / point_size * pip_value * position_size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(risk_usd > 0, pnl_usd / risk_usd, 0.0)
+
+        # --------------------------------------------------
+        # TIMES
+        # --------------------------------------------------
+        time_dtype = np.asarray(time_arr).dtype
+        entry_time = np.asarray(time_arr)[entries.pos[src]]
+        exit_time = raw["exit_time"].view(time_dtype)
+        tp1_time = raw["tp1_time"].view(time_dtype)
+
+        duration = (exit_time - entry_time) / np.timedelta64(1, "s")
+
+        # --------------------------------------------------
+        # TAGS
+        # --------------------------------------------------
+        tags = np.asarray(entries.tags, dtype=object)
+
+        exit_tag = np.full(n, "UNKNOWN", dtype=object)
+        exit_level_tag = np.full(n, None, dtype=object)
+        for code, reason in _EXIT_REASONS.items():
+            exit_tag[exit_code == code] = reason
+
+        for code, level_tags in (
+            (EXIT_SL, entries.sl_tag),
+            (EXIT_TP2, entries.tp2_tag),
+            (EXIT_TP1_BE, entries.tp1_tag),
+        ):
+            hit = exit_code == code
+            exit_level_tag[hit] = level_tags[src[hit]]
+
+        # optional TP1 fields: None when TP1 was not executed
+        tp1_price_col = np.full(n, None, dtype=object)
+        tp1_price_col[tp1_exec] = raw["tp1_price"][tp1_exec]
+        tp1_time_col = np.full(n, None, dtype=object)
+        tp1_time_col[tp1_exec] = list(tp1_time[tp1_exec])
+
+        trades = pd.DataFrame({
+            "symbol": np.full(n, symbol, dtype=object),
+            "direction": np.where(is_long, "long", "short").astype(object),
+            "entry_time": entry_time,
+            "exit_time": exit_time,
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "position_size": position_size,
+            "pnl_usd": pnl_usd,
+            "returns": returns,
+            "entry_tag": tags[entries.tag_id[src]],
+            "exit_tag": exit_tag,
+            "exit_level_tag": exit_level_tag,
+            "tp1_price": tp1_price_col,
+            "tp1_time": tp1_time_col,
+            "tp1_pnl": tp1_pnl,
+            "tp1_exit_reason": np.full(n, None, dtype=object),
+            "duration": duration,
+        })
+
+        return trades.infer_objects()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+from core.backtesting.simulate_exit_numba import (
+    EXIT_SL,
+    EXIT_TP1_BE,
+    EXIT_TP2,
+    EXIT_EOD,
+)
+
+
+# ==========================================================
+# Max segment tree ("first bar where value >= x after i")
+# ==========================================================
+
+@njit
+def build_max_tree(values):
+    """
+    Iterative max segment tree over `values`.
+
+    Layout: node 1 = root, leaves at [size, size + n).
+    Padding and NaN leaves are -inf so they never satisfy a query
+    (a NaN would otherwise win the comparison below and hide its
+    sibling's real maximum).
+    """
+    n = len(values)
+    size = 1
+    while size < max(n, 1):
+        size *= 2
+
+    tree = np.full(2 * size, -np.inf, dtype=np.float64)
+    for i in range(n):
+        if not np.isnan(values[i]):
+            tree[size + i] = values[i]
+
+    for i in range(size - 1, 0, -1):
+        left = tree[2 * i]
+        right = tree[2 * i + 1]
+        tree[i] = left if left >= right else right
+
+    return tree
+
+
+@njit
+def first_ge(tree, n, start, x):
+    """
+    First index j >= start with values[j] >= x, or n if none.
+    O(log n). NaN x never matches.
+    """
+    if start >= n:
+        return n
+
+    size = len(tree) // 2
+    i = start + size
+
+    while True:
+        if tree[i] >= x:
+            break
+
+        # climb while i is a right child (its range ends a subtree)
+        while i & 1:
+            i >>= 1
+        if i == 0:
+            return n
+        i += 1
+
+    while i < size:
+        i *= 2
+        if not tree[i] >= x:
+            i += 1
+
+    j = i - size
+    return j if j < n else n
+
+
+class PriceHitIndex:
+    """
+    Per-symbol "next-hit" index over high / low arrays.
+
+    Built once per symbol in O(n); answers
+    "first bar >= i where high >= x" and
+    "first bar >= i where low <= x" in O(log n).
+
+    Low side is stored negated (low <= x  <=>  -low >= -x),
+    which is exact in IEEE arithmetic.
+    """
+
+    def __init__(self, high_arr: np.ndarray, low_arr: np.ndarray):
+        high = np.ascontiguousarray(high_arr, dtype=np.float64)
+        low = np.ascontiguousarray(low_arr, dtype=np.float64)
+
+        self.n = len(high)
+        self.high_tree = build_max_tree(high)
+        self.neg_low_tree = build_max_tree(-low)
+
+    @classmethod
+    def from_trees(cls, high_tree: np.ndarray, neg_low_tree: np.ndarray, *, n: int):
+        """
+        Rebuilds an index around prebuilt trees (e.g. shared memory views).
+        """
+        index = cls.__new__(cls)
+        index.n = n
+        index.high_tree = high_tree
+        index.neg_low_tree = neg_low_tree
+        return index
+
+    def first_high_ge(self, start: int, x: float) -> int:
+        return first_ge(self.high_tree, self.n, start, x)
+
+    def first_low_le(self, start: int, x: float) -> int:
+        return first_ge(self.neg_low_tree, self.n, start, -x)
+
+
+# ==========================================================
+# Indexed exit simulation
+# ==========================================================
+
+@njit
+def _first_touch(direction, high_tree, neg_low_tree, n, start, level, favourable):
+    """
+    favourable=True  → TP side (long: high >= level, short: low <= level)
+    favourable=False → SL side (long: low <= level, short: high >= level)
+    """
+    if (direction == 1) == favourable:
+        return first_ge(high_tree, n, start, level)
+    return first_ge(neg_low_tree, n, start, -level)
+
+
+@njit
+def simulate_exit_indexed_numba(
+    direction,          # 1 = long, -1 = short
+    entry_pos,
+    entry_price,
+    sl_level,
+    tp1_level,
+    tp2_level,
+    high_tree,
+    neg_low_tree,
+    close_arr,
+    time_arr,
+    slippage_abs,
+):
+    """
+    Same contract and results as simulate_exit_numba,
+    but jumps between candidate bars using PriceHitIndex trees.
+
+    Intra-bar ordering preserved:
+    1. TP1 (partial)
+    2. SL (original SL on the TP1 bar, BE from the next bar)
+    3. TP2
+    """
+    n = len(close_arr)
+    start = entry_pos + 1
+
+    tp1_executed = False
+    tp1_price = 0.0
+    tp1_time = time_arr[0]
+
+    # -------------------------------------------------
+    # PHASE 1: BEFORE TP1 (original SL)
+    # -------------------------------------------------
+    a = _first_touch(direction, high_tree, neg_low_tree, n, start, tp1_level, True)
+    b = _first_touch(direction, high_tree, neg_low_tree, n, start, sl_level, False)
+    c = _first_touch(direction, high_tree, neg_low_tree, n, start, tp2_level, True)
+
+    e = min(a, min(b, c))
+    if e >= n:
+        return close_arr[-1], time_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_time
+
+    t = time_arr[e]
+
+    if a == e:
+        tp1_executed = True
+        tp1_price = tp1_level
+        tp1_time = t
+
+    if b == e:
+        exit_code = EXIT_TP1_BE if tp1_executed else EXIT_SL
+        exit_price = sl_level - slippage_abs if direction == 1 else sl_level + slippage_abs
+        return exit_price, t, exit_code, tp1_executed, tp1_price, tp1_time
+
+    if c == e:
+        return tp2_level, t, EXIT_TP2, tp1_executed, tp1_price, tp1_time
+
+    # -------------------------------------------------
+    # PHASE 2: AFTER TP1 (SL moved to BE)
+    # -------------------------------------------------
+    start = e + 1
+    sl = entry_price
+
+    b = _first_touch(direction, high_tree, neg_low_tree, n, start, sl, False)
+    c = _first_touch(direction, high_tree, neg_low_tree, n, start, tp2_level, True)
+
+    if b >= n and c >= n:
+        return close_arr[-1], time_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_time
+
+    if b <= c:
+        exit_price = sl - slippage_abs if direction == 1 else sl + slippage_abs
+        return exit_price, time_arr[b], EXIT_TP1_BE, tp1_executed, tp1_price, tp1_time
+
+    return tp2_level, time_arr[c], EXIT_TP2, tp1_executed, tp1_price, tp1_time
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from core.backtesting.batch_simulator import EntryArrays
+from core.domain.execution import EXIT_SL, EXIT_TP1_BE, EXIT_TP2
+
+
+# ==========================================================
+# Lower-timeframe path kernel
+# ==========================================================
+
+@njit
+def resolve_path_numba(
+    direction,          # 1 = long, -1 = short
+    entry_price,
+    sl_level,
+    tp1_level,
+    tp2_level,
+    tp1_done,           # TP1 already executed before this path
+    high_arr,
+    low_arr,
+    time_arr,           # int64 (ns)
+    slippage_abs,
+):
+    """
+    Walks lower-timeframe bars of ONE higher-timeframe bar with the
+    same rules as simulate_exit_numba (TP1 → SL → TP2 per bar,
+    BE from the bar after TP1).
+
+    Returns:
+        exited, exit_price, exit_time, exit_code,
+        tp1_executed, tp1_price, tp1_time
+    """
+    tp1_executed = tp1_done
+    tp1_price = 0.0
+    tp1_time = np.int64(0)
+    tp1_this_path = False
+
+    sl = entry_price if tp1_done else sl_level
+
+    for i in range(len(high_arr)):
+        high = high_arr[i]
+        low = low_arr[i]
+        t = time_arr[i]
+
+        if tp1_this_path:
+            sl = entry_price
+
+        if direction == 1:
+            if (not tp1_executed) and high >= tp1_level:
+                tp1_executed = True
+                tp1_this_path = True
+                tp1_price = tp1_level
+                tp1_time = t
+
+            if low <= sl:
+                code = EXIT_TP1_BE if tp1_executed else EXIT_SL
+                return True, sl - slippage_abs, t, code, tp1_executed, tp1_price, tp1_time
+
+            if high >= tp2_level:
+                return True, tp2_level, t, EXIT_TP2, tp1_executed, tp1_price, tp1_time
+
+        else:
+            if (not tp1_executed) and low <= tp1_level:
+                tp1_executed = True
+                tp1_this_path = True
+                tp1_price = tp1_level
+                tp1_time = t
+
+            if high >= sl:
+                code = EXIT_TP1_BE if tp1_executed else EXIT_SL
+                return True, sl + slippage_abs, t, code, tp1_executed, tp1_price, tp1_time
+
+            if low <= tp2_level:
+                return True, tp2_level, t, EXIT_TP2, tp1_executed, tp1_price, tp1_time
+
+    return False, 0.0, np.int64(0), 0, tp1_executed, tp1_price, tp1_time
+
+
+# ==========================================================
+# Lazy lower-timeframe feed
+# ==========================================================
+
+class LowerTimeframeFeed:
+    """
+    Lazily loaded, cached lower-timeframe bars for one symbol.
+
+    Data is fetched through the provider in `chunk`-sized pieces
+    (default one day) only when a bar inside that chunk is needed;
+    at most `max_chunks` chunks are kept (LRU).
+
+    Tick data fits the same contract as bars with high == low == price.
+    """
+
+    def __init__(
+        self,
+        *,
+        provider,
+        symbol: str,
+        timeframe: str = "M1",
+        chunk: str = "1D",
+        max_chunks: int = 64,
+    ):
+        self.provider = provider
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.chunk = pd.Timedelta(chunk)
+        self.max_chunks = max_chunks
+
+        self._chunks: OrderedDict[int, tuple] = OrderedDict()
+        self.loads = 0
+
+    def _load_chunk(self, key: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+
+        start = pd.Timestamp(key, tz="UTC")
+        df = self.provider.get_ohlcv(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            start=start,
+            end=start + self.chunk,
+        )
+        self.loads += 1
+
+        time_ns = (
+            pd.to_datetime(df["time"], utc=True)
+            .dt.tz_localize(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view(np.int64)
+        )
+        data = (
+            time_ns,
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+        )
+
+        self._chunks[key] = data
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+
+        return data
+
+    def bars(self, start_ns: int, end_ns: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (time_ns, high, low) of bars with start <= time < end.
+        """
+        step = self.chunk.value
+        parts = []
+
+        for key in range(start_ns - start_ns % step, end_ns, step):
+            time_ns, high, low = self._load_chunk(key)
+            lo, hi = np.searchsorted(time_ns, [start_ns, end_ns])
+            parts.append((time_ns[lo:hi], high[lo:hi], low[lo:hi]))
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return tuple(np.concatenate([p[i] for p in parts]) for i in range(3))
+
+
+# ==========================================================
+# Resolver
+# ==========================================================
+
+class IntrabarResolver:
+    """
+    Optional high-fidelity fill model.
+
+    The bar-level engine settles a bar where several levels are
+    touched by a fixed rule (TP1 → SL → TP2, BE from the next bar).
+    Only bars where that rule can be wrong are re-played on
+    lower-timeframe data:
+
+    A) exit bar of an SL / BE exit that also touched TP1 or TP2
+    B) TP1 bar that also touched break-even (BE may have been hit
+       after TP1 inside the bar)
+
+    Everything else keeps the bar-level result, so only the few
+    ambiguous bars pay for lower-timeframe I/O.
+    """
+
+    def __init__(self, provider, *, timeframe: str = "M1", chunk: str = "1D", max_chunks: int = 64):
+        self.provider = provider
+        self.timeframe = timeframe
+        self.chunk = chunk
+        self.max_chunks = max_chunks
+
+        self._feeds: dict[str, LowerTimeframeFeed] = {}
+        self.resolved = 0
+        self.ambiguous = 0
+
+    def feed(self, symbol: str) -> LowerTimeframeFeed:
+        if symbol not in self._feeds:
+            self._feeds[symbol] = LowerTimeframeFeed(
+                provider=self.provider,
+                symbol=symbol,
+                timeframe=self.timeframe,
+                chunk=self.chunk,
+                max_chunks=self.max_chunks,
+            )
+        return self._feeds[symbol]
+
+    # --------------------------------------------------
+    # Detection (vectorised)
+    # --------------------------------------------------
+
+    @staticmethod
+    def find_ambiguous(
+        entries: EntryArrays,
+        cand: dict[str, np.ndarray],
+        high_arr: np.ndarray,
+        low_arr: np.ndarray,
+        time_ns: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (candidate index, bar position) of every ambiguous bar.
+        """
+        is_long = entries.direction == 1
+        exit_code = cand["exit_code"]
+        tp1_exec = cand["tp1_exec"]
+
+        exit_bar = np.searchsorted(time_ns, cand["exit_time"])
+        exit_bar = np.minimum(exit_bar, len(time_ns) - 1)
+
+        # A) adverse exit with a favourable level on the same bar
+        adverse = (exit_code == EXIT_SL) | (exit_code == EXIT_TP1_BE)
+        tp1_same_bar = tp1_exec & (cand["tp1_time"] == cand["exit_time"])
+        tp2_touched = np.where(
+            is_long,
+            high_arr[exit_bar] >= entries.tp2,
+            low_arr[exit_bar] <= entries.tp2,
+        )
+        exit_ambiguous = adverse & (tp1_same_bar | tp2_touched)
+
+        # B) TP1 bar that also touched break-even
+        tp1_bar = np.searchsorted(time_ns, cand["tp1_time"])
+        tp1_bar = np.minimum(tp1_bar, len(time_ns) - 1)
+        be_touched = np.where(
+            is_long,
+            low_arr[tp1_bar] <= cand["entry_price"],
+            high_arr[tp1_bar] >= cand["entry_price"],
+        )
+        tp1_ambiguous = tp1_exec & be_touched
+
+        idx_a = np.flatnonzero(exit_ambiguous)
+        idx_b = np.flatnonzero(tp1_ambiguous & ~exit_ambiguous)
+
+        return (
+            np.concatenate([idx_a, idx_b]),
+            np.concatenate([exit_bar[idx_a], tp1_bar[idx_b]]),
+        )
+
+    # --------------------------------------------------
+    # Refinement
+    # --------------------------------------------------
+
+    def refine(
+        self,
+        *,
+        symbol: str,
+        entries: EntryArrays,
+        cand: dict[str, np.ndarray],
+        arrays: dict[str, np.ndarray],
+        slippage_abs: float,
+    ) -> None:
+        """
+        Rewrites candidate exits (in place) for ambiguous bars.
+        """
+        # candidate times share the unit of arrays["time"]; the feed is ns
+        time_arr = np.ascontiguousarray(arrays["time"])
+        time_int = time_arr.view(np.int64)
+        time_ns = time_arr.astype("datetime64[ns]").view(np.int64)
+
+        idx, bars = self.find_ambiguous(
+            entries, cand, arrays["high"], arrays["low"], time_int
+        )
+        self.ambiguous += len(idx)
+
+        if len(idx) == 0:
+            return
+
+        bar_ns = int(np.median(np.diff(time_ns))) if len(time_ns) > 1 else 0
+        feed = self.feed(symbol)
+
+        for j, bar in zip(idx, bars):
+            start = time_ns[bar]
+            end = start + bar_ns
+            if bar + 1 < len(time_ns):
+                end = min(end, time_ns[bar + 1])
+
+            ltf_time, ltf_high, ltf_low = feed.bars(start, end)
+            if len(ltf_time) == 0:
+                continue
+
+            ltf_time = ltf_time.view("datetime64[ns]").astype(time_arr.dtype).view(np.int64)
+            tp1_done = bool(cand["tp1_exec"][j]) and cand["tp1_time"][j] < time_int[bar]
+
+            (
+                exited,
+                exit_price,
+                exit_time,
+                exit_code,
+                tp1_exec,
+                tp1_price,
+                tp1_time,
+            ) = resolve_path_numba(
+                int(entries.direction[j]),
+                cand["entry_price"][j],
+                entries.sl[j],
+                entries.tp1[j],
+                entries.tp2[j],
+                tp1_done,
+                ltf_high,
+                ltf_low,
+                ltf_time,
+                slippage_abs,
+            )
+
+            # no exit on lower TF: either the bar-level continuation
+            # was right (B) or the data disagree (A) → keep bar result
+            if not exited:
+                continue
+
+            cand["exit_price"][j] = exit_price
+            cand["exit_time"][j] = exit_time
+            cand["exit_code"][j] = exit_code
+            cand["tp1_exec"][j] = tp1_exec
+            if tp1_exec and not tp1_done:
+                cand["tp1_price"][j] = tp1_price
+                cand["tp1_time"][j] = tp1_time
+
+            self.resolved += 1
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from config.backtest import INITIAL_BALANCE
+from core.backtesting.backtester import Backtester
+from core.backtesting.hit_index import PriceHitIndex
+
+
+# Rejection codes (portfolio_kernel_numba)
+TAKEN = 0
+REJECT_SAME_TAG = 1
+REJECT_SYMBOL_BUSY = 2
+REJECT_MAX_POSITIONS = 3
+REJECT_MAX_RISK = 4
+
+REJECT_REASONS = {
+    REJECT_SAME_TAG: "same tag still open",
+    REJECT_SYMBOL_BUSY: "symbol already in position",
+    REJECT_MAX_POSITIONS: "max open positions",
+    REJECT_MAX_RISK: "max total risk",
+}
+
+
+# ==========================================================
+# Merged-timeline portfolio kernel
+# ==========================================================
+
+@njit
+def _heap_push(heap_t, heap_e, size, t, e):
+    i = size
+    heap_t[i] = t
+    heap_e[i] = e
+    while i > 0:
+        parent = (i - 1) >> 1
+        if (heap_t[parent], heap_e[parent]) <= (heap_t[i], heap_e[i]):
+            break
+        heap_t[i], heap_t[parent] = heap_t[parent], heap_t[i]
+        heap_e[i], heap_e[parent] = heap_e[parent], heap_e[i]
+        i = parent
+    return size + 1
+
+
+@njit
+def _heap_pop(heap_t, heap_e, size):
+    e = heap_e[0]
+    size -= 1
+    heap_t[0] = heap_t[size]
+    heap_e[0] = heap_e[size]
+
+    i = 0
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < size and (heap_t[left], heap_e[left]) < (heap_t[smallest], heap_e[smallest]):
+            smallest = left
+        if right < size and (heap_t[right], heap_e[right]) < (heap_t[smallest], heap_e[smallest]):
+            smallest = right
+        if smallest == i:
+            break
+        heap_t[i], heap_t[smallest] = heap_t[smallest], heap_t[i]
+        heap_e[i], heap_e[smallest] = heap_e[smallest], heap_e[i]
+        i = smallest
+
+    return e, size
+
+
+@njit
+def portfolio_kernel_numba(
+    entry_time,         # int64, candidates sorted by entry time
+    exit_time,
+    tp1_time,
+    tp1_exec,
+    entry_price,
+    entry_sl,
+    tp1_gain,           # price gain at TP1 (direction-adjusted)
+    exit_diff,          # price gain at final exit (direction-adjusted)
+    point_size,
+    pip_value,
+    sym_id,
+    dedupe_key,         # (symbol, direction, tag) id
+    n_symbols,
+    n_keys,
+    initial_balance,
+    max_risk,
+    compounding,
+    max_positions,      # <= 0: unlimited
+    max_total_risk,     # <= 0: unlimited (fraction of balance)
+    one_per_symbol,
+):
+    """
+    One clock over all symbols.
+
+    Events (TP1 partial, final exit) are kept in a min-heap and
+    realised into the balance before every entry at or after their
+    time. Each candidate is then checked against:
+    - same (symbol, direction, tag) still open   (Backtester rule)
+    - one position per symbol                     (PositionManager rule)
+    - max open positions
+    - max total open risk (SL distance × size; zero after TP1 → BE)
+
+    Size is position_sizer_fast on the current balance
+    (or initial balance without compounding).
+
+    Returns position_size, status (TAKEN / REJECT_*), balance_at_entry.
+    """
+    m = len(entry_time)
+
+    position_size = np.zeros(m, dtype=np.float64)
+    status = np.zeros(m, dtype=np.int64)
+    balance_at_entry = np.zeros(m, dtype=np.float64)
+    risk_usd = np.zeros(m, dtype=np.float64)
+
+    last_exit = np.zeros(n_keys, dtype=np.int64)
+    has_exit = np.zeros(n_keys, dtype=np.bool_)
+    open_per_symbol = np.zeros(n_symbols, dtype=np.int64)
+
+    heap_t = np.empty(2 * m + 1, dtype=np.int64)
+    heap_e = np.empty(2 * m + 1, dtype=np.int64)
+    heap_size = 0
+
+    balance = initial_balance
+    open_positions = 0
+    open_risk = 0.0
+
+    for j in range(m):
+        t = entry_time[j]
+
+        # --------------------------------------------------
+        # REALISE EVENTS UP TO t
+        # --------------------------------------------------
+        while heap_size > 0 and heap_t[0] <= t:
+            e, heap_size = _heap_pop(heap_t, heap_e, heap_size)
+            k = e >> 1
+            size = position_size[k]
+            pips_tp1 = tp1_gain[k] / point_size[k]
+            pips_exit = exit_diff[k] / point_size[k]
+
+            if e & 1 == 0:
+                # TP1 partial → SL to BE, no risk left
+                balance += pips_tp1 * pip_value[k] * size * 0.5
+                open_risk -= risk_usd[k]
+            else:
+                if tp1_exec[k]:
+                    balance += pips_exit * pip_value[k] * size * 0.5
+                else:
+                    balance += pips_exit * pip_value[k] * size
+                    open_risk -= risk_usd[k]
+                open_positions -= 1
+                open_per_symbol[sym_id[k]] -= 1
+
+        # --------------------------------------------------
+        # ADMISSION
+        # --------------------------------------------------
+        key = dedupe_key[j]
+        if has_exit[key] and last_exit[key] > t:
+            status[j] = REJECT_SAME_TAG
+            continue
+
+        if one_per_symbol and open_per_symbol[sym_id[j]] > 0:
+            status[j] = REJECT_SYMBOL_BUSY
+            continue
+
+        if max_positions > 0 and open_positions >= max_positions:
+            status[j] = REJECT_MAX_POSITIONS
+            continue
+
+        account = balance if compounding else initial_balance
+
+        if entry_price[j] == entry_sl[j]:
+            size = 0.0
+        else:
+            pip_distance = abs(entry_price[j] - entry_sl[j]) / point_size[j]
+            risk_amount = max_risk * account
+            size = np.round(risk_amount / (pip_distance * pip_value[j]), 3)
+
+        risk = abs(entry_price[j] - entry_sl[j]) / point_size[j] * pip_value[j] * size
+
+        if max_total_risk > 0 and open_risk + risk > max_total_risk * account:
+            status[j] = REJECT_MAX_RISK
+            continue
+
+        # --------------------------------------------------
+        # OPEN
+        # --------------------------------------------------
+        status[j] = TAKEN
+        position_size[j] = size
+        balance_at_entry[j] = balance
+        risk_usd[j] = risk
+
+        open_positions += 1
+        open_per_symbol[sym_id[j]] += 1
+        open_risk += risk
+
+        if tp1_exec[j]:
+            heap_size = _heap_push(heap_t, heap_e, heap_size, tp1_time[j], 2 * j)
+        heap_size = _heap_push(heap_t, heap_e, heap_size, exit_time[j], 2 * j + 1)
+
+        last_exit[key] = exit_time[j]
+        has_exit[key] = True
+
+    return position_size, status, balance_at_entry
+
+
+# ==========================================================
+# Portfolio backtester
+# ==========================================================
+
+class PortfolioBacktester(Backtester):
+    """
+    Portfolio-level backtest: all symbols share one balance.
+
+    - sizing off realised balance (like PositionManager, which uses
+      account.balance), optionally without compounding
+    - max concurrent positions / max total open risk
+    - optional single position per symbol
+
+    With compounding=False and no limits the result equals
+    Backtester.run_backtest.
+    """
+
+    def __init__(
+            self,
+            slippage: float = 0.0,
+            max_workers: Optional[int] = None,
+            *,
+            compounding: bool = True,
+            max_open_positions: int | None = None,
+            max_total_risk: float | None = None,
+            one_position_per_symbol: bool = False,
+            initial_balance: float = INITIAL_BALANCE,
+            **kwargs,
+    ):
+        super().__init__(slippage, max_workers, **kwargs)
+        self.compounding = compounding
+        self.max_open_positions = max_open_positions
+        self.max_total_risk = max_total_risk
+        self.one_position_per_symbol = one_position_per_symbol
+        self.initial_balance = initial_balance
+        self.rejections: dict[str, int] = {}
+
+    def run(self, df: pd.DataFrame, symbol: Optional[str] = None) -> pd.DataFrame:
+        return self.run_backtest(df, symbol)
+
+    def run_backtest(
+            self,
+            df: pd.DataFrame,
+            symbol: Optional[str] = None
+    ) -> pd.DataFrame:
+
+        groups = [(symbol, df)] if symbol else list(df.groupby("symbol"))
+
+        # ==================================================
+        # 1️⃣ CANDIDATES PER SYMBOL
+        # ==================================================
+        symbols = []
+        columns = []
+        tags: dict[str, int] = {}
+
+        for sym_id, (sym, group_df) in enumerate(groups):
+            simulator, entries, arrays = self._prepare_symbol(group_df, sym)
+            time_ns = arrays["time"].view(np.int64)
+
+            hit_index = PriceHitIndex(arrays["high"], arrays["low"])
+            raw = simulator.simulate_candidates(
+                entries=entries,
+                close_arr=arrays["close"],
+                time_arr=arrays["time"],
+                hit_index=hit_index,
+            )
+
+            refine = self._refiner(sym, simulator, entries, arrays)
+            if refine is not None:
+                refine(raw)
+
+            entry_price = raw["entry_price"]
+            exit_price = raw["exit_price"]
+            exit_time = raw["exit_time"]
+            tp1_exec = raw["tp1_exec"]
+
+            is_long = entries.direction == 1
+            tag_ids = np.array(
+                [tags.setdefault(t, len(tags)) for t in entries.tags],
+                dtype=np.int64,
+            )
+
+            symbols.append((sym, simulator, entries, arrays))
+            columns.append({
+                "entry_time": time_ns[entries.pos],
+                "exit_time": exit_time,
+                "tp1_time": raw["tp1_time"],
+                "tp1_exec": tp1_exec,
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "exit_code": raw["exit_code"],
+                "tp1_price": raw["tp1_price"],
+                "entry_sl": entries.sl,
+                "tp1_gain": np.where(is_long, entries.tp1 - entry_price, entry_price - entries.tp1),
+                "exit_diff": np.where(is_long, exit_price - entry_price, entry_price - exit_price),
+                "point_size": np.full(len(entries), simulator.point_size),
+                "pip_value": np.full(len(entries), simulator.pip_value),
+                "sym_id": np.full(len(entries), sym_id, dtype=np.int64),
+                "dir_id": (~is_long).astype(np.int64),
+                "tag_id": tag_ids[entries.tag_id] if len(entries) else entries.tag_id,
+                "src": np.arange(len(entries), dtype=np.int64),
+            })
+
+        if not columns:
+            return pd.DataFrame()
+
+        # ==================================================
+        # 2️⃣ MERGED TIMELINE
+        # ==================================================
+        cand = {k: np.concatenate([c[k] for c in columns]) for k in columns[0]}
+        if len(cand["src"]) == 0:
+            return pd.DataFrame()
+
+        order = np.lexsort((cand["src"], cand["dir_id"], cand["sym_id"], cand["entry_time"]))
+        cand = {k: v[order] for k, v in cand.items()}
+
+        n_tags = max(len(tags), 1)
+        dedupe_key = (cand["sym_id"] * 2 + cand["dir_id"]) * n_tags + cand["tag_id"]
+
+        position_size, status, _ = portfolio_kernel_numba(
+            cand["entry_time"],
+            cand["exit_time"],
+            cand["tp1_time"],
+            cand["tp1_exec"],
+            cand["entry_price"],
+            cand["entry_sl"],
+            cand["tp1_gain"],
+            cand["exit_diff"],
+            cand["point_size"],
+            cand["pip_value"],
+            cand["sym_id"],
+            dedupe_key,
+            len(groups),
+            len(groups) * 2 * n_tags,
+            float(self.initial_balance),
+            float(self.max_risk),
+            self.compounding,
+            self.max_open_positions or 0,
+            self.max_total_risk or 0.0,
+            self.one_position_per_symbol,
+        )
+
+        self.rejections = {
+            reason: int((status == code).sum())
+            for code, reason in REJECT_REASONS.items()
+        }
+
+        # ==================================================
+        # 3️⃣ TRADE FRAMES
+        # ==================================================
+        all_trades = []
+        for sym_id, (sym, simulator, entries, arrays) in enumerate(symbols):
+            taken = (cand["sym_id"] == sym_id) & (status == 0)
+
+            raw = {
+                "src": cand["src"][taken],
+                "entry_price": cand["entry_price"][taken],
+                "exit_price": cand["exit_price"][taken],
+                "exit_time": cand["exit_time"][taken],
+                "exit_code": cand["exit_code"][taken],
+                "tp1_exec": cand["tp1_exec"][taken],
+                "tp1_price": cand["tp1_price"][taken],
+                "tp1_time": cand["tp1_time"][taken],
+            }
+
+            trades = simulator.to_frame(
+                symbol=sym,
+                entries=entries,
+                raw=raw,
+                time_arr=arrays["time"],
+                position_size=position_size[taken],
+            )
+
+            if self.verbose:
+                print(f"✅ Finished portfolio backtest for {sym}, {len(trades)} trades.")
+            all_trades.append(trades)
+
+        if self.verbose and any(self.rejections.values()):
+            print(f"🚫 Portfolio rejections: {self.rejections}")
+
+        all_trades = [t for t in all_trades if not t.empty]
+        return (
+            pd.concat(all_trades).sort_values(by="exit_time")
+            if all_trades else pd.DataFrame()
+        )
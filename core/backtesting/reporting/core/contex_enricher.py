@@ -22,7 +22,7 @@ class TradeContextEnricher:
             if ctx.source != "entry_candle":
                 continue
 
-            if ctx.column not in self.df.columns:
+            if ctx.column not in self.df:
                 raise KeyError(
                     f"Context column '{ctx.column}' not found in df_plot"
                 )
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+METHODS = ("shuffle", "bootstrap", "block_bootstrap")
+
+# Order of arrays returned by path_stats_numba
+_STAT_NAMES = (
+    "max_drawdown",
+    "max_drawdown_pct",
+    "final_equity",
+    "time_under_water",
+    "longest_under_water",
+)
+
+# Upper bound on resampled indices held in memory at once (per chunk).
+_CHUNK_ELEMENTS = 4_000_000
+
+
+# ==================================================
+# Path statistics (numba)
+#
+# Kernels are deliberately NOT parallel=True: numba's default
+# threading layer is not fork-safe and the backtest / sweep
+# process pools fork after the report may have run.
+# ==================================================
+
+@njit(cache=True)
+def path_stats_numba(pnl, idx, initial_balance):
+    """
+    idx: (n_paths, n_steps) trade indices into pnl.
+
+    Per path, in one pass over its equity curve:
+    - max drawdown (USD and fraction of running peak)
+    - final equity
+    - time under water (fraction of steps below running peak)
+    - longest under-water streak (steps)
+    """
+    n_paths, n_steps = idx.shape
+
+    max_dd = np.empty(n_paths)
+    max_dd_pct = np.empty(n_paths)
+    final_equity = np.empty(n_paths)
+    under_water = np.empty(n_paths)
+    longest_uw = np.empty(n_paths, dtype=np.int64)
+
+    for p in range(n_paths):
+        equity = initial_balance
+        peak = initial_balance
+        dd = 0.0
+        dd_pct = 0.0
+        uw = 0
+        streak = 0
+        longest = 0
+
+        for k in range(n_steps):
+            equity += pnl[idx[p, k]]
+
+            if equity >= peak:
+                peak = equity
+                streak = 0
+                continue
+
+            depth = peak - equity
+            if depth > dd:
+                dd = depth
+            if peak > 0.0 and depth / peak > dd_pct:
+                dd_pct = depth / peak
+
+            uw += 1
+            streak += 1
+            if streak > longest:
+                longest = streak
+
+        max_dd[p] = dd
+        max_dd_pct[p] = dd_pct
+        final_equity[p] = equity
+        under_water[p] = uw / n_steps if n_steps else 0.0
+        longest_uw[p] = longest
+
+    return max_dd, max_dd_pct, final_equity, under_water, longest_uw
+
+
+# ==================================================
+# Resampling (vectorised over a chunk of paths)
+# ==================================================
+
+@njit(cache=True)
+def _shuffle_numba(u):
+    """
+    Row-wise Fisher–Yates driven by pre-drawn uniforms u (n_paths, n).
+    """
+    n_paths, n = u.shape
+    idx = np.empty((n_paths, n), dtype=np.int32)
+
+    for p in range(n_paths):
+        for j in range(n):
+            idx[p, j] = j
+        for j in range(n - 1, 0, -1):
+            k = int(u[p, j] * (j + 1))
+            tmp = idx[p, j]
+            idx[p, j] = idx[p, k]
+            idx[p, k] = tmp
+
+    return idx
+
+
+def resample_indices(
+    n_trades: int,
+    n_paths: int,
+    method: str,
+    rng: np.random.Generator,
+    block_size: int = 1,
+) -> np.ndarray:
+    """
+    (n_paths, n_trades) int32 trade indices.
+
+    - shuffle          permutation of the realised sequence
+    - bootstrap        i.i.d. draws with replacement
+    - block_bootstrap  circular blocks of `block_size` consecutive trades
+                       (keeps short-range serial dependence)
+    """
+    if method == "shuffle":
+        return _shuffle_numba(rng.random((n_paths, n_trades)))
+
+    if method == "bootstrap":
+        return rng.integers(0, n_trades, size=(n_paths, n_trades), dtype=np.int32)
+
+    if method == "block_bootstrap":
+        n_blocks = -(-n_trades // block_size)
+        starts = rng.integers(0, n_trades, size=(n_paths, n_blocks, 1), dtype=np.int32)
+        offsets = np.arange(block_size, dtype=np.int32)
+        idx = (starts + offsets) % n_trades
+        return idx.reshape(n_paths, -1)[:, :n_trades]
+
+    raise ValueError(f"Unknown Monte Carlo method: {method}. Allowed: {METHODS}")
+
+
+class MonteCarloSimulator:
+    """
+    Trade-sequence Monte Carlo.
+
+    Resamples the realised per-trade PnL into n_paths synthetic
+    sequences and returns per-path drawdown / equity statistics.
+    Paths are generated in chunks, so memory stays bounded for
+    100k paths over thousands of trades.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_balance: float,
+        n_paths: int = 10_000,
+        block_size: int | None = None,
+        seed: int | None = None,
+    ):
+        self.initial_balance = float(initial_balance)
+        self.n_paths = n_paths
+        self.block_size = block_size
+        self.seed = seed
+
+    def _block_size(self, n_trades: int) -> int:
+        if self.block_size:
+            return self.block_size
+        return max(1, round(n_trades ** (1 / 3)))
+
+    def realised(self, pnl: np.ndarray) -> dict[str, float]:
+        """
+        Same statistics for the realised (unshuffled) sequence.
+        """
+        pnl = np.ascontiguousarray(pnl, dtype=np.float64)
+        idx = np.arange(len(pnl), dtype=np.int32)[None, :]
+        stats = path_stats_numba(pnl, idx, self.initial_balance)
+        return {k: v[0].item() for k, v in zip(_STAT_NAMES, stats)}
+
+    def run(self, pnl: np.ndarray, method: str) -> dict[str, np.ndarray]:
+        pnl = np.ascontiguousarray(pnl, dtype=np.float64)
+        n_trades = len(pnl)
+
+        if n_trades == 0:
+            raise ValueError("Monte Carlo requires at least one trade")
+
+        rng = np.random.default_rng(self.seed)
+        block_size = self._block_size(n_trades)
+        chunk = max(1, _CHUNK_ELEMENTS // n_trades)
+
+        parts = []
+        for start in range(0, self.n_paths, chunk):
+            n = min(chunk, self.n_paths - start)
+            idx = resample_indices(n_trades, n, method, rng, block_size)
+            parts.append(path_stats_numba(pnl, idx, self.initial_balance))
+
+        return {
+            name: np.concatenate([p[i] for p in parts])
+            for i, name in enumerate(_STAT_NAMES)
+        }
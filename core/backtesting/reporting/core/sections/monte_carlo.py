@@ -0,0 +1,112 @@
+import numpy as np
+from typing import Dict, Any
+
+from core.backtesting.reporting.core.context import ReportContext
+from core.backtesting.reporting.core.formating import Value
+from core.backtesting.reporting.core.monte_carlo import METHODS, MonteCarloSimulator
+from core.backtesting.reporting.core.section import ReportSection
+
+
+class MonteCarloSection(ReportSection):
+    """
+    Section 8:
+    Monte Carlo Robustness (trade resampling)
+    """
+
+    name = "Monte Carlo Simulation"
+
+    METHOD_TITLES = {
+        "shuffle": "Trade order shuffle",
+        "bootstrap": "Bootstrap (with replacement)",
+        "block_bootstrap": "Block bootstrap",
+    }
+
+    # metric -> (label, value kind)
+    METRICS = {
+        "max_drawdown": ("Max drawdown", "money"),
+        "max_drawdown_pct": ("Max drawdown (%)", "pct"),
+        "final_equity": ("Final equity", "money"),
+        "time_under_water": ("Time under water (%)", "pct"),
+        "longest_under_water": ("Longest under water (trades)", "num"),
+    }
+
+    # final equity of a permutation is the realised final equity,
+    # so these methods only report path statistics
+    PATH_ONLY_METHODS = ("shuffle",)
+    PATH_ONLY_SKIP = ("final_equity",)
+
+    QUANTILES = (0.05, 0.5, 0.95, 0.99)
+
+    def __init__(
+        self,
+        n_paths: int = 10_000,
+        methods: tuple[str, ...] = METHODS,
+        block_size: int | None = None,
+        seed: int | None = 42,
+    ):
+        self.n_paths = n_paths
+        self.methods = methods
+        self.block_size = block_size
+        self.seed = seed
+
+    def compute(self, ctx: ReportContext) -> Dict[str, Any]:
+        trades = ctx.trades
+
+        if trades.empty:
+            return {"error": "No trades available"}
+
+        pnl = trades.sort_values("exit_time")["pnl_usd"].to_numpy(dtype=np.float64)
+
+        simulator = MonteCarloSimulator(
+            initial_balance=ctx.initial_balance,
+            n_paths=self.n_paths,
+            block_size=self.block_size,
+            seed=self.seed,
+        )
+        realised = simulator.realised(pnl)
+
+        result = {}
+        for method in self.methods:
+            paths = simulator.run(pnl, method)
+            path_only = method in self.PATH_ONLY_METHODS
+
+            block = {
+                "rows": self._distribution_rows(paths, realised, path_only),
+                "Paths": self.n_paths,
+            }
+            if not path_only:
+                block["P(final equity < initial)"] = Value(
+                    float(np.mean(paths["final_equity"] < ctx.initial_balance)),
+                    "pct",
+                )
+            result[self.METHOD_TITLES[method]] = block
+
+        return result
+
+    # ==================================================
+    # Helpers
+    # ==================================================
+
+    def _distribution_rows(self, paths: dict, realised: dict, path_only: bool = False) -> list[dict]:
+        rows = []
+
+        for key, (label, kind) in self.METRICS.items():
+            if path_only and key in self.PATH_ONLY_SKIP:
+                continue
+            dist = paths[key]
+            q = np.quantile(dist, self.QUANTILES)
+
+            rows.append({
+                "Metric": label,
+                "Realised": Value(float(realised[key]), kind),
+                "Mean": Value(float(dist.mean()), kind),
+                **{
+                    f"P{int(p * 100)}": Value(float(v), kind)
+                    for p, v in zip(self.QUANTILES, q)
+                },
+                "Realised pctile": Value(
+                    float(np.mean(dist <= realised[key])), "pct"
+                ),
+            })
+
+        return rows
@@ -96,6 +96,9 @@ class StdoutRenderer:
         elif name == "Tail Risk Analysis":
             self._render_tail_risk_section(payload)
 
+        elif name == "Monte Carlo Simulation":
+            self._render_monte_carlo_section(payload)
+
         elif name in {
             "Conditional Expectancy Analysis",
             "Conditional Entry Tag Performance",
@@ -258,6 +261,20 @@ class StdoutRenderer:
 
         self._render_generic_table(rows)
 
+    def _render_monte_carlo_section(self, payload: dict):
+        for title, block in payload.items():
+            if not isinstance(block, dict):
+                continue
+
+            self.console.print(f"\n[bold]{title}[/bold]")
+            self._render_generic_table(block.get("rows", []))
+
+            extras = {k: v for k, v in block.items() if k != "rows"}
+            if extras:
+                self.console.print(
+                    "  ".join(f"{k}: {self._fmt(v)}" for k, v in extras.items())
+                )
+
     def _render_capital_exposure_section(self, payload: dict):
 
         # ==========================
@@ -11,6 +11,7 @@ from core.backtesting.reporting.core.sections.kpi import CorePerformanceSection
 from core.backtesting.reporting.core.sections.drawdown_structure import DrawdownStructureSection
 from core.backtesting.reporting.core.sections.entry_tag_performance import EntryTagPerformanceSection
 from core.backtesting.reporting.core.sections.exit_logic_diagnostics import ExitLogicDiagnosticsSection
+from core.backtesting.reporting.core.sections.monte_carlo import MonteCarloSection
 from core.backtesting.reporting.core.sections.tail_risk import TailRiskSection
 from core.backtesting.reporting.core.sections.trade_distribution import TradeDistributionSection
 from core.backtesting.reporting.renders.dashboard.dashboard_renderer import DashboardRenderer
@@ -76,6 +77,9 @@ class ReportRunner:
                 ExitLogicDiagnosticsSection(),
                 DrawdownStructureSection(),
                 CapitalExposureSection(),
+                MonteCarloSection(
+                    n_paths=getattr(self.config, "MONTE_CARLO_PATHS", 10_000),
+                ),
 
             ]
         )
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from core.backtesting.reporting.core.context import ReportContext
+from core.backtesting.reporting.core.formating import materialize
+from core.backtesting.reporting.core.monte_carlo import (
+    MonteCarloSimulator,
+    resample_indices,
+)
+from core.backtesting.reporting.core.sections.monte_carlo import MonteCarloSection
+
+
+def _reference_stats(pnl, initial_balance):
+    equity = initial_balance + np.cumsum(pnl)
+    peak = np.maximum.accumulate(np.concatenate([[initial_balance], equity]))[1:]
+    dd = peak - equity
+    return dd.max(), equity[-1], np.mean(dd > 0)
+
+
+def test_realised_stats_match_equity_curve():
+    rng = np.random.default_rng(0)
+    pnl = rng.normal(5, 100, 500)
+
+    stats = MonteCarloSimulator(initial_balance=10_000).realised(pnl)
+    max_dd, final, uw = _reference_stats(pnl, 10_000)
+
+    assert np.isclose(stats["max_drawdown"], max_dd)
+    assert np.isclose(stats["final_equity"], final)
+    assert np.isclose(stats["time_under_water"], uw)
+
+
+def test_resampling_methods():
+    rng = np.random.default_rng(1)
+
+    shuffled = resample_indices(50, 20, "shuffle", rng)
+    assert (np.sort(shuffled, axis=1) == np.arange(50)).all()
+
+    blocks = resample_indices(50, 20, "block_bootstrap", rng, block_size=5)
+    assert blocks.shape == (20, 50)
+    steps = np.diff(blocks[:, :5], axis=1) % 50
+    assert (steps == 1).all()
+
+
+def test_shuffle_keeps_final_equity_and_section_payload():
+    rng = np.random.default_rng(2)
+    pnl = rng.normal(5, 100, 300)
+
+    sim = MonteCarloSimulator(initial_balance=10_000, n_paths=2_000, seed=7)
+    paths = sim.run(pnl, "shuffle")
+    assert np.allclose(paths["final_equity"], 10_000 + pnl.sum())
+    assert len(paths["max_drawdown"]) == 2_000
+
+    trades = pd.DataFrame({
+        "exit_time": pd.date_range("2024-01-01", periods=len(pnl), freq="h"),
+        "pnl_usd": pnl,
+    })
+    ctx = ReportContext(
+        trades=trades,
+        equity=None,
+        drawdown=None,
+        df_plot=None,
+        initial_balance=10_000,
+        config=None,
+        strategy=None,
+    )
+
+    payload = materialize(MonteCarloSection(n_paths=500).compute(ctx))
+    assert set(payload) == set(MonteCarloSection.METHOD_TITLES.values())
+    rows = payload["Block bootstrap"]["rows"]
+    assert [r["Metric"] for r in rows] == [m[0] for m in MonteCarloSection.METRICS.values()]
+
+    shuffle = payload["Trade order shuffle"]
+    assert "Final equity" not in [r["Metric"] for r in shuffle["rows"]]
+    assert "P(final equity < initial)" not in shuffle
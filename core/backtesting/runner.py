@@ -9,12 +9,24 @@ from core.backtesting.reporting.core.contex_enricher import TradeContextEnricher
 from core.backtesting.reporting.core.preparer import RiskDataPreparer
 from core.backtesting.reporting.runner import ReportRunner
 from core.data_provider.backend_factory import create_backtest_backend
-from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.calendar import TradingCalendar
+from core.data_provider.default_provider import DefaultOhlcvDataProvider, shift_time_by_candles
+from core.data_provider.feature_store import FeatureStore
+from core.data_provider.frame_cache import FrameCache
 from core.data_provider.cache import MarketDataCache
+from core.data_provider.mmap_store import MmapOhlcvStore
+from core.data_provider.preload import DataLoader, DataRequest, PreloadedProvider
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.quality import OhlcvValidator
+from core.data_provider.resample import OhlcvResampler
 
 from core.backtesting.backtester import Backtester
+from core.backtesting.intrabar import IntrabarResolver
+from core.backtesting.portfolio import PortfolioBacktester
 from core.backtesting.raporter import BacktestReporter
 from core.backtesting.plotting.plot import TradePlotter
+from core.backtesting.sweep import ParameterSweep
+from core.backtesting.walk_forward import WalkForward, generate_windows
 
 from core.strategy.runner import run_strategy_single
 from core.strategy.strategy_loader import load_strategy_class
@@ -33,6 +45,8 @@ class BacktestRunner:
     def __init__(self, cfg):
         self.config = cfg
         self.provider = None
+        self.data_refs = {}           # symbol -> MmapFrameRef (if mmap store)
+        self.informative_data = {}    # symbol -> {DataRequest: frame | ref}
 
         # 🔑 STRATEGY CONTRACT
         self.strategy = None          # reference strategy (for reporting config)
@@ -40,6 +54,8 @@ class BacktestRunner:
 
         self.signals_df = None
         self.trades_df = None
+        self.sweep_df = None
+        self.walk_forward_df = None
 
     # ==================================================
     # 1️⃣ LOAD DATA ONCE
@@ -55,32 +71,91 @@ class BacktestRunner:
         start = pd.Timestamp(self.config.TIMERANGE["start"], tz="UTC")
         end = pd.Timestamp(self.config.TIMERANGE["end"], tz="UTC")
 
+        mmap_store = None
+        if getattr(self.config, "MARKET_DATA_MMAP", False):
+            mmap_store = MmapOhlcvStore(os.path.join(self.config.MARKET_DATA_PATH, "mmap"))
+
+        calendar = TradingCalendar()
+        resampler = None
+        if getattr(self.config, "MARKET_DATA_RESAMPLE", False):
+            resampler = OhlcvResampler(calendar=calendar)
+
+        validator = None
+        validation = getattr(self.config, "MARKET_DATA_VALIDATION", None)
+        if validation:
+            validator = OhlcvValidator(calendar=calendar, repair=validation == "repair")
+
+        frame_cache = None
+        frame_cache_mb = getattr(self.config, "MARKET_DATA_FRAME_CACHE_MB", 0)
+        if frame_cache_mb:
+            frame_cache = FrameCache(max_bytes=frame_cache_mb * 2**20)
+
+        feature_store = None
+        if getattr(self.config, "FEATURE_STORE", False):
+            feature_store = FeatureStore(os.path.join(self.config.MARKET_DATA_PATH, "features"))
+
         self.provider = DefaultOhlcvDataProvider(
             backend=backend,
-            cache=MarketDataCache(self.config.MARKET_DATA_PATH),
+            cache=self._create_cache(),
             backtest_start=start,
             backtest_end=end,
+            calendar=calendar,
+            mmap_store=mmap_store,
+            resampler=resampler,
+            validator=validator,
+            frame_cache=frame_cache,
+            feature_store=feature_store,
         )
 
-        all_data = {}
+        # =================================================
+        # FULL (symbol x timeframe x range) SET, LOADED CONCURRENTLY
+        # =================================================
+        timeframe = self.config.TIMEFRAME
+        informative_tfs = load_strategy_class(
+            self.config.STRATEGY_CLASS
+        ).get_required_informatives()
 
+        requests = {}
         for symbol in self.config.SYMBOLS:
-            t_sym = perf_counter()
+            requests[(symbol, timeframe)] = DataRequest(symbol, timeframe, start, end)
+            for tf in informative_tfs:
+                requests[(symbol, tf)] = DataRequest(
+                    symbol,
+                    tf,
+                    shift_time_by_candles(
+                        end=start,
+                        timeframe=tf,
+                        candles=self.config.STARTUP_CANDLE_COUNT,
+                    ),
+                    end,
+                )
 
-            df = self.provider.get_ohlcv(
-                symbol=symbol,
-                timeframe=self.config.TIMEFRAME,
-                start=start,
-                end=end,
-            )
+        loaded = DataLoader(
+            self.provider,
+            max_workers=getattr(self.config, "DATA_LOAD_WORKERS", 8),
+        ).load(list(requests.values()))
 
-            print(
-                f"⏱️ load_data | get_ohlcv {symbol:<10} "
-                f"{perf_counter() - t_sym:8.3f}s  ({len(df)} rows)"
-            )
+        all_data = {}
+        self.data_refs = {}
+        self.informative_data = {}
+
+        for (symbol, tf), req in requests.items():
+            data = loaded[req]
+            if mmap_store is not None:
+                # workers map the files instead of receiving pickled frames
+                data = mmap_store.ref(
+                    symbol=symbol, timeframe=tf, start=req.start, end=req.end
+                )
 
-            all_data[symbol] = df
+            if tf == timeframe:
+                all_data[symbol] = loaded[req]
+                if mmap_store is not None:
+                    self.data_refs[symbol] = data
+            else:
+                self.informative_data.setdefault(symbol, {})[req] = data
 
+        if frame_cache is not None:
+            print(f"⏱️ load_data | frame cache {frame_cache.stats()}")
         print(f"⏱️ load_data | TOTAL {perf_counter() - t_start:8.3f}s")
         return all_data
 
@@ -88,6 +163,16 @@ class BacktestRunner:
     # 2️⃣ RUN STRATEGIES (PARALLEL)
     # ==================================================
 
+    def _strategy_provider(self, symbol: str):
+        """
+        Provider for one symbol's strategy run: preloaded informatives,
+        falling back to the shared provider.
+        """
+        frames = self.informative_data.get(symbol)
+        if not frames:
+            return self.provider
+        return PreloadedProvider(self.provider, frames)
+
     def run_strategies_parallel(self, all_data: dict):
 
         t_start = perf_counter()
@@ -106,7 +191,7 @@ class BacktestRunner:
             df_signals, strategy = run_strategy_single(
                 symbol,
                 df,
-                self.provider,
+                self._strategy_provider(symbol),
                 load_strategy_class(self.config.STRATEGY_CLASS),
                 self.config.STARTUP_CANDLE_COUNT,
             )
@@ -124,8 +209,9 @@ class BacktestRunner:
                     executor.submit(
                         run_strategy_single,
                         symbol,
-                        df,
-                        self.provider,
+                        # mapped files instead of a pickled frame
+                        self.data_refs.get(symbol, df),
+                        self._strategy_provider(symbol),
                         load_strategy_class(self.config.STRATEGY_CLASS),
                         self.config.STARTUP_CANDLE_COUNT,
                     )
@@ -158,6 +244,40 @@ class BacktestRunner:
     # 3️⃣ BACKTEST WINDOWS
     # ==================================================
 
+    def _create_cache(self):
+        kind = getattr(self.config, "MARKET_DATA_CACHE", "csv")
+        if kind == "parquet":
+            return ParquetMarketDataCache(self.config.MARKET_DATA_PATH)
+        if kind == "csv":
+            return MarketDataCache(self.config.MARKET_DATA_PATH)
+        raise ValueError(f"Unsupported MARKET_DATA_CACHE: {kind}. Allowed: parquet, csv")
+
+    def _create_intrabar(self):
+        timeframe = getattr(self.config, "INTRABAR_TIMEFRAME", None)
+        if not timeframe:
+            return None
+        return IntrabarResolver(self.provider, timeframe=timeframe)
+
+    def _create_backtester(self):
+        intrabar = self._create_intrabar()
+
+        if getattr(self.config, "BACKTEST_ENGINE", "symbol") == "portfolio":
+            portfolio = self.config.PORTFOLIO
+            return PortfolioBacktester(
+                slippage=self.config.SLIPPAGE,
+                compounding=portfolio.get("COMPOUNDING", True),
+                max_open_positions=portfolio.get("MAX_OPEN_POSITIONS"),
+                max_total_risk=portfolio.get("MAX_TOTAL_RISK"),
+                one_position_per_symbol=portfolio.get("ONE_POSITION_PER_SYMBOL", False),
+                intrabar=intrabar,
+            )
+
+        return Backtester(
+            slippage=self.config.SLIPPAGE,
+            max_workers=getattr(self.config, "BACKTEST_WORKERS", None),
+            intrabar=intrabar,
+        )
+
     def _run_backtest_window(self, start, end, label):
 
         df_slice = self.signals_df[
@@ -168,8 +288,8 @@ class BacktestRunner:
         if df_slice.empty:
             raise RuntimeError(f"No signals in window: {label}")
 
-        backtester = Backtester(slippage=self.config.SLIPPAGE)
-        trades = backtester.run_backtest(df_slice)
+        backtester = self._create_backtester()
+        trades = backtester.run(df_slice)
         trades["window"] = label
         return trades
 
@@ -210,6 +330,79 @@ class BacktestRunner:
 
         return self.trades_df
 
+    # ==================================================
+    # 4️⃣b PARAMETER SWEEP
+    # ==================================================
+
+    def run_sweep(self, all_data: dict, grid: dict | None = None) -> pd.DataFrame:
+        """
+        Runs the strategy over a parameter grid (default: SWEEP_GRID).
+        Features are computed once per distinct feature-affecting
+        parameter set; signals + backtests fan out over a process pool.
+        """
+        grid = grid if grid is not None else self.config.SWEEP_GRID
+
+        sweep = ParameterSweep(
+            strategy_cls=load_strategy_class(self.config.STRATEGY_CLASS),
+            provider=self.provider,
+            all_data=all_data,
+            startup_candle_count=self.config.STARTUP_CANDLE_COUNT,
+            initial_balance=INITIAL_BALANCE,
+            slippage=self.config.SLIPPAGE,
+            max_workers=getattr(self.config, "BACKTEST_WORKERS", None),
+        )
+
+        self.sweep_df = sweep.run(grid)
+
+        os.makedirs("results/sweep", exist_ok=True)
+        self.sweep_df.to_csv("results/sweep/summary.csv", index=False)
+
+        print(self.sweep_df.to_string(index=False))
+        return self.sweep_df
+
+    # ==================================================
+    # 4️⃣c WALK-FORWARD
+    # ==================================================
+
+    def run_walk_forward(self, all_data: dict, grid: dict | None = None):
+        """
+        Walk-forward optimisation over TIMERANGE using WALK_FORWARD
+        window settings and SWEEP_GRID. Out-of-sample trades of all
+        test windows become self.trades_df.
+        """
+        grid = grid if grid is not None else self.config.SWEEP_GRID
+        wf_cfg = self.config.WALK_FORWARD
+
+        windows = generate_windows(
+            pd.Timestamp(self.config.TIMERANGE["start"], tz="UTC"),
+            pd.Timestamp(self.config.TIMERANGE["end"], tz="UTC"),
+            train=wf_cfg["train"],
+            test=wf_cfg["test"],
+            step=wf_cfg.get("step"),
+            anchored=wf_cfg.get("anchored", False),
+        )
+
+        walk_forward = WalkForward(
+            strategy_cls=load_strategy_class(self.config.STRATEGY_CLASS),
+            provider=self.provider,
+            all_data=all_data,
+            startup_candle_count=self.config.STARTUP_CANDLE_COUNT,
+            initial_balance=INITIAL_BALANCE,
+            slippage=self.config.SLIPPAGE,
+            max_workers=getattr(self.config, "BACKTEST_WORKERS", None),
+            objective=wf_cfg.get("objective", "expectancy"),
+            min_trades=wf_cfg.get("min_trades", 1),
+        )
+
+        self.walk_forward_df, self.trades_df = walk_forward.run(grid, windows)
+
+        os.makedirs("results/walk_forward", exist_ok=True)
+        self.walk_forward_df.to_csv("results/walk_forward/summary.csv", index=False)
+        self.trades_df.to_csv("results/walk_forward/oos_trades.csv", index=False)
+
+        print(self.walk_forward_df.to_string(index=False))
+        return self.walk_forward_df, self.trades_df
+
     # ==================================================
     # 5️⃣ REPORTING (RISK / STRATEGY)
     # ==================================================
@@ -283,6 +476,18 @@ class BacktestRunner:
         # LOAD DATA
         all_data = self.load_data()
 
+        # PARAMETER SWEEP
+        if self.config.BACKTEST_MODE == "sweep":
+            self.run_sweep(all_data)
+            print(f"🔁 Sweep finished TOTAL {perf_counter() - t_start:.3f}s")
+            return
+
+        # WALK-FORWARD
+        if self.config.BACKTEST_MODE == "walk_forward":
+            self.run_walk_forward(all_data)
+            print(f"🚶 Walk-forward finished TOTAL {perf_counter() - t_start:.3f}s")
+            return
+
         # STRATEGIES
         self.run_strategies_parallel(all_data)
 
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator
+
+import numpy as np
+
+
+_ALIGN = 64
+
+
+@dataclass(frozen=True)
+class SharedArraysSpec:
+    """
+    Picklable descriptor of a SharedArrays block.
+    fields: (name, dtype, length, byte offset)
+    """
+    shm_name: str
+    fields: tuple[tuple[str, str, int, int], ...]
+
+
+class SharedArrays:
+    """
+    Owner side of a set of 1-D NumPy arrays packed into ONE
+    multiprocessing.shared_memory block.
+
+    Workers attach by spec (zero-copy, no pickling of the data).
+    Owner must close() (unlinks the block).
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        fields = []
+        offset = 0
+
+        for name, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            fields.append((name, arr.dtype.str, len(arr), offset))
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+
+        self._shm = SharedMemory(create=True, size=max(offset, 1))
+
+        for (name, dtype, length, off), arr in zip(fields, arrays.values()):
+            view = np.ndarray(length, dtype=dtype, buffer=self._shm.buf, offset=off)
+            view[:] = arr
+            del view
+
+        self.spec = SharedArraysSpec(
+            shm_name=self._shm.name,
+            fields=tuple(fields),
+        )
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@contextmanager
+def attach_shared_arrays(spec: SharedArraysSpec) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Worker side: yields read-only views into the shared block.
+    Views must not outlive the context.
+    """
+    shm = _attach(spec.shm_name)
+    arrays = {}
+    try:
+        for name, dtype, length, offset in spec.fields:
+            view = np.ndarray(length, dtype=dtype, buffer=shm.buf, offset=offset)
+            view.flags.writeable = False
+            arrays[name] = view
+        yield arrays
+    finally:
+        arrays.clear()
+        shm.close()
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Python < 3.13: attaching would register the block with the
+    # resource tracker (which then unlinks / double-unregisters it).
+    # The owner is responsible for cleanup, so skip registration.
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import pandas as pd
+
+from core.backtesting.backtester import Backtester
+from core.backtesting.reporting.core.metrics import ExpectancyMetric, MaxDrawdownMetric
+from core.backtesting.reporting.core.preparer import RiskDataPreparer
+from core.strategy.runner import run_strategy_features, run_strategy_signals
+
+
+# Sweepable keys consumed by the backtester (not the strategy).
+# config name -> Backtester kwarg
+BACKTEST_PARAMS = {
+    "MAX_RISK_PER_TRADE": "max_risk",
+}
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    """
+    {"a": [1, 2], "b": [3]} -> [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+    """
+    if not grid:
+        return [{}]
+
+    keys = list(grid)
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(grid[k] for k in keys))
+    ]
+
+
+def summarize_trades(trades: pd.DataFrame, initial_balance: float) -> dict:
+    """
+    One summary row for a sweep combination.
+    """
+    if trades.empty:
+        return {
+            "trades": 0,
+            "total_pnl": 0.0,
+            "win_rate": float("nan"),
+            "expectancy": 0.0,
+            "avg_return": float("nan"),
+            "max_drawdown": 0.0,
+            "final_equity": float(initial_balance),
+        }
+
+    prepared = RiskDataPreparer(initial_balance=initial_balance).prepare(trades)
+
+    return {
+        "trades": int(len(prepared)),
+        "total_pnl": float(prepared["pnl_usd"].sum()),
+        "win_rate": float((prepared["pnl_usd"] > 0).mean()),
+        "expectancy": float(ExpectancyMetric().compute(prepared)),
+        "avg_return": float(prepared["returns"].mean()),
+        "max_drawdown": float(MaxDrawdownMetric().compute(prepared)),
+        "final_equity": float(prepared["equity"].iloc[-1]),
+    }
+
+
+# ==================================================
+# Workers (top-level for multiprocessing)
+# ==================================================
+
+def _features_job(symbol, df, provider, strategy_cls, startup_candle_count, feature_params):
+    return run_strategy_features(
+        symbol,
+        df,
+        provider,
+        strategy_cls,
+        startup_candle_count,
+        params=feature_params,
+    )
+
+
+def split_combo(combo: dict) -> tuple[dict, dict]:
+    """
+    Grid combination -> (strategy params, Backtester kwargs).
+    """
+    strategy_params = {k: v for k, v in combo.items() if k not in BACKTEST_PARAMS}
+    backtest_kwargs = {
+        BACKTEST_PARAMS[k]: v for k, v in combo.items() if k in BACKTEST_PARAMS
+    }
+    return strategy_params, backtest_kwargs
+
+
+def build_signals(features_by_symbol, strategy_cls, startup_candle_count, strategy_params):
+    """
+    Signal stage for every symbol, merged into one time-sorted frame.
+    """
+    signals = [
+        run_strategy_signals(
+            symbol,
+            df_features,
+            strategy_cls,
+            startup_candle_count,
+            params=strategy_params,
+        )
+        for symbol, df_features in features_by_symbol.items()
+    ]
+    return (
+        pd.concat(signals)
+        .sort_values(by=["time", "symbol"])
+        .reset_index(drop=True)
+    )
+
+
+def _signals_job(features_by_symbol, combos, strategy_cls, startup_candle_count, slippage, initial_balance):
+    rows = []
+
+    for combo in combos:
+        strategy_params, backtest_kwargs = split_combo(combo)
+
+        signals_df = build_signals(
+            features_by_symbol,
+            strategy_cls,
+            startup_candle_count,
+            strategy_params,
+        )
+
+        trades = Backtester(
+            slippage=slippage,
+            max_workers=1,
+            verbose=False,
+            **backtest_kwargs,
+        ).run_backtest(signals_df)
+
+        rows.append({**combo, **summarize_trades(trades, initial_balance)})
+
+    return rows
+
+
+# ==================================================
+# Sweep engine
+# ==================================================
+
+class ParameterSweep:
+    """
+    Runs one strategy over a parameter grid.
+
+    Stages:
+    1. features  - computed ONCE per (symbol, distinct FEATURE_PARAMS
+                   values), in parallel
+    2. signals + backtest - cheap, fanned out over a process pool in
+                   chunks that reuse the stage-1 frames
+
+    Result: one summary row per grid combination.
+    """
+
+    def __init__(
+        self,
+        *,
+        strategy_cls,
+        provider,
+        all_data: dict[str, pd.DataFrame],
+        startup_candle_count: int,
+        initial_balance: float,
+        slippage: float = 0.0,
+        max_workers: int | None = None,
+    ):
+        self.strategy_cls = strategy_cls
+        self.provider = provider
+        self.all_data = all_data
+        self.startup_candle_count = startup_candle_count
+        self.initial_balance = initial_balance
+        self.slippage = slippage
+        self.max_workers = max_workers or os.cpu_count()
+
+    # --------------------------------------------------
+    # Grid splitting
+    # --------------------------------------------------
+
+    def _validate(self, grid: dict[str, list]) -> None:
+        allowed = set(self.strategy_cls.PARAMS) | set(BACKTEST_PARAMS)
+        unknown = set(grid) - allowed
+        if unknown:
+            raise ValueError(
+                f"Unknown sweep parameters: {sorted(unknown)}. "
+                f"Allowed: {sorted(allowed)}"
+            )
+
+    def _feature_key(self, combo: dict) -> tuple:
+        return tuple(
+            (k, combo[k]) for k in self.strategy_cls.FEATURE_PARAMS if k in combo
+        )
+
+    def group_by_features(self, grid: dict[str, list]) -> dict[tuple, list[dict]]:
+        groups: dict[tuple, list[dict]] = {}
+        for combo in expand_grid(grid):
+            groups.setdefault(self._feature_key(combo), []).append(combo)
+        return groups
+
+    def chunk_groups(self, groups: dict[tuple, list[dict]]) -> list[tuple[tuple, list[dict]]]:
+        """
+        Splits each feature group into ~max_workers / n_groups chunks,
+        so every worker reuses one feature set per job.
+        """
+        n_chunks_per_group = max(1, self.max_workers // len(groups))
+
+        chunks = []
+        for key, combos in groups.items():
+            chunk_size = math.ceil(len(combos) / n_chunks_per_group)
+            for i in range(0, len(combos), chunk_size):
+                chunks.append((key, combos[i:i + chunk_size]))
+        return chunks
+
+    # --------------------------------------------------
+    # Stage 1: features
+    # --------------------------------------------------
+
+    def compute_features(self, executor, groups) -> dict[tuple, dict[str, pd.DataFrame]]:
+        """
+        feature key -> {symbol: feature frame}, one job per (key, symbol).
+        """
+        futures = {
+            (key, symbol): executor.submit(
+                _features_job,
+                symbol,
+                df,
+                self.provider,
+                self.strategy_cls,
+                self.startup_candle_count,
+                dict(key),
+            )
+            for key in groups
+            for symbol, df in self.all_data.items()
+        }
+
+        features = {key: {} for key in groups}
+        for (key, symbol), future in futures.items():
+            features[key][symbol] = future.result()
+
+        return features
+
+    # --------------------------------------------------
+    # Main API
+    # --------------------------------------------------
+
+    def run(self, grid: dict[str, list]) -> pd.DataFrame:
+
+        self._validate(grid)
+        groups = self.group_by_features(grid)
+
+        t_start = perf_counter()
+        n_combos = sum(len(c) for c in groups.values())
+        print(
+            f"🔁 SWEEP | {n_combos} combinations, "
+            f"{len(groups)} feature sets, {len(self.all_data)} symbols"
+        )
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+
+            # ==========================================
+            # 1️⃣ FEATURES (once per feature set)
+            # ==========================================
+            features = self.compute_features(executor, groups)
+
+            print(f"🔁 SWEEP | features {perf_counter() - t_start:8.3f}s")
+
+            # ==========================================
+            # 2️⃣ SIGNALS + BACKTEST (fan-out)
+            # ==========================================
+            signal_futures = [
+                executor.submit(
+                    _signals_job,
+                    features[key],
+                    chunk,
+                    self.strategy_cls,
+                    self.startup_candle_count,
+                    self.slippage,
+                    self.initial_balance,
+                )
+                for key, chunk in self.chunk_groups(groups)
+            ]
+
+            rows = []
+            for future in signal_futures:
+                rows.extend(future.result())
+
+        print(f"🔁 SWEEP | TOTAL {perf_counter() - t_start:8.3f}s")
+
+        return (
+            pd.DataFrame(rows)
+            .sort_values(by="expectancy", ascending=False)
+            .reset_index(drop=True)
+        )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtesting.backtester import Backtester
+from core.strategy.signals import (
+    init_entry_columns,
+    normalize_entry_columns,
+    set_entry_signal,
+    set_levels,
+)
+
+
+@pytest.fixture
+def signals_df():
+    rng = np.random.default_rng(7)
+    n = 3000
+
+    close = 2000 + np.cumsum(rng.normal(0, 1.0, n))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) + rng.uniform(0, 1.5, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 1.5, n)
+
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="5min", tz="UTC"),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+    })
+
+    signal_entry = np.full(n, None, dtype=object)
+    levels = np.full(n, None, dtype=object)
+
+    for i in np.flatnonzero(rng.random(n) < 0.05):
+        direction = "long" if rng.random() < 0.5 else "short"
+        tag = f"{direction}_{rng.integers(0, 3)}"
+        risk = rng.uniform(0.5, 6.0)
+        sign = 1 if direction == "long" else -1
+        c = close[i]
+
+        signal_entry[i] = {"direction": direction, "tag": tag}
+        levels[i] = {
+            "SL": {"level": c - sign * risk, "tag": "auto"},
+            "TP1": {"level": c + sign * risk, "tag": "RR_1:1"},
+            "TP2": {"level": c + sign * risk * 2, "tag": "RR_1:2"},
+        }
+
+    df["signal_entry"] = signal_entry
+    df["levels"] = levels
+    return df
+
+
+def test_batch_matches_reference_loop(signals_df):
+    backtester = Backtester()
+
+    batch = backtester._backtest_single_symbol(signals_df, "XAUUSD")
+    reference = backtester._backtest_single_symbol_loop(signals_df, "XAUUSD")
+
+    assert len(batch) > 0
+    pd.testing.assert_frame_equal(batch, reference, check_exact=True)
+
+
+def test_no_signals_returns_empty(signals_df):
+    df = signals_df.copy()
+    df["signal_entry"] = None
+
+    trades = Backtester()._backtest_single_symbol(df, "XAUUSD")
+
+    assert trades.empty
+
+
+def _to_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.drop(columns=["signal_entry", "levels"])
+    init_entry_columns(out)
+
+    for direction in ("long", "short"):
+        for tag in {s["tag"] for s in df["signal_entry"].dropna()}:
+            mask = df["signal_entry"].map(
+                lambda s: isinstance(s, dict)
+                and s["direction"] == direction
+                and s["tag"] == tag
+            )
+            set_entry_signal(out, mask, direction=direction, tag=tag)
+
+    has_levels = df["levels"].notna()
+    levels = df["levels"].where(has_levels, None)
+    set_levels(
+        out,
+        has_levels,
+        sl=levels.map(lambda lv: lv["SL"]["level"] if lv else np.nan),
+        tp1=levels.map(lambda lv: lv["TP1"]["level"] if lv else np.nan),
+        tp2=levels.map(lambda lv: lv["TP2"]["level"] if lv else np.nan),
+        sl_tag="auto",
+        tp1_tag="RR_1:1",
+        tp2_tag="RR_1:2",
+    )
+    return normalize_entry_columns(out)
+
+
+def test_columnar_contract_matches_dict_contract(signals_df):
+    backtester = Backtester()
+
+    from_dicts = backtester._backtest_single_symbol(signals_df, "XAUUSD")
+    from_columns = backtester._backtest_single_symbol(
+        _to_columnar(signals_df), "XAUUSD"
+    )
+
+    pd.testing.assert_frame_equal(from_columns, from_dicts, check_exact=True)
+
+
+def test_parallel_run_matches_serial(signals_df):
+    frames = []
+    for symbol, shift in (("XAUUSD", 0.0), ("EURUSD", 0.5), ("USTECH100", -0.5)):
+        df = signals_df.copy()
+        df[["open", "high", "low", "close"]] += shift
+        df["symbol"] = symbol
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True)
+
+    serial = Backtester().run_backtest(df)
+    parallel = Backtester(max_workers=2).run(df)
+
+    assert len(parallel) > 0
+    pd.testing.assert_frame_equal(parallel, serial, check_exact=True)
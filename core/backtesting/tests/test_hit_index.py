@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.backtesting.hit_index import (
+    PriceHitIndex,
+    simulate_exit_indexed_numba,
+)
+from core.backtesting.simulate_exit_numba import simulate_exit_numba
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    n = 777
+
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    high = close + rng.uniform(0, 0.8, n)
+    low = close - rng.uniform(0, 0.8, n)
+    time = np.arange(n, dtype=np.int64) * 60_000_000_000
+
+    return high, low, close, time
+
+
+def test_first_hit_matches_linear_scan(prices):
+    high, low, _, _ = prices
+    index = PriceHitIndex(high, low)
+    rng = np.random.default_rng(3)
+
+    for _ in range(500):
+        start = int(rng.integers(0, len(high) + 2))
+        x = float(rng.uniform(low.min() - 1, high.max() + 1))
+
+        hits_high = np.flatnonzero(high[start:] >= x)
+        hits_low = np.flatnonzero(low[start:] <= x)
+
+        expected_high = start + hits_high[0] if len(hits_high) else len(high)
+        expected_low = start + hits_low[0] if len(hits_low) else len(low)
+
+        assert index.first_high_ge(start, x) == min(expected_high, len(high))
+        assert index.first_low_le(start, x) == min(expected_low, len(low))
+
+
+def test_indexed_exit_matches_linear_exit(prices):
+    high, low, close, time = prices
+    index = PriceHitIndex(high, low)
+    rng = np.random.default_rng(5)
+
+    for _ in range(2000):
+        direction = 1 if rng.random() < 0.5 else -1
+        pos = int(rng.integers(0, len(close)))
+        entry = close[pos]
+
+        sl_dist, tp1_dist, tp2_dist = rng.uniform(0.05, 8.0, 3)
+        sl = entry - direction * sl_dist
+        tp1 = entry + direction * tp1_dist
+        tp2 = entry + direction * tp2_dist
+        if rng.random() < 0.05:
+            tp2 = np.nan
+
+        args = (direction, pos, entry, sl, tp1, tp2)
+
+        linear = simulate_exit_numba(*args, high, low, close, time, 0.01)
+        indexed = simulate_exit_indexed_numba(
+            *args, index.high_tree, index.neg_low_tree, close, time, 0.01
+        )
+
+        assert linear == indexed
+
+
+def test_nan_bars_do_not_hide_hits():
+    high = np.array([1.0, 1.0, 5.0, np.nan])
+    low = np.array([1.0, np.nan, 0.5, 1.0])
+    index = PriceHitIndex(high, low)
+
+    assert index.first_high_ge(0, 4.0) == 2
+    assert index.first_low_le(0, 0.6) == 2
+    assert index.first_high_ge(3, 0.0) == 4
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.backtesting.backtester import Backtester
+from core.backtesting.intrabar import IntrabarResolver
+from core.backtesting.simulate_exit_numba import simulate_exit_numba
+
+
+class _M1Provider:
+    def __init__(self, m1):
+        self.m1 = m1
+        self.calls = 0
+
+    def get_ohlcv(self, *, symbol, timeframe, start, end):
+        self.calls += 1
+        t = self.m1["time"]
+        return self.m1[(t >= start) & (t < end)]
+
+
+def _m1_and_m5(n_m5=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    n = n_m5 * 5
+
+    close = 2000 + np.cumsum(rng.normal(0, 0.5, n))
+    open_ = np.r_[close[0], close[:-1]]
+    m1 = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="1min", tz="UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.3, n),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.3, n),
+        "close": close,
+    })
+
+    m5 = (
+        m1.set_index("time")
+        .resample("5min")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last"})
+        .reset_index()
+    )
+
+    signal_entry = np.full(len(m5), None, dtype=object)
+    levels = np.full(len(m5), None, dtype=object)
+
+    for i in np.flatnonzero(rng.random(len(m5)) < 0.05):
+        direction = "long" if rng.random() < 0.5 else "short"
+        sign = 1 if direction == "long" else -1
+        risk = rng.uniform(0.5, 2.0)
+        c = m5["close"].iat[i]
+
+        signal_entry[i] = {"direction": direction, "tag": f"{direction}_{i % 2}"}
+        levels[i] = {
+            "SL": {"level": c - sign * risk, "tag": "auto"},
+            "TP1": {"level": c + sign * risk, "tag": "RR_1:1"},
+            "TP2": {"level": c + sign * risk * 2, "tag": "RR_1:2"},
+        }
+
+    m5["signal_entry"] = signal_entry
+    m5["levels"] = levels
+    return m1, m5
+
+
+def test_intrabar_matches_lower_timeframe_replay():
+    m1, m5 = _m1_and_m5()
+    provider = _M1Provider(m1)
+    resolver = IntrabarResolver(provider, timeframe="M1")
+
+    trades = Backtester(intrabar=resolver, verbose=False).run_backtest(m5, "XAUUSD")
+    assert resolver.resolved > 0
+
+    # only days holding an ambiguous bar are loaded
+    assert provider.calls <= m1["time"].dt.floor("D").nunique()
+
+    # brute force: same exit rules walked on M1 from the entry bar's close
+    m1_time = m1["time"].dt.tz_localize(None).to_numpy().astype("datetime64[ns]").view(np.int64)
+    high = m1["high"].to_numpy()
+    low = m1["low"].to_numpy()
+    close = m1["close"].to_numpy()
+
+    by_time = m5.set_index(m5["time"].dt.tz_localize(None))
+
+    for tr in trades.itertuples():
+        lv = by_time.at[tr.entry_time, "levels"]
+        slippage_abs = abs(tr.entry_price - by_time.at[tr.entry_time, "close"])
+        pos = np.searchsorted(m1_time, pd.Timestamp(tr.entry_time).value) + 4
+        sign = 1 if tr.direction == "long" else -1
+        exit_price, _, _, tp1_exec, _, _ = simulate_exit_numba(
+            sign, pos, tr.entry_price,
+            lv["SL"]["level"], lv["TP1"]["level"], lv["TP2"]["level"],
+            high, low, close, m1_time, slippage_abs,
+        )
+        assert exit_price == tr.exit_price
+        assert tp1_exec == pd.notna(tr.tp1_price)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.backtesting.backtester import Backtester
+from core.backtesting.portfolio import PortfolioBacktester
+from core.backtesting.tests.test_batch_simulator import signals_df  # noqa: F401
+
+
+def _multi_symbol(signals_df):
+    parts = []
+    for i, sym in enumerate(["XAUUSD", "EURUSD", "USTECH100"]):
+        part = signals_df.copy()
+        part["symbol"] = sym
+        part["time"] = part["time"] + pd.Timedelta(minutes=i)
+        parts.append(part)
+    return pd.concat(parts).sort_values(by=["time", "symbol"]).reset_index(drop=True)
+
+
+def _canonical(trades):
+    return trades.sort_values(
+        by=["symbol", "entry_time", "direction", "entry_tag"]
+    ).reset_index(drop=True)
+
+
+def test_portfolio_without_limits_matches_backtester(signals_df):
+    df = _multi_symbol(signals_df)
+
+    reference = Backtester(verbose=False).run_backtest(df)
+    portfolio = PortfolioBacktester(compounding=False, verbose=False).run_backtest(df)
+
+    pd.testing.assert_frame_equal(
+        _canonical(portfolio),
+        _canonical(reference),
+        check_exact=True,
+    )
+
+
+def test_portfolio_limits_and_compounding(signals_df):
+    df = _multi_symbol(signals_df)
+
+    backtester = PortfolioBacktester(
+        max_open_positions=2,
+        max_total_risk=0.01,
+        one_position_per_symbol=True,
+        max_risk=0.005,
+        verbose=False,
+    )
+    trades = backtester.run_backtest(df)
+
+    assert backtester.rejections["max open positions"] > 0
+    assert backtester.rejections["symbol already in position"] > 0
+
+    # never more than 2 open positions, never 2 on one symbol
+    events = pd.concat([
+        pd.DataFrame({"t": trades["entry_time"], "d": 1, "s": trades["symbol"]}),
+        pd.DataFrame({"t": trades["exit_time"], "d": -1, "s": trades["symbol"]}),
+    ]).sort_values(by=["t", "d"])
+    assert events["d"].cumsum().max() <= 2
+    assert events.groupby("s")["d"].cumsum().max() <= 1
+
+    # compounding: same trades, sizes follow the running balance
+    fixed = _canonical(PortfolioBacktester(compounding=False, verbose=False).run_backtest(df))
+    compounded = _canonical(PortfolioBacktester(compounding=True, verbose=False).run_backtest(df))
+
+    assert len(fixed) == len(compounded)
+    assert (fixed["entry_time"] == compounded["entry_time"]).all()
+    assert not np.allclose(fixed["position_size"], compounded["position_size"])
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.backtesting.sweep import ParameterSweep
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.frame_cache import FrameCache
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.preload import PreloadedProvider
+from core.data_provider.resample import OhlcvResampler
+from core.data_provider.tests.fakes import FakeBackend
+from core.strategy.BaseStrategy import BaseStrategy
+from core.strategy.runner import run_strategy_single
+from core.strategy.signals import (
+    init_entry_columns,
+    set_entry_signal,
+    set_levels,
+)
+
+
+START = pd.Timestamp("2024-01-02", tz="UTC")
+END = START + pd.Timedelta(minutes=5 * 999)
+SYMBOLS = ("EURUSD", "XAUUSD")
+
+
+class InformativeSmaStrategy(BaseStrategy):
+    """
+    Reads an M15 informative through the provider, so every worker
+    process uses the (pickled) provider, its cache and manifest.
+    """
+
+    PARAMS = {"WINDOW": 20, "RR": 1.0}
+    FEATURE_PARAMS = ("WINDOW",)
+
+    def populate_indicators_M15(self, df):
+        return df.assign(range=df["high"] - df["low"])
+
+    populate_indicators_M15._informative = True
+    populate_indicators_M15._informative_timeframe = "M15"
+
+    def populate_indicators(self):
+        self.df["atr"] = (self.df["high"] - self.df["low"]).rolling(14).mean()
+        self.df["sma"] = self.df["close"].rolling(self.params["WINDOW"]).mean()
+
+    def populate_entry_trend(self):
+        df = self.df
+        init_entry_columns(df)
+
+        cross_up = (df["close"] > df["sma"]) & (df["close"].shift(1) <= df["sma"].shift(1))
+        set_entry_signal(df, cross_up, direction="long", tag="sma_cross")
+
+        risk = df["range_M15"].fillna(df["close"] * 1e-3)
+        set_levels(
+            df, cross_up,
+            sl=df["close"] - risk,
+            tp1=df["close"] + risk * self.params["RR"],
+            tp2=df["close"] + risk * self.params["RR"] * 2,
+            sl_tag="auto", tp1_tag="tp1", tp2_tag="tp2",
+        )
+
+    def populate_exit_trend(self):
+        self.df["signal_exit"] = None
+        self.df["custom_stop_loss"] = None
+
+
+def _bars() -> pd.DataFrame:
+    rng = np.random.default_rng(4)
+    n = 1000
+    close = 1.1 + np.cumsum(rng.normal(0, 5e-4, n))
+    return pd.DataFrame({
+        # ns, as the data backends produce it
+        "time": pd.date_range(START, periods=n, freq="5min").as_unit("ns"),
+        "open": close,
+        "high": close + rng.uniform(0, 8e-4, n),
+        "low": close - rng.uniform(0, 8e-4, n),
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+def _provider(tmp_path):
+    """
+    Provider over the Parquet cache + manifest and a frame cache,
+    M5 already cached (informatives are resampled from it in the
+    workers).
+    """
+    provider = DefaultOhlcvDataProvider(
+        backend=FakeBackend(_bars()),
+        cache=ParquetMarketDataCache(tmp_path),
+        backtest_start=START,
+        backtest_end=END,
+        resampler=OhlcvResampler(),
+        frame_cache=FrameCache(),
+    )
+    data = {
+        symbol: provider.get_ohlcv(symbol=symbol, timeframe="M5", start=START, end=END)
+        for symbol in SYMBOLS
+    }
+    return provider, data
+
+
+def test_multi_symbol_strategies_run_in_worker_processes(tmp_path):
+    provider, data = _provider(tmp_path)
+
+    # loaded frames stay in this process
+    assert provider.frame_cache.stats()["entries"] == len(SYMBOLS)
+    copy = pickle.loads(pickle.dumps(provider))
+    assert copy.frame_cache.stats()["entries"] == 0
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                run_strategy_single,
+                symbol,
+                df,
+                PreloadedProvider(provider, {}),
+                InformativeSmaStrategy,
+                0,
+            )
+            for symbol, df in data.items()
+        ]
+        results = [future.result() for future in futures]
+
+    for symbol, (signals, strategy) in zip(SYMBOLS, results):
+        assert (signals["symbol"] == symbol).all()
+        assert strategy.df["range_M15"].notna().any()
+
+
+def test_sweep_runs_over_parquet_cache_provider(tmp_path):
+    provider, data = _provider(tmp_path)
+
+    summary = ParameterSweep(
+        strategy_cls=InformativeSmaStrategy,
+        provider=provider,
+        all_data=data,
+        startup_candle_count=0,
+        initial_balance=10_000,
+        max_workers=2,
+    ).run({"WINDOW": [10, 30], "RR": [1.0, 2.0]})
+
+    assert len(summary) == 4
+    assert (summary["trades"] > 0).all()
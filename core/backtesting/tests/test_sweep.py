@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from TechnicalAnalysis.MarketStructure.engine import MarketStructureEngine
+from TechnicalAnalysis.MarketStructure.graph import FeatureGraph
+from core.backtesting.sweep import ParameterSweep, _signals_job, expand_grid
+from core.strategy.BaseStrategy import BaseStrategy
+from core.strategy.signals import (
+    init_entry_columns,
+    set_entry_signal,
+    set_levels,
+)
+
+
+class SmaStrategy(BaseStrategy):
+
+    PARAMS = {"WINDOW": 20, "RR": 1.0}
+    FEATURE_PARAMS = ("WINDOW",)
+
+    def populate_indicators(self):
+        self.df["atr"] = (self.df["high"] - self.df["low"]).rolling(14).mean()
+        self.df["sma"] = self.df["close"].rolling(self.params["WINDOW"]).mean()
+
+    def populate_entry_trend(self):
+        df = self.df
+        init_entry_columns(df)
+
+        cross_up = (df["close"] > df["sma"]) & (df["close"].shift(1) <= df["sma"].shift(1))
+        set_entry_signal(df, cross_up, direction="long", tag="sma_cross")
+
+        risk = df["close"] - df["low"].rolling(10).min()
+        set_levels(
+            df, cross_up,
+            sl=df["close"] - risk,
+            tp1=df["close"] + risk * self.params["RR"],
+            tp2=df["close"] + risk * self.params["RR"] * 2,
+            sl_tag="auto", tp1_tag="tp1", tp2_tag="tp2",
+        )
+
+    def populate_exit_trend(self):
+        self.df["signal_exit"] = None
+        self.df["custom_stop_loss"] = None
+
+
+class StructureStrategy(SmaStrategy):
+    """
+    Market structure as a lazy frame (as Samplestrategy).
+    """
+
+    def populate_indicators(self):
+        super().populate_indicators()
+        self.df = MarketStructureEngine.apply(
+            self.df,
+            features=["pivots", "price_action"],
+            pivot_range=self.params["WINDOW"],
+            cache=False,
+            lazy=True,
+        )
+
+    def populate_entry_trend(self):
+        super().populate_entry_trend()
+        self.df.loc[~self.df["bos_bull_event"].astype(bool), "signal_entry"] = None
+
+
+def _ohlcv(seed: int, base: float, vol: float) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n = 2000
+    close = base + np.cumsum(rng.normal(0, vol, n))
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="5min", tz="UTC"),
+        "open": close,
+        "high": close + rng.uniform(0, 1.5 * vol, n),
+        "low": close - rng.uniform(0, 1.5 * vol, n),
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+def test_expand_grid():
+    assert expand_grid({"a": [1, 2], "b": [3]}) == [
+        {"a": 1, "b": 3},
+        {"a": 2, "b": 3},
+    ]
+    assert expand_grid({}) == [{}]
+
+
+def test_sweep_groups_by_feature_params_and_summarizes():
+    sweep = ParameterSweep(
+        strategy_cls=SmaStrategy,
+        provider=None,
+        all_data={"XAUUSD": _ohlcv(1, 2000, 1.0), "EURUSD": _ohlcv(2, 1.1, 0.0005)},
+        startup_candle_count=0,
+        initial_balance=10_000,
+        max_workers=2,
+    )
+
+    grid = {
+        "WINDOW": [10, 30],
+        "RR": [1.0, 2.0, 3.0],
+        "MAX_RISK_PER_TRADE": [0.005, 0.01],
+    }
+
+    groups = sweep.group_by_features(grid)
+    assert sorted(groups) == [(("WINDOW", 10),), (("WINDOW", 30),)]
+
+    summary = sweep.run(grid)
+
+    assert len(summary) == 12
+    assert set(grid) <= set(summary.columns)
+    assert (summary["trades"] > 0).all()
+
+    # risk only scales PnL, trade count is unchanged
+    by_risk = summary.set_index(["WINDOW", "RR", "MAX_RISK_PER_TRADE"])
+    assert (
+        by_risk.xs(0.005, level=2)["trades"]
+        .equals(by_risk.xs(0.01, level=2)["trades"])
+    )
+
+
+def test_sweep_computes_market_structure_once(monkeypatch):
+    runs = []
+    run = FeatureGraph.run
+
+    def counting_run(self, df, **kwargs):
+        if len(df) > 1:                 # not the 1-bar schema probe
+            runs.append(len(df))
+        return run(self, df, **kwargs)
+
+    monkeypatch.setattr(FeatureGraph, "run", counting_run)
+
+    sweep = ParameterSweep(
+        strategy_cls=StructureStrategy,
+        provider=None,
+        all_data={"XAUUSD": _ohlcv(1, 2000, 1.0)},
+        startup_candle_count=0,
+        initial_balance=10_000,
+        max_workers=2,
+    )
+    groups = sweep.group_by_features({"WINDOW": [5], "RR": [1.0, 2.0, 3.0]})
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        features = sweep.compute_features(executor, groups)
+    assert runs == [2000]
+
+    # signal jobs receive the frames pickled, in other processes
+    shipped = pickle.loads(pickle.dumps(features))
+    for key, chunk in sweep.chunk_groups(groups):
+        _signals_job(shipped[key], chunk, StructureStrategy, 0, 0.0, 10_000)
+    assert runs == [2000]
+
+
+def test_finalized_frames_are_plain_dataframes():
+    strategy = StructureStrategy(_ohlcv(1, 2000, 1.0), "XAUUSD", startup_candle_count=0)
+    strategy.run()
+
+    assert type(strategy.df_backtest) is pd.DataFrame
+    assert type(strategy.df_plot) is pd.DataFrame
+    assert "bos_bull_event" in strategy.df_plot.columns
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from core.backtesting.backtester import Backtester
+from core.backtesting.sweep import build_signals
+from core.backtesting.tests.test_sweep import SmaStrategy, _ohlcv
+from core.backtesting.walk_forward import WalkForward, generate_windows
+from core.strategy.runner import run_strategy_features
+
+
+def test_generate_windows_rolling_and_anchored():
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    end = pd.Timestamp("2024-01-11", tz="UTC")
+
+    rolling = generate_windows(start, end, train="4D", test="2D")
+    assert [w.test_start.day for w in rolling] == [5, 7, 9]
+    assert [w.train_start.day for w in rolling] == [1, 3, 5]
+    assert rolling[-1].test_end == end
+
+    anchored = generate_windows(start, end, train="4D", test="2D", anchored=True)
+    assert {w.train_start for w in anchored} == {start}
+
+
+def test_walk_forward_oos_matches_full_range_signals():
+    all_data = {"XAUUSD": _ohlcv(1, 2000, 1.0)}
+    start = all_data["XAUUSD"]["time"].iloc[0]
+    end = all_data["XAUUSD"]["time"].iloc[-1]
+
+    windows = generate_windows(start, end, train="2D", test="1D")
+
+    summary, oos = WalkForward(
+        strategy_cls=SmaStrategy,
+        provider=None,
+        all_data=all_data,
+        startup_candle_count=100,
+        initial_balance=10_000,
+        max_workers=2,
+    ).run({"WINDOW": [10, 30], "RR": [1.0, 2.0]}, windows)
+
+    assert len(summary) == len(windows)
+    assert not oos.empty
+
+    # OOS trades from sliced features == full-range signals sliced
+    for row in summary.itertuples():
+        params = {"WINDOW": row.WINDOW, "RR": row.RR}
+        features = run_strategy_features(
+            "XAUUSD", all_data["XAUUSD"], None, SmaStrategy, 100, params=params
+        )
+        signals = build_signals({"XAUUSD": features}, SmaStrategy, 100, params)
+        signals = signals[
+            (signals["time"] >= row.test_start) & (signals["time"] < row.test_end)
+        ]
+        expected = Backtester(verbose=False).run_backtest(signals)
+
+        got = oos[oos["window"] == row.window].drop(columns="window")
+        assert len(got) == len(expected) == row.test_trades
+        pd.testing.assert_frame_equal(
+            got.reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_like=True,
+            check_dtype=False,  # concat across windows upcasts None-only columns
+        )
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+import pandas as pd
+
+from core.backtesting.backtester import Backtester
+from core.backtesting.sweep import (
+    ParameterSweep,
+    build_signals,
+    split_combo,
+    summarize_trades,
+)
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """
+    One train / test split. Ranges are half-open: [start, end).
+    """
+    label: str
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_start: pd.Timestamp
+    test_end: pd.Timestamp
+
+
+def generate_windows(
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    *,
+    train: str | pd.Timedelta,
+    test: str | pd.Timedelta,
+    step: str | pd.Timedelta | None = None,
+    anchored: bool = False,
+) -> list[WalkForwardWindow]:
+    """
+    Rolling (fixed-length train) or anchored (train always starts at
+    `start`) walk-forward windows covering [start, end).
+
+    step defaults to `test`, i.e. back-to-back test slices.
+    """
+    train = pd.Timedelta(train)
+    test = pd.Timedelta(test)
+    step = pd.Timedelta(step) if step is not None else test
+
+    if train <= pd.Timedelta(0) or test <= pd.Timedelta(0) or step <= pd.Timedelta(0):
+        raise ValueError("train, test and step must be positive")
+
+    windows = []
+    test_start = start + train
+
+    while test_start < end:
+        windows.append(
+            WalkForwardWindow(
+                label=f"WF{len(windows):02d}",
+                train_start=start if anchored else test_start - train,
+                train_end=test_start,
+                test_start=test_start,
+                test_end=min(test_start + test, end),
+            )
+        )
+        test_start += step
+
+    if not windows:
+        raise ValueError(
+            f"TIMERANGE {start} → {end} is shorter than one train window ({train})"
+        )
+
+    return windows
+
+
+def _slice_time(df: pd.DataFrame, start, end, warmup: int = 0) -> pd.DataFrame:
+    """
+    Rows with start <= time < end (plus `warmup` rows before start).
+    df must be sorted by time.
+    """
+    lo, hi = df["time"].searchsorted([start, end])
+    return df.iloc[max(0, lo - warmup):hi]
+
+
+# ==================================================
+# Workers (top-level for multiprocessing)
+# ==================================================
+
+def _train_job(
+    features_by_symbol,
+    combos,
+    windows,
+    strategy_cls,
+    startup_candle_count,
+    slippage,
+    initial_balance,
+):
+    """
+    Signals are built ONCE per combination over the full range,
+    then every train window is a slice of them.
+    """
+    rows = []
+
+    for combo in combos:
+        strategy_params, backtest_kwargs = split_combo(combo)
+
+        signals_df = build_signals(
+            features_by_symbol,
+            strategy_cls,
+            startup_candle_count,
+            strategy_params,
+        )
+
+        backtester = Backtester(
+            slippage=slippage,
+            max_workers=1,
+            verbose=False,
+            **backtest_kwargs,
+        )
+
+        for window in windows:
+            df_slice = _slice_time(signals_df, window.train_start, window.train_end)
+            trades = backtester.run_backtest(df_slice) if not df_slice.empty else pd.DataFrame()
+
+            rows.append({
+                "window": window.label,
+                **combo,
+                **summarize_trades(trades, initial_balance),
+            })
+
+    return rows
+
+
+def _test_job(
+    features_by_symbol,
+    combo,
+    window,
+    strategy_cls,
+    startup_candle_count,
+    slippage,
+):
+    """
+    Out-of-sample run of the selected combination on one test window.
+    Signals use only the test slice + startup_candle_count warm-up bars.
+    """
+    strategy_params, backtest_kwargs = split_combo(combo)
+
+    sliced = {
+        symbol: _slice_time(
+            df, window.test_start, window.test_end, warmup=startup_candle_count
+        )
+        for symbol, df in features_by_symbol.items()
+    }
+
+    signals_df = build_signals(
+        sliced,
+        strategy_cls,
+        startup_candle_count,
+        strategy_params,
+    )
+    df_test = _slice_time(signals_df, window.test_start, window.test_end)
+
+    if df_test.empty:
+        return pd.DataFrame()
+
+    trades = Backtester(
+        slippage=slippage,
+        max_workers=1,
+        verbose=False,
+        **backtest_kwargs,
+    ).run_backtest(df_test)
+
+    if not trades.empty:
+        trades["window"] = window.label
+    return trades
+
+
+# ==================================================
+# Walk-forward engine
+# ==================================================
+
+class WalkForward(ParameterSweep):
+    """
+    Walk-forward optimisation over a parameter grid.
+
+    Stages:
+    1. features  - once per (symbol, feature set) over the FULL range
+    2. train     - every combination on every train slice (signals
+                   built once per combination and sliced)
+    3. select    - best combination per window by `objective`
+    4. test      - selected combination on its test slice; windows
+                   run concurrently
+
+    Result: (per-window summary, stitched out-of-sample trades).
+    """
+
+    def __init__(self, *, objective: str = "expectancy", min_trades: int = 1, **kwargs):
+        super().__init__(**kwargs)
+        self.objective = objective
+        self.min_trades = min_trades
+
+    def _select(self, train_df: pd.DataFrame, window: WalkForwardWindow, grid_keys) -> dict | None:
+        candidates = train_df[
+            (train_df["window"] == window.label)
+            & (train_df["trades"] >= self.min_trades)
+        ]
+        if candidates.empty:
+            return None
+
+        best = candidates.loc[candidates[self.objective].idxmax()]
+        return {
+            k: best[k].item() if hasattr(best[k], "item") else best[k]
+            for k in grid_keys
+        }
+
+    def run(self, grid: dict[str, list], windows: list[WalkForwardWindow]):
+
+        self._validate(grid)
+        groups = self.group_by_features(grid)
+
+        t_start = perf_counter()
+        n_combos = sum(len(c) for c in groups.values())
+        print(
+            f"🚶 WALK-FORWARD | {len(windows)} windows, {n_combos} combinations, "
+            f"{len(groups)} feature sets, {len(self.all_data)} symbols"
+        )
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+
+            # ==========================================
+            # 1️⃣ FEATURES (full range, once per feature set)
+            # ==========================================
+            features = self.compute_features(executor, groups)
+
+            print(f"🚶 WALK-FORWARD | features {perf_counter() - t_start:8.3f}s")
+
+            # ==========================================
+            # 2️⃣ TRAIN (all combinations × all windows)
+            # ==========================================
+            train_futures = [
+                executor.submit(
+                    _train_job,
+                    features[key],
+                    chunk,
+                    windows,
+                    self.strategy_cls,
+                    self.startup_candle_count,
+                    self.slippage,
+                    self.initial_balance,
+                )
+                for key, chunk in self.chunk_groups(groups)
+            ]
+
+            train_rows = []
+            for future in train_futures:
+                train_rows.extend(future.result())
+            train_df = pd.DataFrame(train_rows)
+
+            print(f"🚶 WALK-FORWARD | train {perf_counter() - t_start:8.3f}s")
+
+            # ==========================================
+            # 3️⃣ SELECT + 4️⃣ TEST (windows concurrently)
+            # ==========================================
+            selected = {}
+            test_futures = {}
+            for window in windows:
+                combo = self._select(train_df, window, grid)
+                if combo is None:
+                    print(f"⚠️ WALK-FORWARD | {window.label}: no combination with trades")
+                    continue
+
+                selected[window.label] = combo
+                test_futures[window.label] = executor.submit(
+                    _test_job,
+                    features[self._feature_key(combo)],
+                    combo,
+                    window,
+                    self.strategy_cls,
+                    self.startup_candle_count,
+                    self.slippage,
+                )
+
+            test_trades = {
+                label: future.result() for label, future in test_futures.items()
+            }
+
+        # ==========================================
+        # SUMMARY
+        # ==========================================
+        rows = []
+        for window in windows:
+            if window.label not in selected:
+                continue
+
+            combo = selected[window.label]
+            train_row = train_df[
+                (train_df["window"] == window.label)
+                & (train_df[list(combo)] == pd.Series(combo)).all(axis=1)
+            ].iloc[0]
+
+            test_summary = summarize_trades(test_trades[window.label], self.initial_balance)
+
+            rows.append({
+                "window": window.label,
+                "train_start": window.train_start,
+                "train_end": window.train_end,
+                "test_start": window.test_start,
+                "test_end": window.test_end,
+                **combo,
+                f"train_{self.objective}": train_row[self.objective],
+                "train_trades": train_row["trades"],
+                **{f"test_{k}": v for k, v in test_summary.items()},
+            })
+
+        summary = pd.DataFrame(rows)
+
+        oos = [t for t in test_trades.values() if not t.empty]
+        oos_trades = (
+            pd.concat(oos).sort_values(by=["exit_time", "symbol"]).reset_index(drop=True)
+            if oos else pd.DataFrame()
+        )
+
+        print(f"🚶 WALK-FORWARD | TOTAL {perf_counter() - t_start:8.3f}s")
+
+        return summary, oos_trades
@@ -1,5 +1,6 @@
 from .backend import MarketDataBackend
 from .cache import MarketDataCache
+from .parquet_cache import ParquetMarketDataCache
 from .default_provider import DefaultOhlcvDataProvider
 from .exceptions import (
     DataProviderError,
@@ -10,6 +11,7 @@ from .exceptions import (
 __all__ = [
     "MarketDataBackend",
     "MarketDataCache",
+    "ParquetMarketDataCache",
     "DefaultOhlcvDataProvider",
     "DataProviderError",
     "InvalidDataRequest",
@@ -12,4 +12,18 @@ class MarketDataBackend(Protocol):
         start: pd.Timestamp,
         end: pd.Timestamp,
     ) -> pd.DataFrame:
-        ...
\ No newline at end of file
+        ...
+
+class TickDataBackend(Protocol):
+    def fetch_ticks(
+        self,
+        *,
+        symbol: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """
+        Ticks in [start, end): time (UTC), bid, ask.
+        Empty frame when the source has none.
+        """
+        ...
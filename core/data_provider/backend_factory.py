@@ -1,6 +1,7 @@
 from core.data_provider import MarketDataBackend
 from core.data_provider.backends.dukascopy import DukascopyBackend
 from core.data_provider.clients.dukascopy import DukascopyClient
+from core.data_provider.clients.dukascopy_bi5 import DukascopyBi5Client
 
 
 def create_backtest_backend(name: str) -> MarketDataBackend:
@@ -11,5 +12,10 @@ def create_backtest_backend(name: str) -> MarketDataBackend:
             client=DukascopyClient()
         )
 
+    if name == "dukascopy-bi5":
+        return DukascopyBackend(
+            client=DukascopyBi5Client()
+        )
+
     raise ValueError(
-        f"Unsupported backtest backend: {name}. Allowed: dukascopy, csv")
+        f"Unsupported backtest backend: {name}. Allowed: dukascopy, dukascopy-bi5, csv")
@@ -60,6 +60,25 @@ class DukascopyBackend(MarketDataBackend):
 
         return self._normalize(df)
 
+    def fetch_ticks(
+        self,
+        *,
+        symbol: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        if not hasattr(self.client, "get_ticks"):
+            raise DataNotAvailable(
+                f"{type(self.client).__name__} does not provide ticks"
+            )
+
+        try:
+            return self.client.get_ticks(symbol=symbol, start=start, end=end)
+        except Exception as exc:
+            raise DataNotAvailable(
+                f"Failed to fetch Dukascopy ticks for {symbol}"
+            ) from exc
+
     @staticmethod
     def _normalize(df: pd.DataFrame) -> pd.DataFrame:
         """
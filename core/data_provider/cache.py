@@ -3,6 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 import pandas as pd
 
+from core.data_provider.manifest import CacheManifest
+from core.utils.timeframe import timeframe_to_timedelta
+
 
 class MarketDataCache:
     """
@@ -12,11 +15,16 @@ class MarketDataCache:
     Cache is PASSIVE:
     - does NOT decide whether data is missing
     - writes ONLY when provider explicitly asks
+
+    Coverage / gaps come from the CacheManifest (no file reads).
     """
 
+    MANIFEST_NAME = "manifest.csv.json"
+
     def __init__(self, root: Path):
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = CacheManifest(self.root, name=self.MANIFEST_NAME)
 
     # -------------------------------------------------
     # Paths
@@ -29,12 +37,27 @@ class MarketDataCache:
     # Coverage
     # -------------------------------------------------
 
+    def _index(self, symbol: str, timeframe: str, df: pd.DataFrame) -> None:
+        path = self._path(symbol, timeframe)
+        self.manifest.record(
+            symbol=symbol,
+            timeframe=timeframe,
+            files={path.name: (path, df)},
+            bar=timeframe_to_timedelta(timeframe),
+            replace=True,
+        )
+
     def coverage(
         self,
         *,
         symbol: str,
         timeframe: str,
     ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        coverage = self.manifest.coverage(symbol=symbol, timeframe=timeframe)
+        if coverage is not None:
+            return coverage
+
+        # file written before the manifest existed: index it once
         path = self._path(symbol, timeframe)
         if not path.exists():
             return None
@@ -43,8 +66,39 @@ class MarketDataCache:
         if df.empty:
             return None
 
-        times = pd.to_datetime(df["time"], utc=True)
-        return times.min(), times.max()
+        df["time"] = pd.to_datetime(df["time"], utc=True)
+        self._index(symbol, timeframe, df.sort_values("time"))
+        return self.manifest.coverage(symbol=symbol, timeframe=timeframe)
+
+    def gaps(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        if self.coverage(symbol=symbol, timeframe=timeframe) is None:
+            return []
+        return self.manifest.gaps(symbol=symbol, timeframe=timeframe)
+
+    def checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        return self.manifest.checked(symbol=symbol, timeframe=timeframe)
+
+    def mark_checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> None:
+        self.manifest.mark_checked(
+            symbol=symbol, timeframe=timeframe, start=start, end=end
+        )
 
     # -------------------------------------------------
     # Load
@@ -86,11 +140,9 @@ class MarketDataCache:
             return
 
         path = self._path(symbol, timeframe)
-        (
-            df.sort_values("time")
-              .reset_index(drop=True)
-              .to_csv(path, index=False)
-        )
+        df = df.sort_values("time").reset_index(drop=True)
+        df.to_csv(path, index=False)
+        self._index(symbol, timeframe, df)
 
     def append(
             self,
@@ -125,3 +177,4 @@ class MarketDataCache:
             return
 
         combined.to_csv(path, index=False)
+        self._index(symbol, timeframe, combined)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+class TradingCalendar:
+    """
+    Weekly session calendar (UTC) used to tell real holes in cached
+    data from closed-market periods.
+
+    Default: FX / metals, closed from Friday close until Sunday
+    re-open. The window is the narrowest one over DST (Fri 22:00 →
+    Sun 21:00), so an hour around the edges may look open; such
+    intervals are fetched once and then marked as checked.
+    """
+
+    def __init__(
+        self,
+        *,
+        close: tuple[int, str] | None = (4, "22:00"),   # (weekday, HH:MM)
+        reopen: tuple[int, str] | None = (6, "21:00"),
+    ):
+        self.close = self._minute_of_week(close) if close else None
+        self.reopen = self._minute_of_week(reopen) if reopen else None
+
+    @staticmethod
+    def _minute_of_week(spec: tuple[int, str]) -> int:
+        day, hhmm = spec
+        hours, minutes = map(int, hhmm.split(":"))
+        return day * 1440 + hours * 60 + minutes
+
+    @classmethod
+    def always_open(cls) -> "TradingCalendar":
+        """
+        24/7 markets (crypto).
+        """
+        return cls(close=None, reopen=None)
+
+    def is_open(self, times: pd.DatetimeIndex) -> np.ndarray:
+        if self.close is None:
+            return np.ones(len(times), dtype=bool)
+
+        times = times.tz_convert("UTC") if times.tz is not None else times
+        minute = (
+            times.dayofweek.to_numpy() * 1440
+            + times.hour.to_numpy() * 60
+            + times.minute.to_numpy()
+        )
+        return ~((minute >= self.close) & (minute < self.reopen))
+
+    def open_bars(
+        self,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        freq: str,
+    ) -> pd.DatetimeIndex:
+        """
+        Bar times in [start, end] falling into open sessions.
+        """
+        bars = pd.date_range(start, end, freq=freq)
+        return bars[self.is_open(bars)]
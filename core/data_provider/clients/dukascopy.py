@@ -48,6 +48,7 @@ class DukascopyClient:
                 timeframe=timeframe,
                 start=start,
                 end=end,
+                workdir=Path(tmpdir),
             )
 
             df = self._load_csv(csv_path)
@@ -70,8 +71,8 @@ class DukascopyClient:
             timeframe: str,
             start: pd.Timestamp,
             end: pd.Timestamp,
+            workdir: Path,
     ) -> Path:
-        workdir = Path(tempfile.mkdtemp())
 
         print(
             f"📥 Dukascopy | fetching {symbol} {timeframe} "
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import http.client
+import lzma
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider.resample import aggregate_bars
+from core.utils.timeframe import timeframe_to_timedelta
+
+
+# ==================================================
+# bi5 record layouts (big-endian, LZMA compressed)
+# ==================================================
+
+# <hour>h_ticks.bi5: ms from hour start, ask, bid (integer points), volumes
+TICK_DTYPE = np.dtype([
+    ("ms", ">u4"),
+    ("ask", ">u4"),
+    ("bid", ">u4"),
+    ("ask_volume", ">f4"),
+    ("bid_volume", ">f4"),
+])
+
+# <side>_candles_{min,hour}_1.bi5: seconds from file start, note the OCLH order
+CANDLE_DTYPE = np.dtype([
+    ("sec", ">u4"),
+    ("open", ">u4"),
+    ("close", ">u4"),
+    ("low", ">u4"),
+    ("high", ">u4"),
+    ("volume", ">f4"),
+])
+
+# Dukascopy instrument ids for our symbols (identity if missing)
+DUKASCOPY_SYMBOLS = {
+    "USTECH100": "USA100IDXUSD",
+}
+
+# integer price -> price divisor (default 1e5)
+PRICE_SCALES = {
+    "XAUUSD": 1e3,
+    "XAGUSD": 1e3,
+    "USA100IDXUSD": 1e3,
+}
+
+OHLCV_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+
+NS_MINUTE = 60 * 10**9
+NS_HOUR = 60 * NS_MINUTE
+
+
+def decode_ticks(raw: bytes, hour_start_ns: int, scale: float) -> dict[str, np.ndarray]:
+    """
+    Decompressed tick file -> {time (int64 ns), bid, ask, volume}.
+    """
+    rec = np.frombuffer(raw, dtype=TICK_DTYPE)
+    return {
+        "time": hour_start_ns + rec["ms"].astype(np.int64) * 10**6,
+        "bid": rec["bid"] / scale,
+        "ask": rec["ask"] / scale,
+        "volume": rec["bid_volume"].astype(np.float64),
+    }
+
+
+def decode_candles(raw: bytes, file_start_ns: int, scale: float) -> dict[str, np.ndarray]:
+    """
+    Decompressed candle file -> {time (int64 ns), open, high, low, close, volume}.
+    """
+    rec = np.frombuffer(raw, dtype=CANDLE_DTYPE)
+    return {
+        "time": file_start_ns + rec["sec"].astype(np.int64) * 10**9,
+        "open": rec["open"] / scale,
+        "high": rec["high"] / scale,
+        "low": rec["low"] / scale,
+        "close": rec["close"] / scale,
+        "volume": rec["volume"].astype(np.float64),
+    }
+
+
+def ticks_to_bars(
+    ticks: dict[str, np.ndarray],
+    bar_ns: int,
+    side: str = "bid",
+) -> dict[str, np.ndarray]:
+    """
+    Time-sorted ticks -> OHLCV bars of bar_ns (epoch aligned).
+    """
+    price = ticks[side]
+    return aggregate_bars(
+        {
+            "time": ticks["time"],
+            "open": price,
+            "high": price,
+            "low": price,
+            "close": price,
+            "volume": ticks["volume"],
+        },
+        bar_ns,
+    )
+
+
+# ==================================================
+# HTTP layer
+# ==================================================
+
+class HttpFetcher:
+    """
+    Minimal pooled HTTP GET: one keep-alive connection per thread,
+    so a pool of N download threads reuses N connections.
+
+    fetch(path) returns the body, or None for 404 (no file there).
+    Other statuses / network errors are retried, then raised.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://datafeed.dukascopy.com/datafeed",
+        *,
+        timeout: float = 30.0,
+        retries: int = 3,
+    ):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self._local = threading.local()
+
+    # connections stay in the process that opened them
+    # (the backend is pickled into worker processes)
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = (
+                http.client.HTTPSConnection
+                if self.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = self._local.conn = cls(self.netloc, timeout=self.timeout)
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def fetch(self, path: str) -> bytes | None:
+        url = f"{self.prefix}/{path}"
+
+        for attempt in range(self.retries + 1):
+            try:
+                conn = self._connection()
+                conn.request("GET", url)
+                resp = conn.getresponse()
+                body = resp.read()
+
+                if resp.status == 200:
+                    return body
+                if resp.status == 404:
+                    return None
+                raise ConnectionError(f"HTTP {resp.status} for {url}")
+
+            except (OSError, http.client.HTTPException):
+                self._reset()
+                if attempt == self.retries:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+
+
+# ==================================================
+# Client
+# ==================================================
+
+class DukascopyBi5Client:
+    """
+    Native Dukascopy OHLCV / tick client (no Node / CSV round-trip).
+
+    Downloads the datafeed's bi5 files concurrently and decodes them
+    straight into NumPy arrays:
+
+        <SYM>/<YYYY>/<MM-1>/<SIDE>_candles_hour_1.bi5   finished months
+        <SYM>/<YYYY>/<MM-1>/<DD>/<SIDE>_candles_min_1.bi5   finished days
+        <SYM>/<YYYY>/<MM-1>/<DD>/<HH>h_ticks.bi5   the current day
+
+    Hour candles are used for timeframes that are whole hours,
+    minute candles otherwise; ticks only where no candle file exists
+    yet. Everything is aggregated to the requested timeframe
+    (epoch-aligned buckets, flat zero-volume candles dropped).
+
+    Returns an empty frame when the source has no data; network
+    errors are raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetcher: HttpFetcher | None = None,
+        side: str = "BID",
+        max_workers: int = 16,
+    ):
+        self.fetcher = fetcher or HttpFetcher()
+        self.side = side.upper()
+        self.max_workers = max_workers
+
+    # ==================================================
+    # Public API
+    # ==================================================
+
+    def get_ohlcv(
+            self,
+            *,
+            symbol: str,
+            timeframe: str,
+            start: pd.Timestamp,
+            end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        start = self._to_utc(start)
+        end = self._to_utc(end)
+
+        if start >= end:
+            raise ValueError("start must be earlier than end")
+
+        bar_ns = timeframe_to_timedelta(timeframe).value
+        instrument, scale = self._instrument(symbol)
+
+        hourly = bar_ns % NS_HOUR == 0
+        base_ns = NS_HOUR if hourly else NS_MINUTE
+        plan = self._plan(start, end, hourly=hourly)
+
+        print(
+            f"📥 Dukascopy | fetching {symbol} {timeframe} "
+            f"{start.strftime('%Y-%m-%d')} → {end.strftime('%Y-%m-%d')} "
+            f"({len(plan)} files)"
+        )
+
+        def load(item):
+            kind, period = item
+            raw = self.fetcher.fetch(self._path(instrument, kind, period))
+            if not raw:
+                return None
+            raw = lzma.decompress(raw)
+
+            if kind == "ticks":
+                return ticks_to_bars(
+                    decode_ticks(raw, period.value, scale), base_ns, self.side.lower()
+                )
+
+            bars = decode_candles(raw, period.value, scale)
+            keep = bars["volume"] > 0
+            return {k: v[keep] for k, v in bars.items()}
+
+        parts = self._download(plan, load)
+        if not parts:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        bars = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+        bars = aggregate_bars(bars, bar_ns)
+
+        df = pd.DataFrame(bars)
+        df["time"] = pd.to_datetime(df["time"], unit="ns", utc=True)
+
+        mask = (df["time"] >= start) & (df["time"] <= end)
+        return df.loc[mask, OHLCV_COLUMNS].reset_index(drop=True)
+
+    def get_ticks(
+            self,
+            *,
+            symbol: str,
+            start: pd.Timestamp,
+            end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """
+        Ticks in [start, end): time (ns, UTC), bid / ask (float32).
+        """
+        start = self._to_utc(start)
+        end = self._to_utc(end)
+
+        if start >= end:
+            raise ValueError("start must be earlier than end")
+
+        instrument, scale = self._instrument(symbol)
+        last = min(end, pd.Timestamp.now(tz="UTC")) - pd.Timedelta(1, "ns")
+        plan = [
+            ("ticks", hour)
+            for hour in pd.date_range(start.floor("h"), last.floor("h"), freq="h")
+        ]
+
+        def load(item):
+            _, hour = item
+            raw = self.fetcher.fetch(self._path(instrument, "ticks", hour))
+            if not raw:
+                return None
+            return decode_ticks(lzma.decompress(raw), hour.value, scale)
+
+        parts = self._download(plan, load)
+        if not parts:
+            return pd.DataFrame({
+                "time": pd.Series([], dtype="datetime64[ns, UTC]"),
+                "bid": pd.Series([], dtype=np.float32),
+                "ask": pd.Series([], dtype=np.float32),
+            })
+
+        time_ns = np.concatenate([p["time"] for p in parts])
+        keep = (time_ns >= start.value) & (time_ns < end.value)
+
+        return pd.DataFrame({
+            "time": pd.to_datetime(time_ns[keep], unit="ns", utc=True),
+            "bid": np.concatenate([p["bid"] for p in parts])[keep].astype(np.float32),
+            "ask": np.concatenate([p["ask"] for p in parts])[keep].astype(np.float32),
+        })
+
+    # ==================================================
+    # Internal helpers
+    # ==================================================
+
+    @staticmethod
+    def _instrument(symbol: str) -> tuple[str, float]:
+        instrument = DUKASCOPY_SYMBOLS.get(symbol, symbol).upper()
+        scale = PRICE_SCALES.get(instrument, 1e3 if instrument.endswith("JPY") else 1e5)
+        return instrument, scale
+
+    def _download(self, plan: list, load) -> list:
+        """
+        load(item) for every plan item on the download pool, in plan
+        order; items without data are dropped.
+        """
+        workers = max(1, min(self.max_workers, len(plan)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return [p for p in pool.map(load, plan) if p is not None]
+
+    def _plan(
+        self,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        *,
+        hourly: bool,
+    ) -> list[tuple[str, pd.Timestamp]]:
+        """
+        (file kind, period start) covering [start, end]: the coarsest
+        file that is already final, per period.
+        """
+        now = pd.Timestamp.now(tz="UTC")
+        today = now.floor("D")
+        end = min(end, now)
+
+        plan = []
+        day = start.floor("D")
+
+        while day <= end:
+            month = day.replace(day=1)
+            next_month = month + pd.offsets.MonthBegin(1)
+
+            if hourly and next_month <= today:
+                plan.append(("hour_candles", month))
+                day = next_month
+                continue
+
+            if day < today:
+                plan.append(("min_candles", day))
+            else:
+                hours = pd.date_range(day, min(end, now).floor("h"), freq="h")
+                plan.extend(("ticks", hour) for hour in hours)
+
+            day += pd.Timedelta(days=1)
+
+        return plan
+
+    def _path(self, instrument: str, kind: str, period: pd.Timestamp) -> str:
+        # months are zero-based in datafeed paths
+        month = f"{instrument}/{period.year}/{period.month - 1:02d}"
+
+        if kind == "hour_candles":
+            return f"{month}/{self.side}_candles_hour_1.bi5"
+        if kind == "min_candles":
+            return f"{month}/{period.day:02d}/{self.side}_candles_min_1.bi5"
+        return f"{month}/{period.day:02d}/{period.hour:02d}h_ticks.bi5"
+
+    @staticmethod
+    def _to_utc(ts: pd.Timestamp) -> pd.Timestamp:
+        ts = pd.Timestamp(ts)
+        if ts.tzinfo is None:
+            return ts.tz_localize("UTC")
+        return ts.tz_convert("UTC")
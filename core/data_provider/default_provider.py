@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+
+from core.data_provider.calendar import TradingCalendar
 from core.data_provider.exceptions import (
+    DataNotAvailable,
     InvalidDataRequest,
 )
-from core.utils.timeframe import timeframe_to_pandas_freq
+from core.data_provider.feature_store import FeatureStore
+from core.data_provider.frame_cache import FrameCache
+from core.data_provider.mmap_store import MmapOhlcvStore
+from core.data_provider.quality import OhlcvValidator, quality_report
+from core.data_provider.resample import OhlcvResampler
+from core.utils.frames import cow_copy, slice_frame
+from core.utils.timeframe import timeframe_to_pandas_freq, timeframe_to_timedelta
 
 
 def validate_request(*, start, end, lookback):
@@ -24,23 +36,48 @@ class DefaultOhlcvDataProvider:
     BACKTEST OHLCV provider.
 
     Responsibilities:
-    - decide if data is missing (TIME-BASED)
-    - fetch ONLY missing ranges
+    - decide if data is missing (TIME-BASED, against the session calendar)
+    - fetch ONLY missing intervals (head, tail and internal holes)
     - write to cache ONLY when something was fetched
+    - with a resampler: build a timeframe from a cached finer one
+      instead of fetching it
+    - with a validator: check / repair fetched bars once, before they
+      are written (report kept in the cache manifest)
+    - with a frame_cache: serve repeated loads from memory
+    - with a feature_store: carried for strategies, which read their
+      feature stage through it (BaseStrategy.CACHE_FEATURES)
     """
 
+    # intervals younger than this are never marked as checked
+    # (the source may still publish them)
+    SETTLE = pd.Timedelta(days=1)
+
     def __init__(
         self,
         *,
         backend,
         cache,
-        backtest_start: pd.Timestamp,
-        backtest_end: pd.Timestamp,
+        backtest_start: pd.Timestamp | None = None,
+        backtest_end: pd.Timestamp | None = None,
+        calendar: TradingCalendar | None = None,
+        fetch_workers: int = 4,
+        mmap_store: MmapOhlcvStore | None = None,
+        resampler: OhlcvResampler | None = None,
+        validator: OhlcvValidator | None = None,
+        frame_cache: FrameCache | None = None,
+        feature_store: FeatureStore | None = None,
     ):
         self.backend = backend
         self.cache = cache
-        self.backtest_start = self._to_utc(backtest_start)
-        self.backtest_end = self._to_utc(backtest_end)
+        self.backtest_start = self._to_utc(backtest_start) if backtest_start is not None else None
+        self.backtest_end = self._to_utc(backtest_end) if backtest_end is not None else None
+        self.calendar = calendar or TradingCalendar()
+        self.fetch_workers = fetch_workers
+        self.mmap_store = mmap_store
+        self.resampler = resampler
+        self.validator = validator
+        self.frame_cache = frame_cache
+        self.feature_store = feature_store
 
     # -------------------------------------------------
     # Helpers
@@ -73,106 +110,373 @@ class DefaultOhlcvDataProvider:
         return df[base + rest]
 
     # -------------------------------------------------
-    # Main API
+    # Missing intervals
     # -------------------------------------------------
 
-    def get_ohlcv(
+    @staticmethod
+    def _subtract(
+        intervals: list[tuple[pd.Timestamp, pd.Timestamp]],
+        holes: list[tuple[pd.Timestamp, pd.Timestamp]],
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        intervals minus holes (all closed intervals).
+        """
+        out = []
+        for a, b in intervals:
+            pieces = [(a, b)]
+            for c0, c1 in holes:
+                nxt = []
+                for p0, p1 in pieces:
+                    if c1 < p0 or c0 > p1:
+                        nxt.append((p0, p1))
+                        continue
+                    if p0 < c0:
+                        nxt.append((p0, c0))
+                    if c1 < p1:
+                        nxt.append((c1, p1))
+                pieces = nxt
+            out.extend(pieces)
+        return out
+
+    def missing_intervals(
         self,
         *,
         symbol: str,
         timeframe: str,
         start: pd.Timestamp,
         end: pd.Timestamp,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        [first, last] missing bar of every hole in [start, end]:
+        not cached, not already checked, and inside open sessions.
+        """
+        freq = timeframe_to_pandas_freq(timeframe)
+        bar = pd.Timedelta(freq)
+
+        first = self._to_utc(start).floor(freq)
+        last = self._to_utc(end).floor(freq)
+
+        coverage = self.cache.coverage(symbol=symbol, timeframe=timeframe)
+
+        if coverage is None:
+            holes = [(first, last)]
+        else:
+            cov_start, cov_end = coverage
+            holes = []
+            if first < cov_start:
+                holes.append((first, min(last, cov_start - bar)))
+            for a, b in self.cache.gaps(symbol=symbol, timeframe=timeframe):
+                lo, hi = max(first, a + bar), min(last, b - bar)
+                if lo <= hi:
+                    holes.append((lo, hi))
+            if last > cov_end:
+                holes.append((max(first, cov_end + bar), last))
+
+        holes = self._subtract(
+            holes, self.cache.checked(symbol=symbol, timeframe=timeframe)
+        )
+
+        out = []
+        for a, b in holes:
+            bars = self.calendar.open_bars(a.ceil(freq), b, freq)
+            if len(bars):
+                out.append((bars[0], bars[-1]))
+        return out
+
+    def _fetch_interval(
+        self,
+        symbol: str,
+        timeframe: str,
+        interval: tuple[pd.Timestamp, pd.Timestamp],
+    ) -> pd.DataFrame | None:
+        """
+        Bars inside interval; empty = source has none there,
+        None = fetch failed (interval stays missing).
+        """
+        a, b = interval
+        bar = pd.Timedelta(timeframe_to_pandas_freq(timeframe))
+
+        try:
+            df = self.backend.fetch_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                start=a,
+                end=b + bar,
+            )
+        except DataNotAvailable as exc:
+            if exc.__cause__ is not None:
+                print(f"⚠️ Fetch failed {symbol} {timeframe} {a} → {b}: {exc.__cause__}")
+                return None
+            return pd.DataFrame()
+
+        if df is None or df.empty:
+            return pd.DataFrame()
+
+        df = self._validate(df)
+        return df[(df["time"] >= a) & (df["time"] <= b)]
+
+    # -------------------------------------------------
+    # Main API
+    # -------------------------------------------------
+
+    def get_ohlcv(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
     ) -> pd.DataFrame:
 
+        validate_request(start=start, end=end, lookback=None)
+
         start = self._to_utc(start)
         end = self._to_utc(end)
 
-        coverage = self.cache.coverage(
+        if self.resampler is not None:
+            df = self._get_resampled(symbol, timeframe, start, end)
+            if df is not None:
+                return df
+
+        # =================================================
+        # 1️⃣ MISSING INTERVALS (manifest only)
+        # =================================================
+        missing = self.missing_intervals(
             symbol=symbol,
             timeframe=timeframe,
+            start=start,
+            end=end,
         )
 
-        pieces: list[pd.DataFrame] = []
+        # =================================================
+        # 2️⃣ FETCH IN PARALLEL
+        # =================================================
+        if missing:
+            workers = max(1, min(self.fetch_workers, len(missing)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched = list(pool.map(
+                    lambda interval: self._fetch_interval(symbol, timeframe, interval),
+                    missing,
+                ))
+
+            frames = [df for df in fetched if df is not None and not df.empty]
+
+            # =================================================
+            # 3️⃣ WRITE ONCE
+            # =================================================
+            if frames:
+                new = self._validate(pd.concat(frames, ignore_index=True))
+                if self.validator is not None:
+                    new, report = self.validator.run(new, timeframe)
+
+                fresh = self.cache.coverage(symbol=symbol, timeframe=timeframe) is None
+                if fresh:
+                    self.cache.save(symbol=symbol, timeframe=timeframe, df=new)
+                else:
+                    self.cache.append(symbol=symbol, timeframe=timeframe, df=new)
+
+                if self.frame_cache is not None:
+                    self.frame_cache.invalidate(symbol=symbol, timeframe=timeframe)
+
+                if self.validator is not None:
+                    self.cache.manifest.record_quality(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        report=report,
+                        full=fresh,
+                    )
+
+            # whatever is still missing there does not exist at the source
+            settled = pd.Timestamp.now(tz="UTC") - self.SETTLE
+            for (a, b), df in zip(missing, fetched):
+                if df is not None and a <= settled:
+                    self.cache.mark_checked(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        start=a,
+                        end=min(b, settled),
+                    )
 
         # =================================================
-        # 1️⃣ NO CACHE AT ALL
+        # 4️⃣ LOAD FROM CACHE
         # =================================================
-        if coverage is None:
-            df = self.backend.fetch_ohlcv(
+        if self.cache.coverage(symbol=symbol, timeframe=timeframe) is None:
+            raise DataNotAvailable(f"No data for {symbol} {timeframe}")
+
+        if self.frame_cache is None:
+            return self._load(symbol, timeframe, start, end)
+
+        df = self.frame_cache.get(symbol=symbol, timeframe=timeframe, start=start, end=end)
+        if df is not None:
+            return df
+
+        # load the union with the range already held, so later
+        # sub-range requests are served from memory
+        span = self.frame_cache.span(symbol, timeframe)
+        lo, hi = (start, end) if span is None else (min(start, span[0]), max(end, span[1]))
+
+        df = self._load(symbol, timeframe, lo, hi)
+        self.frame_cache.put(symbol=symbol, timeframe=timeframe, start=lo, end=hi, df=df)
+        return cow_copy(slice_frame(df, start, end))
+
+    def _load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        if self.mmap_store is not None:
+            self._sync_mmap(symbol, timeframe)
+            return self.mmap_store.frame(
                 symbol=symbol,
                 timeframe=timeframe,
                 start=start,
                 end=end,
             )
-            df = self._validate(df)
-            self.cache.save(symbol=symbol, timeframe=timeframe, df=df)
+
+        df = self.cache.load_range(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+        )
+        if self.cache.manifest.quality(symbol=symbol, timeframe=timeframe).get("validated"):
+            # validated once when written
             return df
+        return self._validate(df)
 
-        cov_start, cov_end = coverage
+    def quality_report(self, symbol: str | None = None) -> pd.DataFrame:
+        """
+        Per (symbol, timeframe) counts of flagged / repaired bars.
+        """
+        return quality_report(self.cache.manifest, symbol)
 
-        # =================================================
-        # 2️⃣ MISSING BEFORE (FIXED)
-        # =================================================
+    # -------------------------------------------------
+    # Resampling
+    # -------------------------------------------------
 
-        freq = timeframe_to_pandas_freq(timeframe)
-        first_required_bar = start.floor(freq)
+    def resample_base(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> str | None:
+        """
+        Coarsest cached timeframe timeframe can be built from that
+        has nothing missing in [start, end] (fewest rows to read).
+        """
+        candidates = [
+            tf for tf in self.cache.manifest.timeframes(symbol=symbol)
+            if self.resampler.can_derive(timeframe, tf)
+        ]
+        for base in sorted(candidates, key=timeframe_to_timedelta, reverse=True):
+            if not self.missing_intervals(symbol=symbol, timeframe=base, start=start, end=end):
+                return base
+        return None
+
+    def _get_resampled(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame | None:
+        """
+        [start, end] built from a cached base timeframe, or None when
+        timeframe is cached itself or no base covers the range.
 
-        if first_required_bar < cov_start:
-            df_pre = self.backend.fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                start=first_required_bar,
-                end=cov_start,
-            )
-            df_pre = self._validate(df_pre)
-            if not df_pre.empty:
-                self.cache.append(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    df=df_pre,
-                )
-                pieces.append(df_pre)
+        The bucket containing end is built from base bars up to end.
+        """
+        if not self.missing_intervals(symbol=symbol, timeframe=timeframe, start=start, end=end):
+            return None
+
+        first = self.resampler.bucket_start(start, timeframe)
+        base = self.resample_base(symbol=symbol, timeframe=timeframe, start=first, end=end)
+        if base is None:
+            return None
+
+        signature = (
+            f"resample:{base}:"
+            f"{self.cache.manifest.signature(symbol=symbol, timeframe=base)}:"
+            f"{first.isoformat()}:{end.isoformat()}"
+        )
 
-        # =================================================
-        # 3️⃣ CACHED MIDDLE
-        # =================================================
-        df_mid = self.cache.load_range(
+        # derived bars are mirrored into the mmap store (reused across runs)
+        if (
+            self.mmap_store is not None
+            and self.mmap_store.signature(symbol=symbol, timeframe=timeframe) == signature
+        ):
+            return self.mmap_store.frame(symbol=symbol, timeframe=timeframe, start=start, end=end)
+
+        base_df = self.get_ohlcv(symbol=symbol, timeframe=base, start=first, end=end)
+        df = self.resampler.resample(
+            base_df,
             symbol=symbol,
             timeframe=timeframe,
-            start=max(start, cov_start),
-            end=min(end, cov_end),
+            base=base,
+            signature=signature,
         )
-        pieces.append(df_mid)
+        print(f"🔁 Resampled {symbol} {base} → {timeframe} ({len(df)} bars)")
 
-        # =================================================
-        # 4️⃣ MISSING AFTER (FIXED)
-        # =================================================
+        if self.mmap_store is not None:
+            self.mmap_store.write(symbol=symbol, timeframe=timeframe, df=df, signature=signature)
+            return self.mmap_store.frame(symbol=symbol, timeframe=timeframe, start=start, end=end)
 
-        freq = timeframe_to_pandas_freq(timeframe)
-        last_required_bar = end.floor(freq)
+        mask = (df["time"] >= start) & (df["time"] <= end)
+        return df.loc[mask].reset_index(drop=True)
 
-        if last_required_bar > cov_end:
-            df_post = self.backend.fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                start=cov_end,
-                end=last_required_bar,
-            )
-            df_post = self._validate(df_post)
-            if not df_post.empty:
-                self.cache.append(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    df=df_post,
-                )
-                pieces.append(df_post)
+    # -------------------------------------------------
+    # Memory-mapped access
+    # -------------------------------------------------
 
-        # =================================================
-        # 5️⃣ FINAL MERGE
-        # =================================================
-        df = pd.concat(pieces, ignore_index=True)
-        return self._validate(df)
+    def _sync_mmap(self, symbol: str, timeframe: str) -> None:
+        """
+        Rebuilds the mapped arrays when the cache changed since
+        they were written.
+        """
+        signature = self.cache.manifest.signature(symbol=symbol, timeframe=timeframe)
+        if self.mmap_store.signature(symbol=symbol, timeframe=timeframe) == signature:
+            return
+
+        cov_start, cov_end = self.cache.coverage(symbol=symbol, timeframe=timeframe)
+        df = self.cache.load_range(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=cov_start,
+            end=cov_end,
+        )
+        self.mmap_store.write(
+            symbol=symbol,
+            timeframe=timeframe,
+            df=self._validate(df),
+            signature=signature,
+        )
+
+    def get_arrays(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> dict[str, np.ndarray]:
+        """
+        Read-only NumPy views (time as int64 ns UTC) of the range.
+        Requires mmap_store.
+        """
+        if self.mmap_store is None:
+            raise InvalidDataRequest("get_arrays requires an mmap_store")
+
+        self.get_ohlcv(symbol=symbol, timeframe=timeframe, start=start, end=end)
+        return self.mmap_store.arrays(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=self._to_utc(start),
+            end=self._to_utc(end),
+        )
 
     # -------------------------------------------------
     # Informative data
@@ -192,6 +496,7 @@ class DefaultOhlcvDataProvider:
         [backtest_start - startup_candle_count * timeframe, backtest_end]
 
         No trimming here. Trimming happens AFTER merge.
+        Built from a cached finer timeframe when a resampler is set.
         """
 
         extended_start = shift_time_by_candles(
@@ -207,7 +512,7 @@ class DefaultOhlcvDataProvider:
             end=self.backtest_end,
         )
 
-        return df.copy()
+        return cow_copy(df)
 
 
 def shift_time_by_candles(
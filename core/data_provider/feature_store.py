@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+# ==================================================
+# Fingerprints
+# ==================================================
+
+def data_digest(df: pd.DataFrame) -> str:
+    """
+    Content hash of a frame (index, column names, dtypes and values):
+    changes whenever any input bar does.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().view(np.uint8))
+    for col in df.columns:
+        values = df[col]
+        h.update(f"{col}:{values.dtype};".encode())
+        arr = values.array.asi8 if values.dtype.kind in "mM" else values.to_numpy()
+        if arr.dtype == object:
+            arr = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        h.update(np.ascontiguousarray(arr).view(np.uint8))
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _package_source(path: str) -> str:
+    # every .py under a project package directory (or one top-level file)
+    h = hashlib.sha256()
+    path = Path(path)
+    files = [path] if path.is_file() else sorted(path.rglob("*.py"))
+    for file in files:
+        h.update(str(file.relative_to(PROJECT_ROOT)).encode())
+        h.update(file.read_bytes())
+    return h.hexdigest()
+
+
+def _dist_version(module_name: str) -> str:
+    top = module_name.split(".")[0]
+    try:
+        return importlib.metadata.version(top)
+    except importlib.metadata.PackageNotFoundError:
+        return str(getattr(sys.modules.get(top), "__version__", ""))
+
+
+def _imported_modules(module):
+    # modules a module imports, or imports names from
+    for value in vars(module).values():
+        source = value if inspect.ismodule(value) else inspect.getmodule(value)
+        if source is not None and getattr(source, "__file__", None):
+            yield source
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint(module_name: str) -> str:
+    """
+    Hash of the code a feature module runs: the package directory of
+    every project module it imports, directly or transitively, plus
+    the versions of the third-party libraries those modules use.
+    """
+    packages = set()
+    libraries = set()
+
+    seen = set()
+    stack = [sys.modules[module_name]]
+    while stack:
+        module = stack.pop()
+        if module.__name__ in seen:
+            continue
+        seen.add(module.__name__)
+
+        path = Path(module.__file__).resolve()
+        packages.add(str(path if path.parent == PROJECT_ROOT else path.parent))
+
+        for source in _imported_modules(module):
+            source_path = Path(source.__file__).resolve()
+            if "site-packages" in source_path.parts:
+                libraries.add(f"{source.__name__.split('.')[0]}=={_dist_version(source.__name__)}")
+            elif PROJECT_ROOT in source_path.parents:
+                stack.append(source)
+
+    h = hashlib.sha256()
+    for package in sorted(packages):
+        h.update(_package_source(package).encode())
+    for library in sorted(libraries):
+        h.update(library.encode())
+    return h.hexdigest()
+
+
+# ==================================================
+# Store
+# ==================================================
+
+class FeatureStore:
+    """
+    On-disk cache of feature-stage frames (indicators, market structure,
+    informatives), one Parquet file per computation:
+
+        root/<symbol>/<timeframe>/<feature>/<key>.parquet
+
+    key = hash of the input bars (data_digest), the feature params and
+    the feature code (code_fingerprint), so any change to data, params
+    or code is a miss and nothing is ever invalidated explicitly.
+    The newest `keep` files per feature are kept.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        compression: str = "zstd",
+        keep: int = 8,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.keep = keep
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*, data: str, params: dict, code: str) -> str:
+        payload = json.dumps(
+            {"data": data, "params": params, "code": code},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _dir(self, symbol: str, timeframe: str, feature: str) -> Path:
+        return self.root / symbol / timeframe / feature
+
+    # -------------------------------------------------
+    # Read / write
+    # -------------------------------------------------
+
+    def load(self, *, symbol: str, timeframe: str, feature: str, key: str) -> pd.DataFrame | None:
+        path = self._dir(symbol, timeframe, feature) / f"{key}.parquet"
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        table = pq.read_table(path)
+        df = table.to_pandas()
+
+        # strings stored from object columns come back as str
+        meta = json.loads(table.schema.metadata[b"pandas"])
+        for col in meta["columns"]:
+            name = col["name"]
+            if col["numpy_type"] == "object" and name in df.columns and df[name].dtype != object:
+                df[name] = df[name].astype(object)
+
+        self.hits += 1
+        return df
+
+    def save(self, *, symbol: str, timeframe: str, feature: str, key: str, df: pd.DataFrame) -> None:
+        """
+        Writes df atomically. Frames Arrow cannot store (mixed
+        object columns) are skipped with a warning.
+        """
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+            print(f"⚠️ FeatureStore | {symbol} {timeframe} {feature} not stored: {exc}")
+            return
+
+        folder = self._dir(symbol, timeframe, feature)
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{key}.parquet"
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(table, tmp, compression=self.compression)
+        os.replace(tmp, path)
+
+        stale = sorted(folder.glob("*.parquet"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in stale[self.keep:]:
+            old.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
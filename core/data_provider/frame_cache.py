@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from core.utils.frames import cow_copy, slice_frame
+
+
+class FrameCache:
+    """
+    In-process LRU of loaded OHLCV frames, one per (symbol, timeframe).
+
+    Each entry holds the bars of one [start, end] range; any request
+    inside it is served as a slice without touching the disk cache.
+    Entries are evicted least-recently-used once their total size
+    exceeds max_bytes. hits / misses / evictions are counted for
+    profiling (see stats()).
+    """
+
+    def __init__(self, *, max_bytes: int = 512 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[pd.Timestamp, pd.Timestamp, pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    # pickled with the provider into worker processes: every worker
+    # starts with an empty cache instead of a copy of all frames
+    def __getstate__(self):
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    # -------------------------------------------------
+    # Lookup
+    # -------------------------------------------------
+
+    def span(self, symbol: str, timeframe: str) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        entry = self._entries.get((symbol, timeframe))
+        return None if entry is None else entry[:2]
+
+    def get(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame | None:
+        key = (symbol, timeframe)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not (entry[0] <= start and end <= entry[1]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            df = entry[2]
+
+        return cow_copy(slice_frame(df, start, end))
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+
+    def put(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        df: pd.DataFrame,
+    ) -> None:
+        """
+        Stores df as the bars of [start, end], replacing the entry
+        of (symbol, timeframe). Frames larger than the budget are
+        not kept.
+        """
+        key = (symbol, timeframe)
+        size = int(df.memory_usage(index=True, deep=False).sum())
+
+        with self._lock:
+            self._drop(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (start, end, df, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *, symbol: str, timeframe: str) -> None:
+        with self._lock:
+            self._drop((symbol, timeframe))
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # -------------------------------------------------
+    # Profiling
+    # -------------------------------------------------
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
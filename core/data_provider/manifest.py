@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class CacheManifest:
+    """
+    Index of a cache root, stored as <root>/<name>. Each cache kind
+    uses its own name (CSV and Parquet can share a root and key).
+
+    Per (symbol, timeframe): bar length in seconds and, per data file:
+        start / end   first and last bar time (ISO, UTC)
+        rows          number of bars
+        checksum      sha256 of the file
+        gaps          [start, end] pairs of consecutive bars further
+                      apart than one bar (weekends included; callers
+                      decide what counts as missing)
+
+    Intervals the backend was already asked for and had no (more)
+    data for are kept under "checked" so they are not refetched.
+    Data-quality counts of everything validated before being written
+    are kept under "quality" (see OhlcvValidator).
+
+    Coverage and gap queries never touch the data files.
+    Every update rewrites the manifest atomically (temp + os.replace).
+    """
+
+    def __init__(self, root: Path, *, name: str = "manifest.json"):
+        self.path = Path(root) / name
+        self._lock = threading.Lock()
+        self._data: dict[str, dict] = {}
+
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self._data = json.load(f)
+
+    # the provider (and its cache) is sent to worker processes
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------
+    # Keys / helpers
+    # -------------------------------------------------
+
+    @staticmethod
+    def key(symbol: str, timeframe: str) -> str:
+        return f"{symbol}/{timeframe}"
+
+    @staticmethod
+    def checksum(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def find_gaps(times: pd.Series, bar: pd.Timedelta) -> list[list[str]]:
+        """
+        [last bar before gap, first bar after gap] pairs.
+        """
+        values = times.dt.tz_convert(None).to_numpy()
+        if len(values) < 2:
+            return []
+
+        jumps = np.flatnonzero(np.diff(values) > bar.to_timedelta64())
+        return [
+            [times.iat[i].isoformat(), times.iat[i + 1].isoformat()]
+            for i in jumps
+        ]
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+
+    def _flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def record(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        files: dict[str, tuple[Path, pd.DataFrame]],
+        bar: pd.Timedelta,
+        replace: bool = False,
+    ) -> None:
+        """
+        files: {file name: (path, sorted frame written to it)}.
+        replace=True drops entries of files not listed (full save).
+        """
+        entries = {}
+        for name, (path, df) in files.items():
+            times = pd.to_datetime(df["time"], utc=True)
+            entries[name] = {
+                "start": times.iat[0].isoformat(),
+                "end": times.iat[-1].isoformat(),
+                "rows": int(len(df)),
+                "checksum": self.checksum(path),
+                "gaps": self.find_gaps(times, bar),
+            }
+
+        key = self.key(symbol, timeframe)
+        with self._lock:
+            current = {} if replace else dict(self.files(symbol=symbol, timeframe=timeframe))
+            current.update(entries)
+            self._data[key] = {
+                **self._data.get(key, {}),
+                "bar": int(bar.total_seconds()),
+                "files": dict(sorted(current.items())),
+            }
+            self._flush()
+
+    def mark_checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> None:
+        """
+        Records [start, end] as fetched: whatever is still missing
+        there does not exist at the source (holidays, quiet minutes).
+        """
+        key = self.key(symbol, timeframe)
+        with self._lock:
+            entry = self._data.setdefault(key, {})
+            intervals = sorted(
+                [(pd.Timestamp(a), pd.Timestamp(b)) for a, b in entry.get("checked", [])]
+                + [(start, end)]
+            )
+
+            merged = [list(intervals[0])]
+            for a, b in intervals[1:]:
+                if a <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], b)
+                else:
+                    merged.append([a, b])
+
+            entry["checked"] = [[a.isoformat(), b.isoformat()] for a, b in merged]
+            self._flush()
+
+    def record_quality(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        report: dict[str, int],
+        full: bool,
+    ) -> None:
+        """
+        Adds a validation report. full=True: the write replaced all
+        data, so every stored bar is now validated (and earlier flagged
+        bars are gone); otherwise that holds only if it already did.
+        """
+        report = dict(report)
+        flagged = report.pop("flagged", {})
+
+        key = self.key(symbol, timeframe)
+        with self._lock:
+            entry = self._data.setdefault(key, {})
+            previous = entry.get("quality", {"validated": False, "counts": {}})
+
+            counts = dict(previous["counts"])
+            for name, value in report.items():
+                counts[name] = counts.get(name, 0) + value
+
+            entry["quality"] = {
+                "validated": full or previous["validated"],
+                "counts": counts,
+                "flagged": {**({} if full else previous.get("flagged", {})), **flagged},
+                "updated": pd.Timestamp.now(tz="UTC").isoformat(),
+            }
+            self._flush()
+
+    def forget(self, *, symbol: str, timeframe: str) -> None:
+        with self._lock:
+            if self._data.pop(self.key(symbol, timeframe), None) is not None:
+                self._flush()
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+
+    def timeframes(self, *, symbol: str) -> list[str]:
+        """
+        Timeframes of symbol with at least one data file.
+        """
+        prefix = f"{symbol}/"
+        return [
+            key[len(prefix):]
+            for key, entry in self._data.items()
+            if key.startswith(prefix) and entry.get("files")
+        ]
+
+    def files(self, *, symbol: str, timeframe: str) -> dict[str, dict]:
+        return self._data.get(self.key(symbol, timeframe), {}).get("files", {})
+
+    def signature(self, *, symbol: str, timeframe: str) -> str:
+        """
+        Changes whenever any data file of (symbol, timeframe) changes.
+        """
+        digest = hashlib.sha256()
+        for name, meta in self.files(symbol=symbol, timeframe=timeframe).items():
+            digest.update(f"{name}:{meta['checksum']};".encode())
+        return digest.hexdigest()
+
+    def checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        entry = self._data.get(self.key(symbol, timeframe), {})
+        return [(pd.Timestamp(a), pd.Timestamp(b)) for a, b in entry.get("checked", [])]
+
+    def quality(self, *, symbol: str, timeframe: str) -> dict:
+        return self._data.get(self.key(symbol, timeframe), {}).get("quality", {})
+
+    def flagged(self, *, symbol: str, timeframe: str) -> dict[str, int]:
+        """
+        {bar time (ISO): FLAGS bitmask} of the bars validation flagged.
+        """
+        return self.quality(symbol=symbol, timeframe=timeframe).get("flagged", {})
+
+    def quality_entries(self) -> dict[str, dict]:
+        return {
+            key: entry["quality"]
+            for key, entry in self._data.items()
+            if "quality" in entry
+        }
+
+    def coverage(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        files = self.files(symbol=symbol, timeframe=timeframe)
+        if not files:
+            return None
+
+        # entries are kept sorted by file name (= chronological)
+        first = next(iter(files.values()))
+        last = next(reversed(files.values()))
+        return pd.Timestamp(first["start"]), pd.Timestamp(last["end"])
+
+    def gaps(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        All gaps inside the covered range, including the ones
+        between consecutive files, minus already checked intervals.
+        """
+        entry = self._data.get(self.key(symbol, timeframe))
+        if not entry or not entry.get("files"):
+            return []
+
+        bar = pd.Timedelta(seconds=entry["bar"])
+        out = []
+        prev_end = None
+
+        for meta in entry["files"].values():
+            start = pd.Timestamp(meta["start"])
+            if prev_end is not None and start - prev_end > bar:
+                out.append((prev_end, start))
+
+            out.extend((pd.Timestamp(a), pd.Timestamp(b)) for a, b in meta["gaps"])
+            prev_end = pd.Timestamp(meta["end"])
+
+        checked = self.checked(symbol=symbol, timeframe=timeframe)
+        return [
+            (a, b) for a, b in out
+            if not any(c0 <= a + bar and b - bar <= c1 for c0, c1 in checked)
+        ]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class MmapOhlcvStore:
+    """
+    Binary OHLCV mirror of the cache for zero-copy loading:
+
+        root/<symbol>/<timeframe>/{time,open,high,low,close,volume}.npy
+        root/<symbol>/<timeframe>/meta.json
+
+    time is int64 ns (UTC), prices / volume float64.
+    Arrays are opened with mmap_mode="r": readers get read-only
+    views backed by the OS page cache, shared by all processes
+    that open the same files.
+    """
+
+    META = "meta.json"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol / timeframe
+
+    # -------------------------------------------------
+    # Write
+    # -------------------------------------------------
+
+    def write(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        signature: str = "",
+    ) -> None:
+        """
+        Replaces the (symbol, timeframe) arrays atomically.
+        signature identifies the cache state the arrays came from.
+        """
+        target = self._dir(symbol, timeframe)
+        tmp = target.with_name(target.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        df = df.sort_values("time")
+        time_ns = (
+            pd.to_datetime(df["time"], utc=True)
+            .dt.tz_convert(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view(np.int64)
+        )
+        np.save(tmp / "time.npy", time_ns)
+        for col in OHLCV_COLUMNS:
+            np.save(tmp / f"{col}.npy", df[col].to_numpy(dtype=np.float64))
+
+        with open(tmp / self.META, "w") as f:
+            json.dump({"rows": int(len(df)), "signature": signature}, f)
+
+        old = target.with_name(target.name + ".old")
+        shutil.rmtree(old, ignore_errors=True)
+        if target.exists():
+            os.replace(target, old)
+        os.replace(tmp, target)
+        shutil.rmtree(old, ignore_errors=True)
+
+    # -------------------------------------------------
+    # Read
+    # -------------------------------------------------
+
+    def signature(self, *, symbol: str, timeframe: str) -> str | None:
+        path = self._dir(symbol, timeframe) / self.META
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)["signature"]
+
+    def arrays(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Read-only views of bars with start <= time <= end.
+        """
+        base = self._dir(symbol, timeframe)
+        if not (base / self.META).exists():
+            raise FileNotFoundError(base)
+
+        time_ns = np.load(base / "time.npy", mmap_mode="r")
+
+        lo = 0 if start is None else np.searchsorted(time_ns, pd.Timestamp(start).value, "left")
+        hi = len(time_ns) if end is None else np.searchsorted(time_ns, pd.Timestamp(end).value, "right")
+
+        # plain ndarray views (np.memmap subclass confuses pandas)
+        out = {"time": time_ns[lo:hi].view(np.ndarray)}
+        for col in OHLCV_COLUMNS:
+            out[col] = np.load(base / f"{col}.npy", mmap_mode="r")[lo:hi].view(np.ndarray)
+        return out
+
+    def frame(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """
+        OHLCV frame over the mapped arrays.
+
+        Price / volume columns are not copied (writes to the frame
+        itself fail; shallow copies are copy-on-write). The time
+        column is materialised as datetime64[ns, UTC].
+        """
+        arrays = self.arrays(symbol=symbol, timeframe=timeframe, start=start, end=end)
+
+        columns = {
+            "time": pd.Series(arrays["time"].view("datetime64[ns]")).dt.tz_localize("UTC"),
+        }
+        for col in OHLCV_COLUMNS:
+            columns[col] = pd.Series(arrays[col], copy=False)
+
+        return pd.DataFrame(columns, copy=False)
+
+    def ref(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> "MmapFrameRef":
+        return MmapFrameRef(str(self.root), symbol, timeframe, start, end)
+
+
+@dataclass(frozen=True)
+class MmapFrameRef:
+    """
+    Picklable handle to a stored frame.
+
+    Sent to worker processes instead of the frame itself, so
+    workers map the same files rather than receiving a pickled copy.
+    """
+
+    root: str
+    symbol: str
+    timeframe: str
+    start: pd.Timestamp | None = None
+    end: pd.Timestamp | None = None
+
+    def load(self) -> pd.DataFrame:
+        return MmapOhlcvStore(self.root).frame(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            start=self.start,
+            end=self.end,
+        )
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.data_provider.manifest import CacheManifest
+from core.utils.timeframe import timeframe_to_timedelta
+
+
+class ParquetMarketDataCache:
+    """
+    Parquet-based OHLCV cache, partitioned by month:
+
+        root/<symbol>/<timeframe>/<YYYY-MM>.parquet
+
+    Same PASSIVE contract as MarketDataCache:
+    - does NOT decide whether data is missing
+    - writes ONLY when provider explicitly asks
+
+    Range loads open only the overlapping partitions and filter
+    with predicate pushdown; appends rewrite only touched months.
+    Coverage / gaps come from the CacheManifest (no file reads).
+    """
+
+    PARTITION_FORMAT = "%Y-%m"
+    MANIFEST_NAME = "manifest.parquet.json"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = CacheManifest(self.root, name=self.MANIFEST_NAME)
+
+    # -------------------------------------------------
+    # Paths
+    # -------------------------------------------------
+
+    def _dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol / timeframe
+
+    def _partition_key(self, ts: pd.Timestamp) -> str:
+        return ts.strftime(self.PARTITION_FORMAT)
+
+    def _partitions(self, symbol: str, timeframe: str) -> list[Path]:
+        path = self._dir(symbol, timeframe)
+        if not path.exists():
+            return []
+        return sorted(path.glob("*.parquet"))
+
+    # -------------------------------------------------
+    # Coverage
+    # -------------------------------------------------
+
+    def _index(
+        self,
+        symbol: str,
+        timeframe: str,
+        files: dict[str, tuple[Path, pd.DataFrame]],
+        replace: bool = False,
+    ) -> None:
+        self.manifest.record(
+            symbol=symbol,
+            timeframe=timeframe,
+            files=files,
+            bar=timeframe_to_timedelta(timeframe),
+            replace=replace,
+        )
+
+    def coverage(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        coverage = self.manifest.coverage(symbol=symbol, timeframe=timeframe)
+        if coverage is not None:
+            return coverage
+
+        # partitions written before the manifest existed: index them once
+        partitions = self._partitions(symbol, timeframe)
+        files = {}
+        for path in partitions:
+            df = self._read(path)
+            if not df.empty:
+                files[path.name] = (path, df.sort_values("time"))
+
+        if not files:
+            return None
+
+        self._index(symbol, timeframe, files, replace=True)
+        return self.manifest.coverage(symbol=symbol, timeframe=timeframe)
+
+    def gaps(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        if self.coverage(symbol=symbol, timeframe=timeframe) is None:
+            return []
+        return self.manifest.gaps(symbol=symbol, timeframe=timeframe)
+
+    def checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        return self.manifest.checked(symbol=symbol, timeframe=timeframe)
+
+    def mark_checked(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> None:
+        self.manifest.mark_checked(
+            symbol=symbol, timeframe=timeframe, start=start, end=end
+        )
+
+    # -------------------------------------------------
+    # Load
+    # -------------------------------------------------
+
+    @staticmethod
+    def _read(path: Path, filters=None) -> pd.DataFrame:
+        df = pq.read_table(path, filters=filters).to_pandas()
+        df["time"] = pd.to_datetime(df["time"], utc=True)
+        return df
+
+    def load_range(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        partitions = self._partitions(symbol, timeframe)
+        if not partitions:
+            raise FileNotFoundError(self._dir(symbol, timeframe))
+
+        first = self._partition_key(start)
+        last = self._partition_key(end)
+        filters = [("time", ">=", start), ("time", "<=", end)]
+
+        frames = [
+            self._read(path, filters)
+            for path in partitions
+            if first <= path.stem <= last
+        ]
+        if not frames:
+            return self._read(partitions[0], filters)
+
+        return (
+            pd.concat(frames, ignore_index=True)
+            .sort_values("time")
+            .reset_index(drop=True)
+        )
+
+    # -------------------------------------------------
+    # Save / append
+    # -------------------------------------------------
+
+    def _write_partition(self, path: Path, df: pd.DataFrame) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _by_month(df: pd.DataFrame):
+        """
+        Yields (YYYY-MM, rows of that month).
+        """
+        df = df.copy()
+        df["time"] = pd.to_datetime(df["time"], utc=True)
+        months = df["time"].dt.year * 100 + df["time"].dt.month
+
+        for month, part in df.groupby(months.to_numpy(), sort=True):
+            yield f"{month // 100:04d}-{month % 100:02d}", part
+
+    def save(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+    ) -> None:
+        if df.empty:
+            return
+
+        for path in self._partitions(symbol, timeframe):
+            path.unlink()
+
+        base = self._dir(symbol, timeframe)
+        written = {}
+        for key, part in self._by_month(df):
+            path = base / f"{key}.parquet"
+            part = part.sort_values("time").reset_index(drop=True)
+            self._write_partition(path, part)
+            written[path.name] = (path, part)
+
+        self._index(symbol, timeframe, written, replace=True)
+
+    def append(
+            self,
+            *,
+            symbol: str,
+            timeframe: str,
+            df: pd.DataFrame,
+    ) -> None:
+        if df.empty:
+            return
+
+        base = self._dir(symbol, timeframe)
+        written = {}
+
+        for key, part in self._by_month(df):
+            path = base / f"{key}.parquet"
+
+            if path.exists():
+                existing = self._read(path)
+                before = len(existing)
+                part = pd.concat([existing, part], ignore_index=True)
+            else:
+                before = 0
+
+            part = (
+                part.sort_values("time")
+                .drop_duplicates(subset="time", keep="last")
+                .reset_index(drop=True)
+            )
+
+            # nothing new in this month
+            if len(part) == before:
+                continue
+
+            self._write_partition(path, part)
+            written[path.name] = (path, part)
+
+        if written:
+            self._index(symbol, timeframe, written)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+import pandas as pd
+
+from core.data_provider.default_provider import DefaultOhlcvDataProvider, shift_time_by_candles
+from core.data_provider.mmap_store import MmapFrameRef
+from core.utils.frames import cow_copy, slice_frame
+from core.utils.timeframe import timeframe_to_timedelta
+
+
+@dataclass(frozen=True)
+class DataRequest:
+    symbol: str
+    timeframe: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.symbol, self.timeframe
+
+
+def merge_requests(requests: list[DataRequest]) -> list[DataRequest]:
+    """
+    One request per (symbol, timeframe, disjoint range):
+    overlapping / touching ranges are merged into their union.
+    """
+    by_key: dict[tuple[str, str], list[DataRequest]] = {}
+    for req in requests:
+        by_key.setdefault(req.key, []).append(req)
+
+    merged = []
+    for (symbol, timeframe), reqs in by_key.items():
+        reqs = sorted(reqs, key=lambda r: r.start)
+        start, end = reqs[0].start, reqs[0].end
+
+        for req in reqs[1:]:
+            if req.start <= end:
+                end = max(end, req.end)
+                continue
+            merged.append(DataRequest(symbol, timeframe, start, end))
+            start, end = req.start, req.end
+
+        merged.append(DataRequest(symbol, timeframe, start, end))
+
+    return merged
+
+
+class DataLoader:
+    """
+    Loads a whole (symbol x timeframe x range) set up-front.
+
+    Requests are merged per (symbol, timeframe) and loaded on a
+    bounded thread pool (backend calls are subprocess / I/O bound);
+    every original request is then served as a slice.
+
+    Each symbol's finest timeframe is loaded first, so a resampling
+    provider can build the others from it instead of fetching them.
+    """
+
+    def __init__(self, provider, *, max_workers: int = 8):
+        self.provider = provider
+        self.max_workers = max_workers
+
+    def _load(self, req: DataRequest) -> pd.DataFrame:
+        t0 = perf_counter()
+        df = self.provider.get_ohlcv(
+            symbol=req.symbol,
+            timeframe=req.timeframe,
+            start=req.start,
+            end=req.end,
+        )
+        print(
+            f"⏱️ load_data | get_ohlcv {req.symbol:<10} {req.timeframe:<4} "
+            f"{perf_counter() - t0:8.3f}s  ({len(df)} rows)"
+        )
+        return df
+
+    def load(self, requests: list[DataRequest]) -> dict[DataRequest, pd.DataFrame]:
+        merged = merge_requests(requests)
+
+        finest = {}
+        for m in merged:
+            bar = timeframe_to_timedelta(m.timeframe)
+            finest[m.symbol] = min(finest.get(m.symbol, bar), bar)
+
+        first = [m for m in merged if timeframe_to_timedelta(m.timeframe) == finest[m.symbol]]
+        rest = [m for m in merged if m not in first]
+
+        workers = max(1, min(self.max_workers, len(merged)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            loaded = dict(zip(first, pool.map(self._load, first)))
+            loaded.update(zip(rest, pool.map(self._load, rest)))
+        frames = [loaded[m] for m in merged]
+
+        out = {}
+        for req in requests:
+            for m, df in zip(merged, frames):
+                if m.key == req.key and m.start <= req.start and req.end <= m.end:
+                    out[req] = slice_frame(df, req.start, req.end)
+                    break
+        return out
+
+
+class PreloadedProvider:
+    """
+    Provider view for ONE strategy run with its data already loaded.
+
+    Frames (or MmapFrameRef handles, resolved on first use) are
+    served for requests inside their range; anything else falls
+    through to the wrapped provider.
+    """
+
+    def __init__(self, provider, frames: dict[DataRequest, pd.DataFrame | MmapFrameRef]):
+        self.provider = provider
+        self.frames = frames
+        self.backtest_start = provider.backtest_start
+        self.backtest_end = provider.backtest_end
+        self.feature_store = getattr(provider, "feature_store", None)
+
+    def _find(self, symbol, timeframe, start, end) -> pd.DataFrame | None:
+        for req, df in self.frames.items():
+            if req.key == (symbol, timeframe) and req.start <= start and end <= req.end:
+                if isinstance(df, MmapFrameRef):
+                    df = self.frames[req] = df.load()
+                return slice_frame(df, start, end)
+        return None
+
+    def get_ohlcv(self, *, symbol, timeframe, start, end) -> pd.DataFrame:
+        start = DefaultOhlcvDataProvider._to_utc(start)
+        end = DefaultOhlcvDataProvider._to_utc(end)
+
+        df = self._find(symbol, timeframe, start, end)
+        if df is not None:
+            return df
+
+        return self.provider.get_ohlcv(
+            symbol=symbol, timeframe=timeframe, start=start, end=end
+        )
+
+    def get_informative_df(self, *, symbol, timeframe, startup_candle_count) -> pd.DataFrame:
+        extended_start = shift_time_by_candles(
+            end=self.backtest_start,
+            timeframe=timeframe,
+            candles=startup_candle_count,
+        )
+        df = self.get_ohlcv(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=extended_start,
+            end=self.backtest_end,
+        )
+        return cow_copy(df)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider.calendar import TradingCalendar
+from core.utils.timeframe import timeframe_to_timedelta
+
+
+# bit flags (per-bar masks in the report / manifest "flagged")
+FLAGS = {
+    "jitter": 1,           # timestamp off the bar grid
+    "inverted": 2,         # high < low
+    "ohlc_outside": 4,     # open / close outside [low, high]
+    "non_positive": 8,     # price <= 0 or not finite
+    "spike": 16,           # isolated print reverting on the next bar
+    "out_of_session": 32,  # bar inside a closed session
+    "zero_range": 64,      # high == low (reported, never dropped)
+}
+
+# repaired in place in repair mode; the rest of DROP are removed
+DROP = FLAGS["non_positive"] | FLAGS["spike"] | FLAGS["out_of_session"]
+
+
+class OhlcvValidator:
+    """
+    Vectorised OHLCV quality checks, run once on data before it is
+    written to the cache.
+
+    repair=False: bars kept as they are.
+    repair=True:  jitter snapped to the bar grid, inverted high/low
+                  swapped, high/low widened to contain open/close,
+                  non-positive / spike / out-of-session bars dropped
+                  (changes the data a backtest sees: opt-in only).
+
+    Bars are never annotated: the report carries the counts and
+    {bar time: FLAGS bitmask} of every flagged bar (zero_range only
+    counted), kept in the cache manifest.
+
+    A spike is a close that moves more than spike_threshold times
+    the median absolute close change and reverts on the next bar.
+    """
+
+    def __init__(
+        self,
+        *,
+        calendar: TradingCalendar | None = None,
+        repair: bool = False,
+        spike_threshold: float = 25.0,
+    ):
+        self.calendar = calendar or TradingCalendar()
+        self.repair = repair
+        self.spike_threshold = spike_threshold
+
+    def _spikes(self, close: np.ndarray) -> np.ndarray:
+        out = np.zeros(len(close), dtype=bool)
+        if len(close) < 3:
+            return out
+
+        move = np.diff(close)
+        moving = np.abs(move[np.isfinite(move) & (move != 0)])
+        if not len(moving):
+            return out
+
+        big = np.abs(move) > self.spike_threshold * np.median(moving)
+        out[1:-1] = big[:-1] & big[1:] & (np.sign(move[:-1]) != np.sign(move[1:]))
+        return out
+
+    def run(self, df: pd.DataFrame, timeframe: str) -> tuple[pd.DataFrame, dict[str, int]]:
+        """
+        (validated frame, {check: bars hit, rows, dropped, flagged}).
+        df must be sorted by time.
+        """
+        bar_ns = timeframe_to_timedelta(timeframe).value
+        times = pd.DatetimeIndex(pd.to_datetime(df["time"], utc=True))
+        time_ns = times.tz_convert(None).as_unit("ns").asi8
+
+        o, h, l, c = (df[col].to_numpy(dtype=np.float64) for col in ("open", "high", "low", "close"))
+
+        checks = {
+            "jitter": time_ns % bar_ns != 0,
+            "inverted": h < l,
+            "ohlc_outside": (
+                (np.maximum(o, c) > np.maximum(h, l))
+                | (np.minimum(o, c) < np.minimum(h, l))
+            ),
+            "non_positive": ~(
+                np.isfinite(o) & np.isfinite(h) & np.isfinite(l) & np.isfinite(c)
+                & (np.minimum(np.minimum(o, c), np.minimum(h, l)) > 0)
+            ),
+            "spike": self._spikes(c),
+            "out_of_session": ~self.calendar.is_open(times),
+            "zero_range": h == l,
+        }
+
+        flags = np.zeros(len(df), dtype=np.uint8)
+        for name, hit in checks.items():
+            flags[hit] |= FLAGS[name]
+
+        report = {"rows": int(len(df))}
+        report.update({name: int(hit.sum()) for name, hit in checks.items()})
+
+        flagged = (flags & ~np.uint8(FLAGS["zero_range"])) != 0
+        report["flagged"] = {
+            t.isoformat(): int(f) for t, f in zip(times[flagged], flags[flagged])
+        }
+
+        if not self.repair:
+            report["dropped"] = 0
+            return df, report
+
+        hi = np.maximum.reduce([h, l, o, c])
+        lo = np.minimum.reduce([h, l, o, c])
+
+        out = df.copy()
+        out["time"] = pd.to_datetime(time_ns - time_ns % bar_ns, unit="ns", utc=True)
+        out["high"] = hi
+        out["low"] = lo
+
+        out = (
+            out[(flags & DROP) == 0]
+            .drop_duplicates(subset="time", keep="last")
+            .reset_index(drop=True)
+        )
+        report["dropped"] = int(len(df) - len(out))
+        return out, report
+
+
+def quality_report(manifest, symbol: str | None = None) -> pd.DataFrame:
+    """
+    One row per (symbol, timeframe) validated so far, from the manifest.
+    """
+    rows = []
+    for key, quality in manifest.quality_entries().items():
+        sym, timeframe = key.split("/", 1)
+        if symbol is not None and sym != symbol:
+            continue
+        rows.append({"symbol": sym, "timeframe": timeframe, **quality["counts"]})
+
+    return pd.DataFrame(rows)
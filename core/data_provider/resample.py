@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider.calendar import TradingCalendar
+from core.utils.timeframe import timeframe_to_timedelta
+
+
+OHLCV_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+
+NS_DAY = 86_400 * 10**9
+
+
+def aggregate_bars(
+    bars: dict[str, np.ndarray],
+    bar_ns: int,
+    *,
+    origin_ns: int = 0,
+) -> dict[str, np.ndarray]:
+    """
+    Time-sorted bars (time as int64 ns) -> bars of bar_ns, buckets
+    aligned to origin_ns. bar_ns must be a multiple of their length.
+    """
+    if len(bars["time"]) == 0:
+        return bars
+
+    bucket = (bars["time"] - origin_ns) // bar_ns * bar_ns + origin_ns
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+
+    return {
+        "time": bucket[starts],
+        "open": bars["open"][starts],
+        "high": np.maximum.reduceat(bars["high"], starts),
+        "low": np.minimum.reduceat(bars["low"], starts),
+        "close": bars["close"][ends],
+        "volume": np.add.reduceat(bars["volume"], starts),
+    }
+
+
+def _time_ns(times: pd.Series) -> np.ndarray:
+    return (
+        pd.to_datetime(times, utc=True)
+        .dt.tz_convert(None)
+        .to_numpy(dtype="datetime64[ns]")
+        .view(np.int64)
+    )
+
+
+def resample_ohlcv(
+    df: pd.DataFrame,
+    timeframe: str,
+    *,
+    session_start: str = "00:00",
+    calendar: TradingCalendar | None = None,
+) -> pd.DataFrame:
+    """
+    OHLCV bars -> timeframe bars (labelled by bucket start, UTC).
+
+    Intraday buckets are aligned to midnight UTC (H4: 00, 04, ...).
+    Daily and longer buckets start at session_start; with a calendar,
+    a daily bucket starting while the market is closed (the short
+    Sunday session) is folded into the next one.
+    Empty buckets (weekends, holidays) produce no bar.
+    """
+    bar_ns = timeframe_to_timedelta(timeframe).value
+    daily = bar_ns >= NS_DAY
+    origin_ns = pd.Timedelta(f"{session_start}:00").value if daily else 0
+
+    bars = {"time": _time_ns(df["time"])}
+    for col in OHLCV_COLUMNS[1:]:
+        bars[col] = df[col].to_numpy(dtype=np.float64)
+
+    bars = aggregate_bars(bars, bar_ns, origin_ns=origin_ns)
+
+    if daily and calendar is not None and len(bars["time"]):
+        starts = pd.DatetimeIndex(bars["time"].view("datetime64[ns]"))
+        closed = ~calendar.is_open(starts)
+        if closed.any():
+            bars["time"] = np.where(closed, bars["time"] + bar_ns, bars["time"])
+            bars = aggregate_bars(bars, bar_ns, origin_ns=origin_ns)
+
+    out = pd.DataFrame(bars, columns=OHLCV_COLUMNS)
+    out["time"] = pd.to_datetime(bars["time"], unit="ns", utc=True)
+    return out
+
+
+class OhlcvResampler:
+    """
+    Builds higher timeframes from a cached base timeframe.
+
+    Results are memoised per (symbol, timeframe, base, base cache
+    signature, range) in a small LRU, so a changed base cache never
+    serves stale bars.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_start: str = "00:00",
+        calendar: TradingCalendar | None = None,
+        memoize: bool = True,
+        max_entries: int = 32,
+    ):
+        self.session_start = session_start
+        self.calendar = calendar
+        self.memoize = memoize
+        self.max_entries = max_entries
+        self._memo: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
+    @staticmethod
+    def can_derive(timeframe: str, base: str) -> bool:
+        bar = timeframe_to_timedelta(timeframe)
+        base_bar = timeframe_to_timedelta(base)
+        return base_bar < bar and bar % base_bar == pd.Timedelta(0)
+
+    def bucket_start(self, ts: pd.Timestamp, timeframe: str) -> pd.Timestamp:
+        """
+        Start of the timeframe bucket containing ts.
+        """
+        bar = timeframe_to_timedelta(timeframe)
+        if bar < pd.Timedelta(days=1):
+            return ts.floor(bar)
+        origin = pd.Timedelta(f"{self.session_start}:00")
+        return (ts - origin).floor(bar) + origin
+
+    def resample(
+        self,
+        df: pd.DataFrame,
+        *,
+        symbol: str,
+        timeframe: str,
+        base: str,
+        signature: str = "",
+    ) -> pd.DataFrame:
+        key = (symbol, timeframe, base, signature)
+        if len(df):
+            key += (df["time"].iat[0], df["time"].iat[-1], len(df))
+
+        if self.memoize and key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+
+        out = resample_ohlcv(
+            df,
+            timeframe,
+            session_start=self.session_start,
+            calendar=self.calendar,
+        )
+
+        if self.memoize:
+            self._memo[key] = out
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+
+        return out
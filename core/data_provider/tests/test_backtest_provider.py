@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from core.data_provider.cache import MarketDataCache
+from core.data_provider.calendar import TradingCalendar
 from core.data_provider.default_provider import DefaultOhlcvDataProvider
 from core.data_provider.exceptions import InvalidDataRequest
 from core.data_provider.tests.fakes import FakeBackend
@@ -111,3 +112,59 @@ def test_informative_timeframe(provider):
 
     assert not df_m5.empty
     assert not df_h1.empty
+
+
+def test_internal_gap_fetched_once_weekend_ignored(tmp_path: Path):
+    # Mon 2024-01-08 .. Fri 2024-01-19, H1, FX sessions only
+    times = pd.date_range("2024-01-08", "2024-01-19 21:00", freq="1h", tz="UTC")
+    times = times[TradingCalendar().is_open(times)]
+    full = pd.DataFrame({
+        "time": times,
+        "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0,
+    })
+
+    hole = (full["time"] >= "2024-01-10") & (full["time"] < "2024-01-11")
+    cache = MarketDataCache(tmp_path)
+    cache.save(symbol="EURUSD", timeframe="H1", df=full[~hole])
+
+    backend = FakeBackend(full)
+    provider = DefaultOhlcvDataProvider(backend=backend, cache=cache)
+
+    start, end = full["time"].iloc[0], full["time"].iloc[-1]
+    df = provider.get_ohlcv(symbol="EURUSD", timeframe="H1", start=start, end=end)
+
+    assert len(backend.calls) == 1
+    _, _, fetch_start, _ = backend.calls[0]
+    assert fetch_start == pd.Timestamp("2024-01-10T00:00:00Z")
+    pd.testing.assert_series_equal(df["time"], full["time"], check_dtype=False)
+
+    # weekend gap is not a hole; nothing left to fetch
+    provider.get_ohlcv(symbol="EURUSD", timeframe="H1", start=start, end=end)
+    assert len(backend.calls) == 1
+
+
+def test_mmap_store_serves_read_only_views(tmp_path: Path, ohlcv_df):
+    from core.data_provider.mmap_store import MmapOhlcvStore
+
+    store = MmapOhlcvStore(tmp_path / "mmap")
+    provider = DefaultOhlcvDataProvider(
+        backend=FakeBackend(ohlcv_df),
+        cache=MarketDataCache(tmp_path),
+        mmap_store=store,
+    )
+
+    start = pd.Timestamp("2024-01-01T00:10:00Z")
+    end = pd.Timestamp("2024-01-01T00:30:00Z")
+    df = provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=start, end=end)
+
+    expected = ohlcv_df[(ohlcv_df["time"] >= start) & (ohlcv_df["time"] <= end)]
+    pd.testing.assert_frame_equal(
+        df, expected.reset_index(drop=True), check_dtype=False
+    )
+
+    arrays = provider.get_arrays(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    assert not arrays["close"].flags.writeable
+    assert arrays["close"].tolist() == expected["close"].tolist()
+
+    ref = store.ref(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    pd.testing.assert_frame_equal(ref.load(), df)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import http.server
+import lzma
+import pickle
+import threading
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_provider.clients.dukascopy_bi5 import (
+    CANDLE_DTYPE,
+    TICK_DTYPE,
+    DukascopyBi5Client,
+    HttpFetcher,
+    decode_ticks,
+    ticks_to_bars,
+)
+
+
+def _write_bi5(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(lzma.compress(records.tobytes(), format=lzma.FORMAT_ALONE))
+
+
+def _minute_candles(day: pd.Timestamp, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-4, 1440))
+    spread = rng.uniform(0, 2e-4, 1440)
+    volume = rng.uniform(0.5, 2.0, 1440)
+    volume[:60] = 0.0                       # flat candles, dropped
+    return pd.DataFrame({
+        "time": pd.date_range(day, periods=1440, freq="1min"),
+        "open": close,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": volume.astype(np.float32).astype(np.float64),
+    })
+
+
+def _candle_records(df: pd.DataFrame, start: pd.Timestamp) -> np.ndarray:
+    rec = np.zeros(len(df), dtype=CANDLE_DTYPE)
+    rec["sec"] = (df["time"] - start).dt.total_seconds()
+    for col in ("open", "close", "low", "high"):
+        rec[col] = np.round(df[col] * 1e5)
+    rec["volume"] = df["volume"]
+    return rec
+
+
+@pytest.fixture
+def datafeed(tmp_path):
+    requested = []
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(Handler, directory=str(tmp_path))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield tmp_path, f"http://127.0.0.1:{server.server_port}/datafeed", requested
+    server.shutdown()
+
+
+def test_minute_candles_served_over_http_aggregate_to_m5(datafeed):
+    root, url, requested = datafeed
+
+    frames = []
+    for i, day in enumerate(pd.date_range("2024-01-02", periods=2, freq="D")):
+        df = _minute_candles(day, seed=i)
+        path = root / "datafeed" / "EURUSD" / "2024" / "00" / f"{day.day:02d}" / "BID_candles_min_1.bi5"
+        _write_bi5(path, _candle_records(df, day))
+        frames.append(df)
+    # 2024-01-04 has no file (404) -> simply no bars
+
+    client = DukascopyBi5Client(fetcher=HttpFetcher(url, retries=0), max_workers=4)
+    request = dict(
+        symbol="EURUSD",
+        timeframe="M5",
+        start=pd.Timestamp("2024-01-02T00:00:00Z"),
+        end=pd.Timestamp("2024-01-04T23:59:00Z"),
+    )
+    out = client.get_ohlcv(**request)
+
+    m1 = pd.concat(frames).set_index("time")
+    m1 = m1[m1["volume"] > 0]
+    for col in ("open", "close", "low", "high"):
+        m1[col] = np.round(m1[col] * 1e5) / 1e5
+    expected = m1.resample("5min").agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+    }).dropna().reset_index()
+    expected["time"] = expected["time"].dt.tz_localize("UTC")
+
+    pd.testing.assert_frame_equal(out, expected, check_dtype=False, check_index_type=False)
+    assert str(out["time"].dtype) == "datetime64[ns, UTC]"
+    assert len(requested) == 3
+
+    # sent to worker processes with the backend (open connections are not)
+    copy = pickle.loads(pickle.dumps(client))
+    pd.testing.assert_frame_equal(copy.get_ohlcv(**request), out)
+
+
+def test_ticks_decode_and_aggregate_vectorised():
+    hour = pd.Timestamp("2024-01-02T10:00:00Z")
+
+    rec = np.zeros(4, dtype=TICK_DTYPE)
+    rec["ms"] = [1_000, 30_000, 61_000, 119_999]
+    rec["bid"] = [110_000, 110_020, 109_990, 110_005]
+    rec["ask"] = rec["bid"] + 2
+    rec["bid_volume"] = [1.0, 2.0, 0.5, 0.25]
+
+    ticks = decode_ticks(rec.tobytes(), hour.value, 1e5)
+    bars = ticks_to_bars(ticks, 60 * 10**9)
+
+    assert list(bars["time"]) == [hour.value, hour.value + 60 * 10**9]
+    np.testing.assert_allclose(bars["open"], [1.1, 1.0999])
+    np.testing.assert_allclose(bars["high"], [1.1002, 1.10005])
+    np.testing.assert_allclose(bars["low"], [1.1, 1.0999])
+    np.testing.assert_allclose(bars["close"], [1.1002, 1.10005])
+    np.testing.assert_allclose(bars["volume"], [3.0, 0.75])
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider import feature_store
+from core.data_provider.feature_store import FeatureStore, code_fingerprint, data_digest
+from core.strategy.BaseStrategy import BaseStrategy
+
+
+def _bars(n: int = 500) -> pd.DataFrame:
+    close = 1.1 + np.cumsum(np.random.default_rng(0).normal(0, 1e-4, n))
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-02", periods=n, freq="5min", tz="UTC"),
+        "open": close,
+        "high": close + 1e-4,
+        "low": close - 1e-4,
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+class _Provider:
+    def __init__(self, store):
+        self.feature_store = store
+
+    def get_informative_df(self, *, symbol, timeframe, startup_candle_count):
+        return _bars(100).assign(time=lambda d: d["time"] + pd.Timedelta(minutes=2))
+
+
+class _CachedStrategy(BaseStrategy):
+    PARAMS = {"WINDOW": 5, "RR": 1.0}
+    FEATURE_PARAMS = ("WINDOW",)
+    CACHE_FEATURES = True
+
+    def populate_indicators_M30(self, df):
+        self.calls.append("M30")
+        return df.assign(trend=np.where(df["close"].diff() > 0, "up", "down")).astype({"trend": object})
+
+    populate_indicators_M30._informative = True
+    populate_indicators_M30._informative_timeframe = "M30"
+
+    def populate_indicators(self):
+        self.calls.append("base")
+        self.df["sma"] = self.df["close"].rolling(self.params["WINDOW"]).mean()
+
+
+def test_feature_stage_is_read_back_when_data_params_and_code_match(tmp_path):
+    store = FeatureStore(tmp_path)
+    calls = []
+
+    def run(**params):
+        strategy = _CachedStrategy(_bars(), "EURUSD", provider=_Provider(store), params=params)
+        strategy.calls = calls
+        return strategy.run_features()
+
+    first = run()
+    assert calls == ["M30", "base"]
+
+    again = run(RR=2.0)                             # entry-only param: pure I/O
+    assert calls == ["M30", "base"]
+    assert store.stats()["hits"] == 2
+    pd.testing.assert_frame_equal(again, first)
+    assert again["trend_M30"].dtype == object
+
+    run(WINDOW=7)                                   # feature param: recomputed
+    assert calls == ["M30", "base", "M30", "base"]
+
+
+def test_caches_features_needs_flag_and_store(tmp_path):
+    store = FeatureStore(tmp_path)
+
+    assert _CachedStrategy(_bars(), "EURUSD", provider=_Provider(store)).caches_features
+    assert not _CachedStrategy(_bars(), "EURUSD", provider=None).caches_features
+    assert not BaseStrategy(_bars(), "EURUSD", provider=_Provider(store)).caches_features
+
+
+def test_key_follows_data_params_and_code():
+    df = _bars()
+    base = FeatureStore.key(data=data_digest(df), params={"A": 1}, code="x")
+
+    changed = df.copy()
+    changed.loc[10, "close"] += 1e-9
+    assert FeatureStore.key(data=data_digest(changed), params={"A": 1}, code="x") != base
+    assert FeatureStore.key(data=data_digest(df), params={"A": 2}, code="x") != base
+    assert FeatureStore.key(data=data_digest(df), params={"A": 1}, code="y") != base
+    assert FeatureStore.key(data=data_digest(df.copy()), params={"A": 1}, code="x") == base
+
+
+def test_code_fingerprint_follows_transitive_imports(tmp_path, monkeypatch):
+    # strategy -> engine package -> top-level kernels module
+    files = {
+        "fp_strategies/__init__.py": "",
+        "fp_strategies/strategy.py": "from fp_engine.engine import run\n",
+        "fp_engine/__init__.py": "",
+        "fp_engine/engine.py": "from fp_kernels import kernel\n\ndef run():\n    return kernel()\n",
+        "fp_kernels.py": "def kernel():\n    return 1\n",
+    }
+    for name, source in files.items():
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text(source)
+
+    monkeypatch.setattr(feature_store, "PROJECT_ROOT", tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def fingerprint():
+        code_fingerprint.cache_clear()
+        feature_store._package_source.cache_clear()
+        return code_fingerprint("fp_strategies.strategy")
+
+    try:
+        __import__("fp_strategies.strategy")
+        before = fingerprint()
+
+        (tmp_path / "fp_kernels.py").write_text("def kernel():\n    return 2\n")
+        assert fingerprint() != before
+    finally:
+        for name in [m for m in sys.modules if m.startswith("fp_")]:
+            del sys.modules[name]
+        code_fingerprint.cache_clear()
+        feature_store._package_source.cache_clear()
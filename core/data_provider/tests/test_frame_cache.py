@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.frame_cache import FrameCache
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.tests.fakes import FakeBackend
+
+
+class CountingCache(ParquetMarketDataCache):
+    loads = 0
+
+    def load_range(self, **kwargs):
+        self.loads += 1
+        return super().load_range(**kwargs)
+
+
+def _ohlcv(symbol_shift=0.0):
+    times = pd.date_range("2024-01-02", periods=24 * 12 * 3, freq="5min", tz="UTC")
+    values = [1.0 + symbol_shift + i * 1e-5 for i in range(len(times))]
+    return pd.DataFrame({
+        "time": times,
+        "open": values,
+        "high": values,
+        "low": values,
+        "close": values,
+        "volume": 1.0,
+    })
+
+
+def test_sub_ranges_served_from_memory_within_budget(tmp_path):
+    df = _ohlcv()
+    cache = CountingCache(tmp_path)
+    provider = DefaultOhlcvDataProvider(
+        backend=FakeBackend(df),
+        cache=cache,
+        frame_cache=FrameCache(),
+    )
+
+    start, end = df["time"].iloc[0], df["time"].iloc[-1]
+    full = provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    assert cache.loads == 1
+
+    for day in range(3):
+        a = start + pd.Timedelta(days=day)
+        b = a + pd.Timedelta(hours=6)
+        part = provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=a, end=b)
+        expected = full[(full["time"] >= a) & (full["time"] <= b)].reset_index(drop=True)
+        pd.testing.assert_frame_equal(part, expected)
+
+    assert cache.loads == 1
+    stats = provider.frame_cache.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+    # callers may mutate what they get
+    part["close"] = 0.0
+    again = provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    assert (again["close"] > 0).all()
+
+    # a budget of one frame evicts the least recently used one
+    provider.frame_cache = FrameCache(max_bytes=stats["bytes"] + 1)
+    provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    provider.backend = FakeBackend(_ohlcv(1.0))
+    provider.get_ohlcv(symbol="XAUUSD", timeframe="M5", start=start, end=end)
+
+    stats = provider.frame_cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 1
+    assert stats["bytes"] <= provider.frame_cache.max_bytes
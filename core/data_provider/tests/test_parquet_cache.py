@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from core.data_provider.cache import MarketDataCache
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.tests.fakes import FakeBackend
+
+
+def _ohlcv(start, periods, freq="1h"):
+    times = pd.date_range(start, periods=periods, freq=freq, tz="UTC")
+    values = range(periods)
+    return pd.DataFrame({
+        "time": times,
+        "open": values,
+        "high": values,
+        "low": values,
+        "close": values,
+        "volume": values,
+    })
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    return ParquetMarketDataCache(tmp_path)
+
+
+def test_save_partitions_by_month_and_loads_range(cache, tmp_path):
+    df = _ohlcv("2024-01-30", 24 * 5)
+    cache.save(symbol="EURUSD", timeframe="H1", df=df)
+
+    files = sorted(p.name for p in (tmp_path / "EURUSD" / "H1").iterdir())
+    assert files == ["2024-01.parquet", "2024-02.parquet"]
+
+    assert cache.coverage(symbol="EURUSD", timeframe="H1") == (
+        df["time"].iloc[0], df["time"].iloc[-1]
+    )
+
+    start = pd.Timestamp("2024-01-31T12:00:00Z")
+    end = pd.Timestamp("2024-02-01T05:00:00Z")
+    loaded = cache.load_range(symbol="EURUSD", timeframe="H1", start=start, end=end)
+
+    expected = df[(df["time"] >= start) & (df["time"] <= end)].reset_index(drop=True)
+    pd.testing.assert_frame_equal(loaded, expected, check_dtype=False)
+
+
+def test_append_rewrites_only_touched_partitions(cache, tmp_path):
+    cache.save(symbol="EURUSD", timeframe="H1", df=_ohlcv("2024-01-01", 24 * 60))
+
+    base = tmp_path / "EURUSD" / "H1"
+    january = (base / "2024-01.parquet").stat().st_mtime_ns
+
+    new = _ohlcv("2024-02-29T20:00:00Z", 10)
+    cache.append(symbol="EURUSD", timeframe="H1", df=new)
+
+    assert (base / "2024-01.parquet").stat().st_mtime_ns == january
+    assert (base / "2024-03.parquet").exists()
+
+    _, cov_end = cache.coverage(symbol="EURUSD", timeframe="H1")
+    assert cov_end == new["time"].iloc[-1]
+
+
+def test_manifest_tracks_coverage_and_gaps(cache, tmp_path):
+    df = _ohlcv("2024-01-01", 24 * 40)
+    hole = (df["time"] >= "2024-01-10T00:00:00Z") & (df["time"] < "2024-01-11T00:00:00Z")
+    cache.save(symbol="EURUSD", timeframe="H1", df=df[~hole])
+
+    # reopened cache answers from the manifest, without data files
+    for path in (tmp_path / "EURUSD" / "H1").iterdir():
+        path.rename(path.with_suffix(".bak"))
+    reopened = ParquetMarketDataCache(tmp_path)
+
+    assert reopened.coverage(symbol="EURUSD", timeframe="H1") == (
+        df["time"].iloc[0], df["time"].iloc[-1]
+    )
+    assert reopened.gaps(symbol="EURUSD", timeframe="H1") == [
+        (pd.Timestamp("2024-01-09T23:00:00Z"), pd.Timestamp("2024-01-11T00:00:00Z")),
+    ]
+
+    files = reopened.manifest.files(symbol="EURUSD", timeframe="H1")
+    assert sum(f["rows"] for f in files.values()) == (~hole).sum()
+
+
+@pytest.mark.parametrize("first, second", [
+    (MarketDataCache, ParquetMarketDataCache),
+    (ParquetMarketDataCache, MarketDataCache),
+])
+def test_switching_cache_kind_on_one_root(tmp_path, first, second):
+    df = _ohlcv("2024-01-02", 48)
+    first(tmp_path).save(symbol="EURUSD", timeframe="H1", df=df)
+
+    provider = DefaultOhlcvDataProvider(backend=FakeBackend(df), cache=second(tmp_path))
+    out = provider.get_ohlcv(
+        symbol="EURUSD",
+        timeframe="H1",
+        start=df["time"].iloc[0],
+        end=df["time"].iloc[-1],
+    )
+
+    assert len(out) == len(df)
+    assert provider.backend.calls        # fetched: the other kind's files are not its own
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from core.data_provider.cache import MarketDataCache
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.preload import (
+    DataLoader,
+    DataRequest,
+    PreloadedProvider,
+    merge_requests,
+)
+from core.data_provider.tests.fakes import FakeBackend
+
+
+def _ts(s):
+    return pd.Timestamp(s, tz="UTC")
+
+
+def test_merge_requests_unions_overlaps_per_key():
+    reqs = [
+        DataRequest("EURUSD", "H1", _ts("2024-01-02"), _ts("2024-01-05")),
+        DataRequest("EURUSD", "H1", _ts("2024-01-04"), _ts("2024-01-08")),
+        DataRequest("EURUSD", "H1", _ts("2024-02-01"), _ts("2024-02-02")),
+        DataRequest("EURUSD", "M5", _ts("2024-01-04"), _ts("2024-01-05")),
+    ]
+    assert merge_requests(reqs) == [
+        DataRequest("EURUSD", "H1", _ts("2024-01-02"), _ts("2024-01-08")),
+        DataRequest("EURUSD", "H1", _ts("2024-02-01"), _ts("2024-02-02")),
+        DataRequest("EURUSD", "M5", _ts("2024-01-04"), _ts("2024-01-05")),
+    ]
+
+
+def test_preloaded_informatives_skip_the_provider(tmp_path: Path):
+    times = pd.date_range("2024-01-01", "2024-01-05", freq="1h", tz="UTC")
+    full = pd.DataFrame({
+        "time": times,
+        "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0,
+    })
+    backend = FakeBackend(full)
+    provider = DefaultOhlcvDataProvider(
+        backend=backend,
+        cache=MarketDataCache(tmp_path),
+        backtest_start=_ts("2024-01-03"),
+        backtest_end=_ts("2024-01-04"),
+    )
+
+    req = DataRequest("EURUSD", "H1", _ts("2024-01-02"), _ts("2024-01-04"))
+    loaded = DataLoader(provider, max_workers=2).load([req])
+    calls = len(backend.calls)
+
+    preloaded = PreloadedProvider(provider, loaded)
+    df = preloaded.get_informative_df(
+        symbol="EURUSD", timeframe="H1", startup_candle_count=24
+    )
+
+    assert len(backend.calls) == calls
+    assert df["time"].iloc[0] == _ts("2024-01-02")
+    assert df["time"].iloc[-1] == _ts("2024-01-04")
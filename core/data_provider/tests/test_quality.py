@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider.calendar import TradingCalendar
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.quality import FLAGS, OhlcvValidator
+from core.data_provider.tests.fakes import FakeBackend
+
+
+def _dirty_m5():
+    times = pd.date_range("2024-01-04", "2024-01-08", freq="5min", tz="UTC")
+    times = times[TradingCalendar().is_open(times)]
+    close = 1.1 + np.cumsum(np.random.default_rng(0).normal(0, 1e-4, len(times)))
+    df = pd.DataFrame({
+        "time": times,
+        "open": close,
+        "high": close + 1e-4,
+        "low": close - 1e-4,
+        "close": close,
+        "volume": 1.0,
+    })
+
+    df.loc[10, "high"], df.loc[10, "low"] = close[10] - 1e-4, close[10] + 1e-4  # inverted
+    df.loc[20, "close"] = df.loc[20, "high"] + 5e-4                         # close outside
+    df.loc[30, ["open", "high", "low", "close"]] = 1.5                      # zero-range spike
+    df.loc[40, "time"] += pd.Timedelta(seconds=7)                           # jitter
+    df.loc[50, "low"] = 0.0                                                 # bad print
+
+    saturday = pd.Timestamp("2024-01-06T12:00:00Z")
+    df.loc[len(df)] = [saturday, 1.1, 1.1, 1.1, 1.1, 1.0]                   # out of session
+    return df.sort_values("time").reset_index(drop=True)
+
+
+def test_validated_once_on_write_with_report_in_manifest(tmp_path):
+    df = _dirty_m5()
+    provider = DefaultOhlcvDataProvider(
+        backend=FakeBackend(df),
+        cache=ParquetMarketDataCache(tmp_path),
+        validator=OhlcvValidator(repair=True),
+    )
+
+    out = provider.get_ohlcv(
+        symbol="EURUSD",
+        timeframe="M5",
+        start=pd.Timestamp("2024-01-04T00:00:00Z"),
+        end=pd.Timestamp("2024-01-08T00:00:00Z"),
+    )
+
+    assert (out["high"] >= out[["open", "close", "low"]].max(axis=1)).all()
+    assert (out["low"] <= out[["open", "close", "high"]].min(axis=1)).all()
+    assert (out["low"] > 0).all()
+    assert (out["close"] < 1.2).all()
+    assert (out["time"].dt.second == 0).all()
+    assert not (out["time"] == pd.Timestamp("2024-01-06T12:00:00Z")).any()
+    assert len(out) == len(df) - 3
+
+    report = provider.quality_report().iloc[0]
+    assert report["symbol"] == "EURUSD" and report["timeframe"] == "M5"
+    assert report["inverted"] == 1
+    assert report["ohlc_outside"] == 1
+    assert report["spike"] == 1
+    assert report["jitter"] == 1
+    assert report["non_positive"] == 1
+    assert report["out_of_session"] == 1
+    assert report["dropped"] == 3
+
+    reopened = ParquetMarketDataCache(tmp_path)
+    assert reopened.manifest.quality(symbol="EURUSD", timeframe="M5")["validated"]
+
+
+def test_flag_mode_keeps_bars():
+    df = _dirty_m5()
+    out, report = OhlcvValidator(repair=False).run(df, "M5")
+
+    pd.testing.assert_frame_equal(out, df)
+    assert report["dropped"] == 0
+    assert report["flagged"]["2024-01-06T12:00:00+00:00"] & FLAGS["out_of_session"]
+    assert len(report["flagged"]) == 6
+
+
+def test_flag_mode_keeps_flags_out_of_cached_bars(tmp_path):
+    df = _dirty_m5()
+    provider = DefaultOhlcvDataProvider(
+        backend=FakeBackend(df),
+        cache=ParquetMarketDataCache(tmp_path),
+        validator=OhlcvValidator(repair=False),
+    )
+
+    out = provider.get_ohlcv(
+        symbol="EURUSD",
+        timeframe="M5",
+        start=pd.Timestamp("2024-01-04T00:00:00Z"),
+        end=pd.Timestamp("2024-01-08T00:00:00Z"),
+    )
+
+    assert "flags" not in out.columns
+    assert len(out) == len(df)
+
+    flagged = ParquetMarketDataCache(tmp_path).manifest.flagged(symbol="EURUSD", timeframe="M5")
+    assert flagged["2024-01-06T12:00:00+00:00"] & FLAGS["out_of_session"]
+    assert len(flagged) == 6
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.data_provider.calendar import TradingCalendar
+from core.data_provider.default_provider import DefaultOhlcvDataProvider
+from core.data_provider.parquet_cache import ParquetMarketDataCache
+from core.data_provider.resample import OhlcvResampler, resample_ohlcv
+from core.data_provider.tests.fakes import FakeBackend
+
+
+def _m5_session(start, end):
+    times = pd.date_range(start, end, freq="5min", tz="UTC")
+    times = times[TradingCalendar().is_open(times)]
+    close = 1.1 + np.cumsum(np.random.default_rng(0).normal(0, 1e-4, len(times)))
+    return pd.DataFrame({
+        "time": times,
+        "open": close,
+        "high": close + 1e-4,
+        "low": close - 1e-4,
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+def test_informative_timeframe_built_from_cached_base(tmp_path):
+    m5 = _m5_session("2024-01-04", "2024-01-10")
+    backend = FakeBackend(m5)
+    provider = DefaultOhlcvDataProvider(
+        backend=backend,
+        cache=ParquetMarketDataCache(tmp_path),
+        resampler=OhlcvResampler(),
+    )
+
+    start = pd.Timestamp("2024-01-04T00:00:00Z")
+    end = pd.Timestamp("2024-01-10T00:00:00Z")
+    provider.get_ohlcv(symbol="EURUSD", timeframe="M5", start=start, end=end)
+    calls = len(backend.calls)
+
+    h4 = provider.get_ohlcv(
+        symbol="EURUSD",
+        timeframe="H4",
+        start=pd.Timestamp("2024-01-05T02:00:00Z"),
+        end=end,
+    )
+
+    assert len(backend.calls) == calls            # no H4 download
+
+    expected = m5.set_index("time").resample("4h").agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+    }).dropna().reset_index()
+    expected = expected[
+        (expected["time"] >= "2024-01-05T02:00:00Z") & (expected["time"] <= end)
+    ].reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(h4, expected, check_dtype=False)
+    # weekend: Friday 20:00 then Sunday 20:00, nothing in between
+    assert pd.Timestamp("2024-01-07T20:00:00Z") in set(h4["time"])
+    assert not h4["time"].between("2024-01-06", "2024-01-07T19:59:59Z").any()
+
+
+def test_daily_bars_fold_sunday_session_into_monday():
+    m5 = _m5_session("2024-01-04", "2024-01-10")
+
+    plain = resample_ohlcv(m5, "D1")
+    folded = resample_ohlcv(m5, "D1", calendar=TradingCalendar())
+
+    sunday = pd.Timestamp("2024-01-07T00:00:00Z")
+    monday = pd.Timestamp("2024-01-08T00:00:00Z")
+    assert sunday in set(plain["time"])
+    assert sunday not in set(folded["time"])
+
+    mon = folded.set_index("time").loc[monday]
+    sun_mon = m5[(m5["time"] >= sunday) & (m5["time"] < monday + pd.Timedelta(days=1))]
+    assert mon["open"] == sun_mon["open"].iloc[0]
+    assert mon["close"] == sun_mon["close"].iloc[-1]
+    assert mon["volume"] == len(sun_mon)
+    assert folded["volume"].sum() == plain["volume"].sum()
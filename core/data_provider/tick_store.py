@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.data_provider.calendar import TradingCalendar
+from core.data_provider.exceptions import DataNotAvailable
+
+
+TICK_SCHEMA = pa.schema([
+    ("time", pa.int64()),      # ns since epoch, UTC
+    ("bid", pa.float32()),
+    ("ask", pa.float32()),
+])
+
+DAY = pd.Timedelta(days=1)
+
+
+# ==================================================
+# Store
+# ==================================================
+
+class TickStore:
+    """
+    Columnar tick cache, one file per symbol and UTC day:
+
+        root/<symbol>/<YYYY-MM-DD>.parquet
+
+    Columns: time int64 ns, bid / ask float32, zstd-compressed
+    row groups of ROW_GROUP ticks. A day file exists once the day was
+    fetched (empty file = no ticks that day). Reads stream row group
+    batches, so memory stays bounded by the batch size.
+    """
+
+    ROW_GROUP = 1 << 20
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        compression: str = "zstd",
+        compression_level: int | None = 3,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def _path(self, symbol: str, day: pd.Timestamp) -> Path:
+        return self.root / symbol / f"{day:%Y-%m-%d}.parquet"
+
+    def has_day(self, symbol: str, day: pd.Timestamp) -> bool:
+        return self._path(symbol, day).exists()
+
+    def days(self, symbol: str) -> list[pd.Timestamp]:
+        path = self.root / symbol
+        if not path.exists():
+            return []
+        return [pd.Timestamp(p.stem, tz="UTC") for p in sorted(path.glob("*.parquet"))]
+
+    # -------------------------------------------------
+    # Write
+    # -------------------------------------------------
+
+    def write_day(self, symbol: str, day: pd.Timestamp, ticks: pd.DataFrame) -> None:
+        """
+        Replaces the day file atomically. ticks: time, bid, ask.
+        """
+        time_ns = (
+            pd.to_datetime(ticks["time"], utc=True)
+            .dt.tz_convert(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view(np.int64)
+        )
+        order = np.argsort(time_ns, kind="stable")
+
+        table = pa.Table.from_arrays(
+            [
+                pa.array(time_ns[order]),
+                pa.array(ticks["bid"].to_numpy(dtype=np.float32)[order]),
+                pa.array(ticks["ask"].to_numpy(dtype=np.float32)[order]),
+            ],
+            schema=TICK_SCHEMA,
+        )
+
+        path = self._path(symbol, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(
+            table,
+            tmp,
+            row_group_size=self.ROW_GROUP,
+            compression=self.compression,
+            compression_level=self.compression_level,
+        )
+        os.replace(tmp, path)
+
+    # -------------------------------------------------
+    # Read
+    # -------------------------------------------------
+
+    def iter_batches(
+        self,
+        symbol: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        *,
+        batch_size: int = 1 << 18,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Time-ordered batches {time, bid, ask} of ticks in [start, end),
+        at most batch_size ticks each.
+        """
+        lo, hi = start.value, end.value
+
+        for day in pd.date_range(start.floor("D"), (end - pd.Timedelta(1, "ns")).floor("D"), freq="D"):
+            path = self._path(symbol, day)
+            if not path.exists():
+                continue
+
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+                time_ns = batch.column(0).to_numpy()
+                if len(time_ns) == 0 or time_ns[-1] < lo:
+                    continue
+                if time_ns[0] >= hi:
+                    break
+
+                keep = slice(
+                    np.searchsorted(time_ns, lo, "left"),
+                    np.searchsorted(time_ns, hi, "left"),
+                )
+                yield {
+                    "time": time_ns[keep],
+                    "bid": batch.column(1).to_numpy()[keep],
+                    "ask": batch.column(2).to_numpy()[keep],
+                }
+
+    def load(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        batches = list(self.iter_batches(symbol, start, end))
+        time_ns = np.concatenate([b["time"] for b in batches]) if batches else np.empty(0, np.int64)
+
+        return pd.DataFrame({
+            "time": pd.to_datetime(time_ns, unit="ns", utc=True),
+            "bid": np.concatenate([b["bid"] for b in batches]) if batches else np.empty(0, np.float32),
+            "ask": np.concatenate([b["ask"] for b in batches]) if batches else np.empty(0, np.float32),
+        })
+
+
+# ==================================================
+# Replay
+# ==================================================
+
+@dataclass(frozen=True)
+class TickBatch:
+    """
+    Ticks of several symbols in time order.
+    symbol holds indexes into symbols.
+    """
+
+    symbols: tuple[str, ...]
+    time: np.ndarray      # int64 ns, UTC
+    symbol: np.ndarray    # int16
+    bid: np.ndarray       # float32
+    ask: np.ndarray       # float32
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+def replay_ticks(
+    store: TickStore,
+    symbols: list[str],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    *,
+    batch_size: int = 1 << 18,
+) -> Iterator[TickBatch]:
+    """
+    k-way merge of the symbols' tick streams in time order
+    (ties keep symbol order).
+
+    Holds at most ~2 batches per symbol: each round emits every
+    buffered tick up to the earliest buffer end among the symbols
+    that still have data to read, then refills the drained buffers.
+    """
+    symbols = tuple(symbols)
+    streams = [store.iter_batches(s, start, end, batch_size=batch_size) for s in symbols]
+    buffers: list[dict[str, np.ndarray] | None] = [None] * len(symbols)
+    done = [False] * len(symbols)
+
+    while True:
+        for i, stream in enumerate(streams):
+            while not done[i] and (buffers[i] is None or len(buffers[i]["time"]) == 0):
+                buffers[i] = next(stream, None)
+                if buffers[i] is None:
+                    done[i] = True
+
+        live = [i for i, b in enumerate(buffers) if b is not None and len(b["time"])]
+        if not live:
+            return
+
+        pending = [buffers[i]["time"][-1] for i in live if not done[i]]
+        horizon = min(pending) if pending else np.iinfo(np.int64).max
+
+        parts = []
+        for i in live:
+            buf = buffers[i]
+            cut = np.searchsorted(buf["time"], horizon, "right")
+            parts.append((i, {k: v[:cut] for k, v in buf.items()}))
+            buffers[i] = {k: v[cut:] for k, v in buf.items()}
+
+        time_ns = np.concatenate([p["time"] for _, p in parts])
+        order = np.argsort(time_ns, kind="stable")
+
+        yield TickBatch(
+            symbols=symbols,
+            time=time_ns[order],
+            symbol=np.concatenate([
+                np.full(len(p["time"]), i, dtype=np.int16) for i, p in parts
+            ])[order],
+            bid=np.concatenate([p["bid"] for _, p in parts])[order],
+            ask=np.concatenate([p["ask"] for _, p in parts])[order],
+        )
+
+
+# ==================================================
+# Provider
+# ==================================================
+
+class TickDataProvider:
+    """
+    Tick access through the store: days not stored yet are fetched
+    from the backend (concurrently, one request per day) and
+    written once. Days that are closed all day per the calendar are
+    stored empty without a request; days younger than SETTLE are
+    never stored (the source may still publish them).
+    """
+
+    SETTLE = pd.Timedelta(days=1)
+
+    def __init__(
+        self,
+        *,
+        backend,
+        store: TickStore,
+        calendar: TradingCalendar | None = None,
+        fetch_workers: int = 4,
+    ):
+        self.backend = backend
+        self.store = store
+        self.calendar = calendar or TradingCalendar()
+        self.fetch_workers = fetch_workers
+
+    @staticmethod
+    def _to_utc(ts: pd.Timestamp) -> pd.Timestamp:
+        ts = pd.Timestamp(ts)
+        return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+    def _fetch_day(self, symbol: str, day: pd.Timestamp) -> None:
+        if not len(self.calendar.open_bars(day, day + DAY - pd.Timedelta(minutes=1), "1min")):
+            ticks = pd.DataFrame({"time": [], "bid": [], "ask": []})
+        else:
+            try:
+                ticks = self.backend.fetch_ticks(symbol=symbol, start=day, end=day + DAY)
+            except DataNotAvailable as exc:
+                print(f"⚠️ Tick fetch failed {symbol} {day:%Y-%m-%d}: {exc.__cause__ or exc}")
+                return
+
+        self.store.write_day(symbol, day, ticks)
+
+    def ensure(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> None:
+        """
+        Fetches and stores every settled day of [start, end) missing
+        from the store.
+        """
+        settled = pd.Timestamp.now(tz="UTC") - self.SETTLE
+        days = [
+            day
+            for day in pd.date_range(
+                self._to_utc(start).floor("D"),
+                (self._to_utc(end) - pd.Timedelta(1, "ns")).floor("D"),
+                freq="D",
+            )
+            if day + DAY <= settled and not self.store.has_day(symbol, day)
+        ]
+        if not days:
+            return
+
+        print(f"📥 Ticks | fetching {symbol} {len(days)} day(s)")
+        workers = max(1, min(self.fetch_workers, len(days)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda day: self._fetch_day(symbol, day), days))
+
+    def get_ticks(self, *, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """
+        All ticks of [start, end) in memory (short ranges only).
+        """
+        start, end = self._to_utc(start), self._to_utc(end)
+        self.ensure(symbol, start, end)
+        return self.store.load(symbol, start, end)
+
+    def replay(
+        self,
+        *,
+        symbols: list[str],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        batch_size: int = 1 << 18,
+    ) -> Iterator[TickBatch]:
+        """
+        Streams ticks of all symbols in time order (see replay_ticks).
+        """
+        start, end = self._to_utc(start), self._to_utc(end)
+        for symbol in symbols:
+            self.ensure(symbol, start, end)
+        return replay_ticks(self.store, symbols, start, end, batch_size=batch_size)
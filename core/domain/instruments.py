@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, Optional
+
+
+INSTRUMENTS_FILE = "market_data/instruments.json"
+# legacy {symbol: pip_value} cache written from MT5 by earlier versions
+PIP_VALUES_FILE = "market_data/pip_values.json"
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """
+    Static trading parameters of one symbol.
+
+    point        : minimal price movement
+    pip_value    : USD value of 1 pip for 1 lot
+    contract_size: units per lot
+    volume_*     : broker lot limits
+    """
+
+    symbol: str
+    point: float
+    pip_value: float
+    contract_size: float = 1.0
+    volume_min: float = 0.01
+    volume_max: float = 100.0
+    volume_step: float = 0.01
+
+    @classmethod
+    def from_symbol_info(cls, symbol: str, info) -> "InstrumentSpec":
+        """
+        Builds a spec from an MT5 symbol_info record.
+        """
+        if info.point < 0.01:
+            ticks_per_pip = 0.0001 / info.point
+        else:
+            ticks_per_pip = 1.0
+
+        return cls(
+            symbol=symbol,
+            point=info.point,
+            pip_value=info.trade_tick_value * ticks_per_pip,
+            contract_size=info.trade_contract_size,
+            volume_min=info.volume_min,
+            volume_max=info.volume_max,
+            volume_step=info.volume_step,
+        )
+
+    def normalize_volume(self, volume: float) -> float:
+        """
+        Clamps to broker limits and floors to volume_step.
+        """
+        volume = max(self.volume_min, min(volume, self.volume_max))
+
+        steps = int(volume / self.volume_step)
+        normalized = round(steps * self.volume_step, 2)
+
+        if normalized < self.volume_min:
+            raise RuntimeError(
+                f"Normalized volume {normalized} < min volume {self.volume_min}"
+            )
+
+        return normalized
+
+
+DEFAULT_INSTRUMENTS = (
+    InstrumentSpec(symbol="EURUSD", point=0.0001, pip_value=10.0, contract_size=100_000),
+    InstrumentSpec(symbol="XAUUSD", point=0.01, pip_value=1.0, contract_size=100),
+    InstrumentSpec(symbol="USTECH100", point=0.01, pip_value=1.0, contract_size=1),
+)
+
+
+def load_pip_values(path: str = PIP_VALUES_FILE) -> dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return {symbol: float(value) for symbol, value in json.load(f).items()}
+
+
+class InstrumentRegistry:
+    """
+    In-memory symbol -> InstrumentSpec lookup.
+
+    - seeded with DEFAULT_INSTRUMENTS and the persisted file (if any)
+    - pip_values ({symbol: pip_value}, e.g. the legacy pip_values.json)
+      override the pip value of the defaults and of loaded specs;
+      full specs in the persisted file take precedence
+    - unknown symbols are resolved once through `loader`
+      (e.g. MT5 symbol_info), cached and optionally persisted
+    """
+
+    def __init__(
+            self,
+            specs=DEFAULT_INSTRUMENTS,
+            *,
+            path: Optional[str] = None,
+            loader: Optional[Callable[[str], Optional[InstrumentSpec]]] = None,
+            pip_values: Optional[dict[str, float]] = None,
+    ):
+        self.path = path
+        self.loader = loader
+        self.pip_values = dict(pip_values or {})
+        self._specs: dict[str, InstrumentSpec] = {
+            s.symbol: self._with_pip_value(s) for s in specs
+        }
+
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                for symbol, fields in json.load(f).items():
+                    self._specs[symbol] = InstrumentSpec(symbol=symbol, **fields)
+
+    def _with_pip_value(self, spec: InstrumentSpec) -> InstrumentSpec:
+        pip_value = self.pip_values.get(spec.symbol)
+        if pip_value is None:
+            return spec
+        return replace(spec, pip_value=pip_value)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._specs
+
+    def get(
+            self,
+            symbol: str,
+            loader: Optional[Callable[[str], Optional[InstrumentSpec]]] = None,
+    ) -> InstrumentSpec:
+        """
+        loader overrides self.loader for this lookup (used on miss only).
+        """
+        spec = self._specs.get(symbol)
+        if spec is not None:
+            return spec
+
+        loader = loader or self.loader
+        if loader is not None:
+            spec = loader(symbol)
+
+        if spec is None:
+            raise KeyError(f"Unknown instrument: {symbol}")
+
+        spec = self._with_pip_value(spec)
+        self.register(spec, persist=True)
+        return spec
+
+    def register(self, spec: InstrumentSpec, *, persist: bool = False) -> None:
+        self._specs[spec.symbol] = spec
+        if persist and self.path:
+            self.save()
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        data = {}
+        for symbol, spec in sorted(self._specs.items()):
+            fields = asdict(spec)
+            fields.pop("symbol")
+            data[symbol] = fields
+
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+_registry: Optional[InstrumentRegistry] = None
+
+
+def get_instrument_registry() -> InstrumentRegistry:
+    """
+    Process-wide registry (defaults + PIP_VALUES_FILE + INSTRUMENTS_FILE),
+    created once.
+    """
+    global _registry
+    if _registry is None:
+        _registry = InstrumentRegistry(
+            path=INSTRUMENTS_FILE,
+            pip_values=load_pip_values(),
+        )
+    return _registry
+
+
+def get_instrument(symbol: str) -> InstrumentSpec:
+    return get_instrument_registry().get(symbol)
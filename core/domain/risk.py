@@ -1,55 +1,60 @@
-import os
-import json
-import MetaTrader5 as mt5
+from functools import lru_cache
 
-CACHE_FILE = "market_data/pip_values.json"
+from core.domain.instruments import InstrumentRegistry, InstrumentSpec, load_pip_values
 
 
-def load_pip_cache():
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    return {}
+def _load_from_mt5(symbol: str) -> InstrumentSpec | None:
+    """
+    One terminal round-trip per unknown symbol (result is cached
+    by the registry).
+    """
+    import MetaTrader5 as mt5
 
+    if not mt5.initialize():
+        return None
+    try:
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            return None
+        return InstrumentSpec.from_symbol_info(symbol, info)
+    finally:
+        mt5.shutdown()
 
-def save_pip_cache(cache):
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=2)
 
+# broker specs only (no backtest defaults), one lookup per symbol
+_broker_instruments = InstrumentRegistry((), loader=_load_from_mt5)
+# symbols the terminal could not resolve (not retried in this process)
+_broker_missing: set[str] = set()
 
-def get_pip_value(symbol: str, lot_size=1.0, default_pip=10):
 
-    cache = load_pip_cache()
-    if symbol in cache:
-        return cache[symbol]
+def _broker_spec(symbol: str) -> InstrumentSpec | None:
+    if symbol in _broker_missing:
+        return None
+    try:
+        return _broker_instruments.get(symbol)
+    except KeyError:
+        _broker_missing.add(symbol)
+        return None
 
-    pip_value = default_pip
-    if mt5.initialize():
-        info = mt5.symbol_info(symbol)
-        if info is not None:
-            if info.point < 0.01:
-                ticks_per_pip = 0.0001 / info.point
-            else:
-                ticks_per_pip = 1.0
 
-            pip_value = info.trade_tick_value * ticks_per_pip * lot_size
-        mt5.shutdown()
+@lru_cache(maxsize=1)
+def _cached_pip_values() -> dict[str, float]:
+    return load_pip_values()
 
-    cache[symbol] = pip_value
-    save_pip_cache(cache)
-    return pip_value
 
+def get_pip_value(symbol: str, lot_size=1.0, default_pip=10):
+    spec = _broker_spec(symbol)
+    if spec is not None:
+        return spec.pip_value * lot_size
 
-def get_point_size(symbol: str, default_point=0.0001):
+    # terminal unavailable: last broker value cached in pip_values.json
+    cached = _cached_pip_values().get(symbol)
+    return cached * lot_size if cached is not None else default_pip
 
-    if mt5.initialize():
-        info = mt5.symbol_info(symbol)
-        if info is not None:
-            point = info.point
-            mt5.shutdown()
-            return point
-    return default_point
+
+def get_point_size(symbol: str, default_point=0.0001):
+    spec = _broker_spec(symbol)
+    return spec.point if spec is not None else default_point
 
 
 def position_sizer(
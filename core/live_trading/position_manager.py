@@ -6,6 +6,7 @@ from typing import Dict, Any
 import mt5
 
 from config.live import MAX_RISK_PER_TRADE
+from core.domain.instruments import InstrumentRegistry, InstrumentSpec
 from core.domain.risk import position_sizer_fast
 from core.live_trading.trade_repo import TradeRepo
 from core.live_trading.mt5_adapter import MT5Adapter
@@ -25,55 +26,31 @@ class PositionManager:
     def __init__(self, repo: TradeRepo, adapter: MT5Adapter):
         self.repo = repo
         self.adapter = adapter
+        # broker specs only (no backtest defaults), one lookup per symbol
+        self.instruments = InstrumentRegistry((), loader=self._load_instrument)
 
     # ==================================================
     # Risk helpers
     # ==================================================
 
+    @staticmethod
+    def _load_instrument(symbol: str) -> InstrumentSpec:
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            raise RuntimeError(f"Symbol not found: {symbol}")
+        return InstrumentSpec.from_symbol_info(symbol, info)
+
     def _get_symbol_risk_params(self, symbol: str) -> tuple[float, float]:
         """
         Returns:
             point_size: minimal price movement
             pip_value: USD value of 1 pip for 1 lot
         """
-        info = mt5.symbol_info(symbol)
-        if info is None:
-            raise RuntimeError(f"Symbol not found: {symbol}")
-
-        point_size = info.point
-
-        if info.point < 0.01:
-            ticks_per_pip = 0.0001 / info.point
-        else:
-            ticks_per_pip = 1.0
-
-        pip_value = info.trade_tick_value * ticks_per_pip
-
-        return point_size, pip_value
+        instrument = self.instruments.get(symbol)
+        return instrument.point, instrument.pip_value
 
     def _normalize_volume(self, symbol: str, volume: float) -> float:
-        info = mt5.symbol_info(symbol)
-        if info is None:
-            raise RuntimeError(f"Symbol not found: {symbol}")
-
-        min_vol = info.volume_min
-        max_vol = info.volume_max
-        step = info.volume_step
-
-        print("Min_vol:", min_vol)
-        print("Max_vol:", max_vol)
-
-        volume = max(min_vol, min(volume, max_vol))
-
-        steps = int(volume / step)
-        normalized = round(steps * step, 2)
-
-        if normalized < min_vol:
-            raise RuntimeError(
-                f"Normalized volume {normalized} < min volume {min_vol}"
-            )
-
-        return normalized
+        return self.instruments.get(symbol).normalize_volume(volume)
 
     def _calculate_volume(self, *, plan: TradePlan) -> float:
         """
@@ -12,7 +12,9 @@ class LiveStrategyAdapter:
         strategy: BaseStrategy,
     ):
         self.strategy = strategy
-
+        # indicators computed incrementally across candles where the
+        # strategy supports it (BaseStrategy.live_stream)
+        self.strategy.live = True
 
     # ==================================================
     # Public API (used by LiveEngine)
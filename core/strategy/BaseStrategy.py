@@ -9,10 +9,17 @@ from plotly.graph_objs import volume
 
 from config.backtest import INITIAL_BALANCE
 from config.live import MAX_RISK_PER_TRADE
-from core.backtesting.backtester import INSTRUMENT_META
+from core.domain.instruments import get_instrument
 from core.backtesting.reporting.config.report_config import ReportConfig
 from core.backtesting.reporting.core.metrics import ExpectancyMetric, MaxDrawdownMetric
 from core.domain.risk import position_sizer_fast
+from core.data_provider.feature_store import code_fingerprint, data_digest
+from core.strategy.signals import (
+    ENTRY_COLUMNS,
+    has_columnar_entries,
+    normalize_entry_columns,
+    read_entry_row,
+)
 from core.strategy.trade_plan import (
     TradePlan,
     FixedExitPlan,
@@ -20,6 +27,7 @@ from core.strategy.trade_plan import (
     TradeAction,
 )
 from core.backtesting.plotting.zones import ZoneView
+from core.utils.frames import cow_copy, materialize_frame
 from core.utils.timing_log import run_step
 
 
@@ -49,6 +57,15 @@ class BaseStrategy:
             "level": float,
             "reason": str
         }
+
+    Alternative (typed, columnar) entry contract, used instead of
+    signal_entry / levels when `entry_dir` column is present
+    (see core.strategy.signals):
+
+    entry_dir: int8            1 = long, -1 = short, 0 = none
+    entry_tag_id: category
+    sl / tp1 / tp2: float64    NaN = not set
+    sl_tag_id / tp1_tag_id / tp2_tag_id: category
     """
 
     REQUIRED_COLUMNS = [
@@ -64,6 +81,30 @@ class BaseStrategy:
         "custom_stop_loss",
     ]
 
+    COLUMNAR_REQUIRED_COLUMNS = [
+        "time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "atr",
+        *ENTRY_COLUMNS,
+        "signal_exit",
+        "custom_stop_loss",
+    ]
+
+    # Tunable parameters (name -> default), read via self.params.
+    PARAMS: Dict[str, Any] = {}
+
+    # Subset of PARAMS that changes informatives / populate_indicators
+    # output. Everything else only affects entry / exit logic.
+    FEATURE_PARAMS: tuple[str, ...] = ()
+
+    # Read informatives / populate_indicators output through the
+    # provider's feature store (if it has one). Only for strategies
+    # whose feature methods have no side effects besides the frame.
+    CACHE_FEATURES: bool = False
+
     # ==================================================
     # Init
     # ==================================================
@@ -76,9 +117,11 @@ class BaseStrategy:
         startup_candle_count: int = 600,
         provider=None,
         strategy_config: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
     ):
-        self.df = df.copy()
+        self.df = cow_copy(df)
         self.symbol = symbol
+        self.params = self.resolve_params(params)
         self.startup_candle_count = startup_candle_count
         self.provider = provider
 
@@ -92,10 +135,31 @@ class BaseStrategy:
         self.htf_zones = None
         self.ltf_zones = None
 
+        # set by LiveStrategyAdapter: the same instance runs once per
+        # closed candle, incremental state is kept in live_stream()
+        self.live = False
+        self._streams = {}
+
         self.strategy_config = strategy_config or {}
         self.validate_strategy_config()
         self.report_config = self.build_report_config()
 
+    # ==================================================
+    # Parameters
+    # ==================================================
+
+    @classmethod
+    def resolve_params(cls, params: Dict[str, Any] | None) -> Dict[str, Any]:
+        params = params or {}
+
+        unknown = set(params) - set(cls.PARAMS)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for {cls.__name__}: {sorted(unknown)}"
+            )
+
+        return {**cls.PARAMS, **params}
+
     # ==================================================
     # Strategy config validation
     # ==================================================
@@ -129,21 +193,11 @@ class BaseStrategy:
     # ==================================================
 
     def build_trade_plan(self, *, row: pd.Series) -> TradePlan | None:
-        signal = row.get("signal_entry")
-        levels = row.get("levels")
-
-        if not isinstance(signal, dict):
-            return None
-        if not isinstance(levels, dict):
-            return None
-
-        direction = signal.get("direction")
-        if direction not in ("long", "short"):
+        entry = self._read_entry(row)
+        if entry is None:
             return None
 
-        sl = levels.get("SL", {}).get("level")
-        tp1 = levels.get("TP1", {}).get("level")
-        tp2 = levels.get("TP2", {}).get("level") if levels.get("TP2") else None
+        direction, entry_tag, sl, tp1, tp2 = entry
 
         if sl is None:
             return None
@@ -151,9 +205,9 @@ class BaseStrategy:
         cfg = self.strategy_config
         use_trailing = cfg.get("USE_TRAILING", False)
 
-        meta = INSTRUMENT_META[self.symbol]
-        point_size = meta["point"]
-        pip_value = meta["pip_value"]
+        instrument = get_instrument(self.symbol)
+        point_size = instrument.point
+        pip_value = instrument.pip_value
 
         volume = position_sizer_fast(
             close=row.close,
@@ -187,13 +241,40 @@ class BaseStrategy:
             symbol=self.symbol,
             direction=direction,
             entry_price=row["close"],
-            entry_tag=signal.get("tag", ""),
+            entry_tag=entry_tag or "",
             volume=volume,
             exit_plan=exit_plan,
             strategy_name=type(self).__name__,
             strategy_config=self.strategy_config,
         )
 
+    @staticmethod
+    def _read_entry(row: pd.Series):
+        """
+        Returns (direction, tag, sl, tp1, tp2) for either
+        entry contract, or None when the row has no valid entry.
+        """
+        if "entry_dir" in row.index:
+            return read_entry_row(row)
+
+        signal = row.get("signal_entry")
+        levels = row.get("levels")
+
+        if not isinstance(signal, dict):
+            return None
+        if not isinstance(levels, dict):
+            return None
+
+        direction = signal.get("direction")
+        if direction not in ("long", "short"):
+            return None
+
+        sl = levels.get("SL", {}).get("level")
+        tp1 = levels.get("TP1", {}).get("level")
+        tp2 = levels.get("TP2", {}).get("level") if levels.get("TP2") else None
+
+        return direction, signal.get("tag", ""), sl, tp1, tp2
+
     # ==================================================
     # Managed exits (optional)
     # ==================================================
@@ -209,6 +290,22 @@ class BaseStrategy:
         """
         return None
 
+    # ==================================================
+    # Live incremental state
+    # ==================================================
+
+    def live_stream(self, key: str, factory):
+        """
+        Incremental calculator (e.g. MarketStructureEngine.stream) kept
+        across live runs, created by factory() on first use of key.
+        Feed it the growing / sliding frame each run: it computes only
+        the bars it has not seen.
+        """
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = factory()
+        return stream
+
     # ==================================================
     # Informatives
     # ==================================================
@@ -250,7 +347,12 @@ class BaseStrategy:
             for method in methods:
                 def _apply_method(method=method, tf=tf):
                     df = self._informative_results[tf]
-                    self._informative_results[tf] = method(df)
+                    self._informative_results[tf] = self._read_through_features(
+                        feature=method.__name__,
+                        timeframe=tf,
+                        df=df,
+                        compute=lambda: method(df),
+                    )
 
                 run_step(
                     f"populate_informatives | method {method.__name__} ({tf})",
@@ -263,6 +365,10 @@ class BaseStrategy:
 
         for tf, df_tf in self._informative_results.items():
 
+            # lazy feature frames (MarketStructureEngine lazy=True):
+            # the merge copies every column
+            df_tf = materialize_frame(df_tf)
+
             # ===============================
             # 1️⃣ VALIDATION
             # ===============================
@@ -350,9 +456,69 @@ class BaseStrategy:
     # ==================================================
 
     def run(self):
+        self.run_features()
+        return self.run_signals()
+
+    def run_features(self):
+        """
+        Feature stage: informatives + indicators.
+        Output depends only on data and FEATURE_PARAMS.
+        """
         run_step("📈 🧠 run_strategy | populate_informatives TOTAL", self._populate_informatives)
         run_step("📈 🧠 run_strategy | merge_informatives", self._merge_informatives)
-        run_step("📈 🧠 run_strategy | populate_indicators", self.populate_indicators)
+        run_step("📈 🧠 run_strategy | populate_indicators", self._populate_indicators)
+        return self.df
+
+    def _populate_indicators(self):
+        def compute():
+            self.populate_indicators()
+            return self.df
+
+        self.df = self._read_through_features(
+            feature="populate_indicators",
+            timeframe="base",
+            df=self.df,
+            compute=compute,
+        )
+
+    @property
+    def caches_features(self) -> bool:
+        """
+        Feature stages go through the provider's feature store. It
+        keeps whole frames, so lazy feature frames gain nothing then
+        (every pending column is computed before saving).
+        """
+        return self.CACHE_FEATURES and getattr(self.provider, "feature_store", None) is not None
+
+    def _read_through_features(self, *, feature: str, timeframe: str, df: pd.DataFrame, compute):
+        """
+        compute() output, or the stored one for the same input bars,
+        FEATURE_PARAMS and strategy code (see FeatureStore).
+        """
+        if not self.caches_features:
+            return compute()
+
+        store = self.provider.feature_store
+
+        key = store.key(
+            data=data_digest(df),
+            params={k: self.params[k] for k in self.FEATURE_PARAMS},
+            code=code_fingerprint(type(self).__module__),
+        )
+        where = dict(symbol=self.symbol, timeframe=timeframe, feature=f"{type(self).__name__}.{feature}")
+
+        cached = store.load(**where, key=key)
+        if cached is not None:
+            return cached
+
+        out = materialize_frame(compute())
+        store.save(**where, key=key, df=out)
+        return out
+
+    def run_signals(self):
+        """
+        Signal stage: entries / exits on top of computed features.
+        """
         run_step("📈 🧠 run_strategy | populate_entry_trend", self.populate_entry_trend)
         run_step("📈 🧠 run_strategy | populate_exit_trend", self.populate_exit_trend)
 
@@ -372,11 +538,16 @@ class BaseStrategy:
 
 
     def _finalize(self):
-        self.df_plot = self.df.copy()
-
+        if has_columnar_entries(self.df):
+            normalize_entry_columns(self.df)
+            required = self.COLUMNAR_REQUIRED_COLUMNS
+        else:
+            required = self.REQUIRED_COLUMNS
 
+        # plain frames: lazy feature columns nothing read stay uncomputed
+        self.df_plot = cow_copy(materialize_frame(self.df, pending=False))
 
-        self.df_backtest = self.df[self.REQUIRED_COLUMNS].copy()
+        self.df_backtest = cow_copy(materialize_frame(self.df[required], pending=False))
 
     def _collect_informatives(self):
         for _, method in inspect.getmembers(type(self), predicate=callable):
@@ -4,6 +4,9 @@ from time import perf_counter
 
 import pandas as pd
 
+from core.data_provider.mmap_store import MmapFrameRef
+from core.utils.frames import materialize_frame
+
 
 def run_strategy_single(
     symbol: str,
@@ -15,7 +18,11 @@ def run_strategy_single(
     """
     Run single strategy instance for one symbol.
     Must be top-level for multiprocessing.
+
+    df may be an MmapFrameRef (mapped in the worker, not pickled).
     """
+    if isinstance(df, MmapFrameRef):
+        df = df.load()
 
     # -------------------------------------------------
     # INIT STRATEGY
@@ -44,3 +51,54 @@ def run_strategy_single(
     # -------------------------------------------------
 
     return df_signals, strategy
+
+
+def run_strategy_features(
+    symbol: str,
+    df: pd.DataFrame,
+    provider,
+    strategy_cls,
+    startup_candle_count: int,
+    params: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Feature stage only (informatives + indicators).
+    Must be top-level for multiprocessing.
+    """
+    strategy = strategy_cls(
+        df=df,
+        symbol=symbol,
+        provider=provider,
+        startup_candle_count=startup_candle_count,
+        params=params,
+    )
+    df = strategy.run_features()
+
+    # shared by many signal runs (other processes): lazy feature
+    # frames are computed here, once
+    return materialize_frame(df)
+
+
+def run_strategy_signals(
+    symbol: str,
+    df_features: pd.DataFrame,
+    strategy_cls,
+    startup_candle_count: int,
+    params: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Signal stage on precomputed features (no data access).
+    """
+    strategy = strategy_cls(
+        df=df_features,
+        symbol=symbol,
+        provider=None,
+        startup_candle_count=startup_candle_count,
+        params=params,
+    )
+    df_signals = strategy.run_signals()
+
+    if "symbol" not in df_signals.columns:
+        df_signals["symbol"] = symbol
+
+    return df_signals
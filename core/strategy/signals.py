@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# ==========================================================
+# Columnar entry contract
+# ==========================================================
+#
+# Typed alternative to the dict-based `signal_entry` / `levels`
+# object columns (see BaseStrategy docstring):
+#
+#   entry_dir     int8        1 = long, -1 = short, 0 = no entry
+#   entry_tag_id  category    entry tag
+#   sl/tp1/tp2    float64     price levels (NaN = not set)
+#   sl_tag_id     category    level tags
+#   tp1_tag_id    category
+#   tp2_tag_id    category
+#
+# ==========================================================
+
+DIRECTION_CODES = {"long": 1, "short": -1}
+DIRECTION_NAMES = {1: "long", -1: "short"}
+
+LEVEL_COLUMNS = ["sl", "tp1", "tp2"]
+LEVEL_TAG_COLUMNS = ["sl_tag_id", "tp1_tag_id", "tp2_tag_id"]
+
+ENTRY_COLUMNS = [
+    "entry_dir",
+    "entry_tag_id",
+    *LEVEL_COLUMNS,
+    *LEVEL_TAG_COLUMNS,
+]
+
+
+def has_columnar_entries(df: pd.DataFrame) -> bool:
+    return "entry_dir" in df.columns
+
+
+def init_entry_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds empty columnar entry contract to df (in place).
+    """
+    n = len(df)
+
+    df["entry_dir"] = np.zeros(n, dtype=np.int8)
+    df["entry_tag_id"] = pd.Categorical([None] * n)
+
+    for col in LEVEL_COLUMNS:
+        df[col] = np.full(n, np.nan, dtype=np.float64)
+
+    for col in LEVEL_TAG_COLUMNS:
+        df[col] = pd.Categorical([None] * n)
+
+    return df
+
+
+def set_entry_signal(
+    df: pd.DataFrame,
+    mask: pd.Series,
+    *,
+    direction: str,
+    tag: str,
+) -> None:
+    """
+    Marks entry signal on candles selected by mask.
+    Later calls overwrite earlier ones (same as dict contract).
+    """
+    mask = np.asarray(mask, dtype=bool)
+
+    df.loc[mask, "entry_dir"] = np.int8(DIRECTION_CODES[direction])
+    df["entry_tag_id"] = _set_category(df["entry_tag_id"], mask, tag)
+
+
+def set_levels(
+    df: pd.DataFrame,
+    mask: pd.Series,
+    *,
+    sl,
+    tp1,
+    tp2,
+    sl_tag: str,
+    tp1_tag: str,
+    tp2_tag: str,
+) -> None:
+    """
+    Writes SL / TP1 / TP2 levels (scalars or aligned Series)
+    and their tags on candles selected by mask.
+    """
+    mask = np.asarray(mask, dtype=bool)
+
+    for col, value in zip(LEVEL_COLUMNS, (sl, tp1, tp2)):
+        if isinstance(value, pd.Series):
+            value = value.to_numpy(dtype=np.float64)[mask]
+        df.loc[mask, col] = value
+
+    for col, tag in zip(LEVEL_TAG_COLUMNS, (sl_tag, tp1_tag, tp2_tag)):
+        df[col] = _set_category(df[col], mask, tag)
+
+
+def normalize_entry_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerces columnar contract to its canonical dtypes.
+    """
+    df["entry_dir"] = df["entry_dir"].fillna(0).astype(np.int8)
+
+    for col in LEVEL_COLUMNS:
+        df[col] = df[col].astype(np.float64)
+
+    for col in ["entry_tag_id", *LEVEL_TAG_COLUMNS]:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+
+    return df
+
+
+def read_entry_row(row: pd.Series) -> tuple[str, str | None, float | None, float | None, float | None] | None:
+    """
+    Reads one columnar row.
+
+    Returns (direction, tag, sl, tp1, tp2) or None when the
+    candle carries no entry. Missing levels are returned as None.
+    """
+    direction = DIRECTION_NAMES.get(int(row.get("entry_dir", 0) or 0))
+    if direction is None:
+        return None
+
+    sl, tp1, tp2 = (_level(row.get(col)) for col in LEVEL_COLUMNS)
+
+    return direction, _label(row.get("entry_tag_id")), sl, tp1, tp2
+
+
+# ==========================================================
+# Helpers
+# ==========================================================
+
+def _set_category(series: pd.Series, mask: np.ndarray, value: str) -> pd.Series:
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype("category")
+
+    if value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+
+    series = series.copy()
+    series[mask] = value
+    return series
+
+
+def _level(value) -> float | None:
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
+
+
+def _label(value) -> str | None:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
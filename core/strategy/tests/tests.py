@@ -6,6 +6,12 @@ from core.strategy.BaseStrategy import (
     ManagedExitPlan
 )
 from core.strategy.exception import StrategyConfigError
+from core.strategy.signals import (
+    init_entry_columns,
+    normalize_entry_columns,
+    set_entry_signal,
+    set_levels,
+)
 
 
 def test_fixed_exit_plan():
@@ -95,3 +101,37 @@ def test_invalid_config_trailing_without_tp1():
                 "USE_TP1": False,
             }
         )
+
+
+def test_fixed_exit_plan_columnar_contract():
+    df = pd.DataFrame({"close": [1.5], "signal_exit": [None], "custom_stop_loss": [None]})
+    init_entry_columns(df)
+    set_entry_signal(df, [True], direction="short", tag="test")
+    set_levels(
+        df, [True],
+        sl=2.0, tp1=1.0, tp2=0.5,
+        sl_tag="auto", tp1_tag="RR_1", tp2_tag="RR_2",
+    )
+    normalize_entry_columns(df)
+
+    strat = BaseStrategy(
+        df=df,
+        symbol="EURUSD",
+        strategy_config={"USE_TRAILING": False}
+    )
+
+    plan = strat.build_trade_plan(row=df.iloc[-1])
+
+    assert isinstance(plan.exit_plan, FixedExitPlan)
+    assert plan.direction == "short"
+    assert plan.entry_tag == "test"
+    assert plan.exit_plan.tp2 == 0.5
+
+
+def test_no_plan_without_columnar_entry():
+    df = pd.DataFrame({"close": [1.5], "signal_exit": [None], "custom_stop_loss": [None]})
+    init_entry_columns(df)
+
+    strat = BaseStrategy(df=df, symbol="EURUSD")
+
+    assert strat.build_trade_plan(row=df.iloc[-1]) is None
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+# pandas >= 3 always copies on write; 2.x only when opted in
+COPY_ON_WRITE = (
+    int(pd.__version__.split(".")[0]) >= 3
+    or pd.get_option("mode.copy_on_write") is True
+)
+
+
+def cow_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Private copy of df for a consumer that mutates it.
+
+    Under copy-on-write a shallow copy is enough (data is copied
+    lazily, per column, only when written), so read-only inputs
+    such as memory-mapped frames are not duplicated up-front.
+    """
+    return df.copy(deep=not COPY_ON_WRITE)
+
+
+def materialize_frame(df: pd.DataFrame, *, pending: bool = True) -> pd.DataFrame:
+    """
+    df as a plain DataFrame. Lazy feature frames (DataFrame subclasses
+    with materialize(), e.g. MarketStructure's LazyFeatureFrame) get
+    their pending columns computed, or dropped with pending=False.
+    """
+    if not hasattr(type(df), "materialize"):
+        return df
+    return df.materialize() if pending else pd.DataFrame(df)
+
+
+def slice_frame(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    Rows of a time-sorted frame with start <= time <= end (binary search).
+    """
+    times = df["time"]
+    lo = times.searchsorted(start, side="left")
+    hi = times.searchsorted(end, side="right")
+    return df.iloc[lo:hi].reset_index(drop=True)
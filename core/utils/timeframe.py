@@ -1,4 +1,5 @@
 import MetaTrader5 as mt5
+import pandas as pd
 
 MT5_TIMEFRAME_MAP = {
     "M1": mt5.TIMEFRAME_M1,
@@ -24,9 +25,16 @@ def timeframe_to_pandas_freq(timeframe: str) -> str:
         return f"{int(tf[1:])}min"
 
     if tf.startswith("H"):
-        return f"{int(tf[1:])}H"
+        return f"{int(tf[1:])}h"
 
     if tf.startswith("D"):
         return f"{int(tf[1:])}D"
 
     raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+def timeframe_to_timedelta(timeframe: str) -> pd.Timedelta:
+    """
+    Length of one bar (M5 -> 5 minutes).
+    """
+    return pd.Timedelta(timeframe_to_pandas_freq(timeframe))